@@ -4,16 +4,26 @@ CCDK i124q Enhanced Analytics Dashboard
 Professional monitoring for all integrated systems with real-time metrics
 """
 
+import os
+import sys
+
+if __name__ == '__main__' and '--profile-startup' in sys.argv:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'integrations'))
+    from startup_profile import run_profiled
+    sys.exit(run_profiled(__file__))
+
 from flask import Flask, render_template_string, jsonify
 import sqlite3
 import pathlib
 import json
 import subprocess
 from datetime import datetime, timedelta
-import os
 
 app = Flask(__name__)
 
+# Bridge helper modules (thinkchain_cache, ...)
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / 'integrations'))
+
 class EnhancedAnalytics:
     def __init__(self):
         self.app_dir = pathlib.Path('/app')
@@ -121,6 +131,36 @@ class EnhancedAnalytics:
         except Exception as e:
             return {'error': str(e)}
     
+    def get_tool_cache_analytics(self):
+        """Get ThinkChain bridge result cache statistics"""
+        try:
+            # The bridge's own reader and cache location (THINKCHAIN_DIR / THINKCHAIN_BRIDGE_CACHE)
+            from thinkchain_cache import read_cache_stats, RESULT_CACHE_DB
+            stats = read_cache_stats(RESULT_CACHE_DB)
+            stats['status'] = 'active' if RESULT_CACHE_DB.exists() else 'unused'
+            return stats
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def get_service_resources(self, points=120):
+        """Get per-service CPU, memory, fd and thread usage from the launcher's status API"""
+        import urllib.request
+        base = f"http://127.0.0.1:{os.environ.get('CCDK_LAUNCHER_PORT', '4040')}"
+        try:
+            with urllib.request.urlopen(f'{base}/status', timeout=2) as response:
+                services = json.load(response)['services']
+            with urllib.request.urlopen(f'{base}/metrics?points={points}', timeout=2) as response:
+                history = json.load(response)
+        except Exception:
+            return {'status': 'unavailable', 'services': {}, 'history': {}}
+        
+        # One RSS series per service for the chart
+        rss_history = {}
+        for name, series in history.items():
+            t, rss = series['fields'].index('time'), series['fields'].index('rss_mb')
+            rss_history[name] = [{'x': sample[t] * 1000, 'y': sample[rss]} for sample in series['samples']]
+        return {'status': 'active', 'services': services, 'history': rss_history}
+    
     def check_dashboard_health(self):
         """Check health of all dashboard services"""
         dashboards = {
@@ -157,6 +197,8 @@ class EnhancedAnalytics:
             'hive': self.get_hive_analytics(),
             'system': self.get_system_metrics(),
             'usage': self.get_usage_analytics(),
+            'tool_cache': self.get_tool_cache_analytics(),
+            'services': self.get_service_resources(),
             'timestamp': datetime.now().isoformat(),
             'version': 'CCDK i124q',
             'status': 'operational'
@@ -381,6 +423,64 @@ ENHANCED_ANALYTICS_TEMPLATE = """
             </div>
         </div>
 
+        <div class="chart-container">
+            <div class="section-title">
+                <span>🧠</span> ThinkChain Result Cache
+            </div>
+            <div class="dashboard-status">
+                <div class="dashboard-item">
+                    <span>Hit rate</span>
+                    <span>{{ ((data.tool_cache.hit_rate or 0) * 100) | round(1) }}%</span>
+                </div>
+                <div class="dashboard-item">
+                    <span>Hits (memory / disk)</span>
+                    <span>{{ data.tool_cache.memory_hits }} / {{ data.tool_cache.disk_hits }}</span>
+                </div>
+                <div class="dashboard-item">
+                    <span>Misses</span>
+                    <span>{{ data.tool_cache.misses }}</span>
+                </div>
+                <div class="dashboard-item">
+                    <span>Cached results</span>
+                    <span>{{ data.tool_cache.entries }} ({{ ((data.tool_cache.bytes or 0) / 1024) | round(1) }} KB)</span>
+                </div>
+                <div class="dashboard-item">
+                    <span>Evictions</span>
+                    <span>{{ data.tool_cache.evictions }}</span>
+                </div>
+            </div>
+        </div>
+
+        <div class="chart-container">
+            <div class="section-title">
+                <span>🧮</span> Service Resources
+            </div>
+            {% if data.services.status == 'active' %}
+            <div class="dashboard-status">
+                {% for name, service in data.services.services.items() %}
+                <div class="dashboard-item">
+                    <span>{{ name }}</span>
+                    {% if service.resources %}
+                    <span>{{ service.resources.cpu_percent }}% CPU · {{ service.resources.rss_mb }} MB ·
+                          {{ service.resources.fds }} fds · {{ service.resources.threads }} threads</span>
+                    {% else %}
+                    <span class="status-unavailable">{{ service.state }}</span>
+                    {% endif %}
+                </div>
+                {% if service.limit_restarts %}
+                <div class="dashboard-item">
+                    <small>♻️ restarted {{ service.limit_restarts }}x over limits</small>
+                    <small>{{ service.last_limit }}</small>
+                </div>
+                {% endif %}
+                {% endfor %}
+            </div>
+            <canvas id="rssChart" width="400" height="150"></canvas>
+            {% else %}
+            <p>Launcher status API not reachable; start the services with launch-ccdk-i124q.py</p>
+            {% endif %}
+        </div>
+
         <div class="chart-container">
             <div class="section-title">
                 <span>📈</span> System Capabilities Breakdown
@@ -433,6 +533,36 @@ ENHANCED_ANALYTICS_TEMPLATE = """
             }
         });
 
+        // Memory per service over time, to spot a leaking dashboard
+        const rssHistory = {{ data.services.history | tojson }};
+        if (document.getElementById('rssChart')) {
+            const palette = ['#4299e1', '#38a169', '#805ad5', '#f6ad55', '#e53e3e'];
+            new Chart(document.getElementById('rssChart').getContext('2d'), {
+                type: 'line',
+                data: {
+                    datasets: Object.keys(rssHistory).map((name, i) => ({
+                        label: name + ' (MB)',
+                        data: rssHistory[name],
+                        borderColor: palette[i % palette.length],
+                        pointRadius: 0,
+                        fill: false
+                    }))
+                },
+                options: {
+                    responsive: true,
+                    parsing: false,
+                    scales: {
+                        x: {
+                            type: 'linear',
+                            ticks: { color: 'white', callback: value => new Date(value).toLocaleTimeString() }
+                        },
+                        y: { ticks: { color: 'white' } }
+                    },
+                    plugins: { legend: { labels: { color: 'white' } } }
+                }
+            });
+        }
+
         function refreshData() {
             const indicator = document.getElementById('refreshIndicator');
             indicator.style.display = 'block';
@@ -472,6 +602,16 @@ def api_metrics():
     """API endpoint for system metrics only"""
     return jsonify(analytics.get_system_metrics())
 
+@app.route('/api/tool-cache')
+def api_tool_cache():
+    """API endpoint for ThinkChain result cache statistics"""
+    return jsonify(analytics.get_tool_cache_analytics())
+
+@app.route('/api/services')
+def api_services():
+    """API endpoint for per-service resource usage from the launcher"""
+    return jsonify(analytics.get_service_resources())
+
 @app.route('/api/health')
 def api_health():
     """API endpoint for dashboard health check"""
@@ -481,4 +621,6 @@ if __name__ == '__main__':
     print("📊 Starting CCDK i124q Enhanced Analytics Dashboard...")
     print("📈 Available at: http://localhost:5005")
     print("🔍 Monitoring: CCDK + SuperClaude + ThinkChain + Templates")
+    if os.environ.get('CCDK_PROFILE_STARTUP'):
+        print('startup-profile: ready', file=sys.stderr, flush=True)  # --profile-startup reports here
     app.run(host='0.0.0.0', port=5005, debug=True)
\ No newline at end of file
@@ -6,12 +6,97 @@ Complete installer for the ultimate Claude Code enhancement toolkit
 
 import os
 import sys
+
+if __name__ == '__main__' and '--profile-startup' in sys.argv:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'integrations'))
+    from startup_profile import run_profiled
+    sys.exit(run_profiled(__file__))
+
 import subprocess
 import shutil
 import json
-import urllib.request
+import time
+import threading
 from pathlib import Path
-import tempfile
+
+# Completed steps of an unfinished installation, so a re-run resumes (in ~/.claude)
+INSTALL_STATE = '.install-state.json'
+
+PYTHON_PACKAGES = [
+    'flask>=2.0.0',
+    'playwright>=1.0.0',
+    'anthropic>=0.25.0',
+    'requests>=2.25.0',
+    'rich>=13.0.0',
+    'prompt-toolkit>=3.0.0',
+    'beautifulsoup4',
+    'pydantic>=2.0.0',
+    'sseclient-py',
+    'python-dotenv',
+    'validators'
+]
+SUPERCLAUDE_PACKAGE = 'SuperClaude'
+TEMPLATES_PACKAGE = 'claude-code-templates'
+THINKCHAIN_REPO = 'https://github.com/martinbowling/thinkchain.git'
+
+# Offline installs: wheels, npm tarballs and ThinkChain vendored by --build-cache,
+# pinned by sha256 in the cache's lockfile
+CACHE_DIR = Path(os.environ.get('CCDK_INSTALL_CACHE', 'ccdk-cache'))
+CACHE_LOCK = 'ccdk-lock.json'
+
+# Dashboard files deployed into ~/.claude/dashboards (only new or changed files are written)
+DASHBOARD_FILES = [
+    'launch-ccdk-i124q.py',
+    'services.json',
+    'serve-dashboard.py',
+    'unified-dashboard.py',
+    'webui',
+    'dashboard',
+    'integrations'
+]
+
+def normalize_name(name):
+    """Project names compare case-insensitively with runs of -, _ and . equal (PEP 503)"""
+    import re
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+class StepOutput:
+    """
+    sys.stdout while installation steps run concurrently.
+    
+    Lines printed from a step's thread are prefixed with the step's key
+    and written whole, so the output of overlapping steps never mixes
+    within a line. Other threads write straight through.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+    
+    def begin(self, prefix):
+        self.local.prefix = prefix
+        self.local.buffer = ''
+    
+    def end(self):
+        if getattr(self.local, 'buffer', ''):
+            self.write('\n')
+        self.local.prefix = None
+    
+    def write(self, text):
+        prefix = getattr(self.local, 'prefix', None)
+        if prefix is None:
+            with self.lock:
+                return self.stream.write(text)
+        *lines, self.local.buffer = (self.local.buffer + text).split('\n')
+        if lines:
+            with self.lock:
+                self.stream.write(''.join(f"{prefix}{line}\n" if line else '\n' for line in lines))
+                self.stream.flush()
+        return len(text)
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
 
 class CCDKi124qInstaller:
     def __init__(self):
@@ -20,6 +105,12 @@ class CCDKi124qInstaller:
         self.install_dir = Path.cwd()
         self.components_installed = []
         self.errors = []
+        self.force = False  # ignore progress saved by an earlier, failed run
+        self.timings = {}  # step name -> (seconds, outcome)
+        self.state_lock = threading.Lock()
+        self.pip_lock = threading.Lock()  # concurrent pip runs can corrupt site-packages
+        self.offline = False  # install from the cache only, never the network
+        self.cache_dir = CACHE_DIR
         
     def print_banner(self):
         """Display installation banner"""
@@ -103,41 +194,72 @@ class CCDKi124qInstaller:
         """Install all required Python packages"""
         print("🐍 Installing Python dependencies...")
         
-        packages = [
-            'flask>=2.0.0',
-            'playwright>=1.0.0',
-            'anthropic>=0.25.0',
-            'requests>=2.25.0',
-            'rich>=13.0.0',
-            'prompt-toolkit>=3.0.0',
-            'beautifulsoup4',
-            'pydantic>=2.0.0',
-            'sseclient-py',
-            'python-dotenv',
-            'validators'
-        ]
-        
         try:
-            for package in packages:
-                print(f"   Installing {package}...")
-                subprocess.run([sys.executable, '-m', 'pip', 'install', package], 
-                               check=True, capture_output=True)
-            
+            self.pip_install(PYTHON_PACKAGES)
             print("✅ Python dependencies installed")
             return True
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
             self.errors.append(f"Python package installation failed: {e}")
             return False
     
+    def pip_install(self, packages):
+        """pip install ``packages`` in one resolver run; offline, from the cache's locked wheels"""
+        if not self.offline:
+            print(f"   Installing {', '.join(packages)}...")
+            with self.pip_lock:
+                subprocess.run([sys.executable, '-m', 'pip', 'install', *packages],
+                               check=True, capture_output=True)
+            return
+        
+        import tempfile
+        lock = self.load_cache_lock()
+        self.check_cache_platform(lock)
+        locked = {normalize_name(wheel['name']): wheel for wheel in lock['python']}
+        find_links = ['--no-index', '--find-links', str(self.cache_dir / 'wheels')]
+        with self.pip_lock:
+            # Resolve ``packages`` and their dependencies against the cache, then install just those
+            resolved = subprocess.run([sys.executable, '-m', 'pip', 'install', '--dry-run', '--ignore-installed',
+                                       '--quiet', '--report', '-', *find_links, *packages],
+                                      check=True, capture_output=True, text=True)
+            wheels = []
+            for item in json.loads(resolved.stdout)['install']:
+                name, version = item['metadata']['name'], item['metadata']['version']
+                wheel = locked.get(normalize_name(name))
+                if wheel is None or wheel['version'] != version:
+                    raise ValueError(f"{name} {version} is not pinned in {CACHE_LOCK}")
+                wheels.append(wheel)
+            
+            print(f"   Installing {len(wheels)} locked wheels from {self.cache_dir}...")
+            with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as requirements:
+                for wheel in wheels:
+                    requirements.write(f"{wheel['name']}=={wheel['version']} --hash=sha256:{wheel['sha256']}\n")
+            try:
+                subprocess.run([sys.executable, '-m', 'pip', 'install', *find_links,
+                                '--require-hashes', '-r', requirements.name],
+                               check=True, capture_output=True)
+            finally:
+                os.unlink(requirements.name)
+    
+    def check_cache_platform(self, lock):
+        """Wheels are built for one Python version and platform; refuse a cache built for another"""
+        import platform
+        
+        built_python = '.'.join(str(lock.get('python_version', '?')).split('.')[:2])
+        built_platform = f"{lock.get('system', '?')}/{lock.get('machine', '?')}"
+        python = f"{sys.version_info.major}.{sys.version_info.minor}"
+        here = f"{platform.system()}/{platform.machine()}"
+        if (built_python, built_platform) != (python, here):
+            raise ValueError(f"The install cache was built for Python {built_python} on {built_platform}, "
+                             f"not Python {python} on {here}; rebuild it there with --build-cache")
+    
     def install_superclaude_framework(self):
         """Install SuperClaude Framework"""
         print("🎭 Installing SuperClaude Framework...")
         
         try:
-            # Install SuperClaude from PyPI
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'SuperClaude'], 
-                           check=True, capture_output=True)
+            # Install SuperClaude from PyPI (or the offline cache)
+            self.pip_install([SUPERCLAUDE_PACKAGE])
             
             # Copy SuperClaude files to .claude directory
             import SuperClaude
@@ -169,9 +291,16 @@ class CCDKi124qInstaller:
         print("⚡ Installing ThinkChain components...")
         
         try:
-            # Clone ThinkChain repository
+            import tempfile
+            
+            # Clone ThinkChain repository (offline: the copy vendored in the cache)
+            source = THINKCHAIN_REPO
+            if self.offline:
+                source = str(self.cache_dir / 'thinkchain')
+                if not Path(source).exists():
+                    raise ValueError(f"No ThinkChain clone in {self.cache_dir} (build one with --build-cache)")
             with tempfile.TemporaryDirectory() as temp_dir:
-                subprocess.run(['git', 'clone', 'https://github.com/martinbowling/thinkchain.git', temp_dir], 
+                subprocess.run(['git', 'clone', source, temp_dir], 
                                check=True, capture_output=True)
                 
                 # Copy tools
@@ -200,14 +329,21 @@ class CCDKi124qInstaller:
         print("📊 Installing Templates CLI...")
         
         try:
-            subprocess.run(['npm', 'install', '-g', 'claude-code-templates@latest'], 
-                           check=True, capture_output=True)
+            if self.offline:
+                # The locked tarball; its dependencies come from the vendored npm cache
+                lock = self.load_cache_lock()
+                subprocess.run(['npm', 'install', '-g', '--offline', '--cache', str(self.cache_dir / 'npm' / 'cache'),
+                                str(self.cache_dir / 'npm' / lock['npm']['file'])],
+                               check=True, capture_output=True)
+            else:
+                subprocess.run(['npm', 'install', '-g', f'{TEMPLATES_PACKAGE}@latest'], 
+                               check=True, capture_output=True)
             
             self.components_installed.append('Templates CLI')
             print("✅ Templates CLI installed")
             return True
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
             self.errors.append(f"Templates CLI installation failed: {e}")
             return False
     
@@ -317,9 +453,16 @@ This represents the evolution of CCDK into the most comprehensive Claude Code en
         print("🌐 Installing enhanced dashboard files...")
         
         try:
-            # Note: In a real installation, these would be included in the package
-            # For now, we'll create basic versions
+            if all((self.install_dir / path).exists() for path in DASHBOARD_FILES):
+                sys.path.insert(0, str(Path(__file__).resolve().parent / 'integrations'))
+                from file_deploy import deploy, format_stats
+                
+                stats = deploy(self.install_dir, self.claude_dir / 'dashboards', DASHBOARD_FILES)
+                self.components_installed.append('Dashboards')
+                print(f"✅ Dashboard files deployed to {self.claude_dir / 'dashboards'}: {format_stats(stats)}")
+                return True
             
+            # Installing without the source tree: say where the files come from
             dashboard_info = """
 # Dashboard Files Installation
 The enhanced dashboard files (unified-dashboard.py, enhanced WebUI, etc.) 
@@ -343,6 +486,110 @@ These provide the complete dashboard ecosystem for CCDK i124q.
             self.errors.append(f"Dashboard installation failed: {e}")
             return False
     
+    def build_cache(self):
+        """
+        Vendor everything an install downloads into the cache directory.
+        
+        Wheels for the Python packages and their dependencies, the
+        Templates CLI tarball plus an npm cache holding its dependencies,
+        and a clone of ThinkChain. Every file is pinned by sha256 in the
+        lockfile that --offline installs verify against. Wheels are
+        platform-specific: build the cache on the Python version and
+        platform of the machines that will install from it.
+        """
+        import tempfile
+        import platform
+        
+        cache = self.cache_dir
+        wheels = cache / 'wheels'
+        npm = cache / 'npm'
+        print(f"📦 Building offline install cache in {cache}...")
+        try:
+            for path in (wheels, npm, cache / 'thinkchain'):
+                if path.exists():
+                    shutil.rmtree(path)
+            wheels.mkdir(parents=True)
+            npm.mkdir(parents=True)
+            
+            print("   Building wheels...")
+            subprocess.run([sys.executable, '-m', 'pip', 'wheel', '--wheel-dir', str(wheels),
+                            *PYTHON_PACKAGES, SUPERCLAUDE_PACKAGE],
+                           check=True, capture_output=True)
+            
+            print("   Packing the Templates CLI...")
+            packed = subprocess.run(['npm', 'pack', f'{TEMPLATES_PACKAGE}@latest', '--json',
+                                     '--pack-destination', str(npm)],
+                                    check=True, capture_output=True, text=True)
+            tarball = json.loads(packed.stdout)[0]
+            # Installing once fills the npm cache with every dependency tarball
+            with tempfile.TemporaryDirectory() as prefix:
+                subprocess.run(['npm', 'install', '-g', '--prefix', prefix, '--cache', str(npm / 'cache'),
+                                str(npm / tarball['filename'])],
+                               check=True, capture_output=True)
+            
+            print("   Cloning ThinkChain...")
+            subprocess.run(['git', 'clone', '--depth', '1', THINKCHAIN_REPO, str(cache / 'thinkchain')],
+                           check=True, capture_output=True)
+            commit = subprocess.run(['git', '-C', str(cache / 'thinkchain'), 'rev-parse', 'HEAD'],
+                                    check=True, capture_output=True, text=True).stdout.strip()
+        except (subprocess.CalledProcessError, OSError, ValueError, LookupError) as e:
+            stderr = getattr(e, 'stderr', None)
+            detail = stderr.decode(errors='replace') if isinstance(stderr, bytes) else (stderr or '')
+            self.errors.append(f"Cache build failed: {e} {detail.strip()[-500:]}".strip())
+            print(f"❌ Cache build failed: {e}")
+            return False
+        
+        lock = self.write_cache_lock({
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'system': platform.system(),
+            'machine': platform.machine(),
+            'npm': {'name': TEMPLATES_PACKAGE, 'version': tarball['version'], 'file': tarball['filename']},
+            'thinkchain': {'repository': THINKCHAIN_REPO, 'commit': commit}
+        })
+        size = sum(f.stat().st_size for f in cache.rglob('*') if f.is_file())
+        print(f"✅ Cache built: {len(lock['python'])} wheels, {TEMPLATES_PACKAGE} {tarball['version']}, "
+              f"ThinkChain {commit[:12]} ({size / 2**20:.1f} MB)")
+        print(f"   Install from it with: python3 install-ccdk-i124q.py --offline --cache-dir {cache}")
+        return True
+    
+    def write_cache_lock(self, lock):
+        """Pin every wheel and the npm tarball by sha256 in the cache's lockfile"""
+        import hashlib
+        
+        def sha256(path):
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            return digest.hexdigest()
+        
+        lock = dict(lock, created=time.strftime('%Y-%m-%dT%H:%M:%S'), python=[])
+        for wheel in sorted((self.cache_dir / 'wheels').glob('*.whl')):
+            # name-version(-build)?-python-abi-platform.whl
+            name, version = wheel.name.split('-')[:2]
+            lock['python'].append({'name': name, 'version': version, 'file': wheel.name, 'sha256': sha256(wheel)})
+        if lock.get('npm'):
+            lock['npm']['sha256'] = sha256(self.cache_dir / 'npm' / lock['npm']['file'])
+        with open(self.cache_dir / CACHE_LOCK, 'w') as f:
+            json.dump(lock, f, indent=2)
+        return lock
+    
+    def load_cache_lock(self):
+        """The cache's lockfile, once the npm tarball matches it (pip checks the wheels itself)"""
+        import hashlib
+        
+        path = self.cache_dir / CACHE_LOCK
+        if not path.exists():
+            raise ValueError(f"No install cache at {self.cache_dir} (build one with --build-cache)")
+        with open(path) as f:
+            lock = json.load(f)
+        if lock.get('npm'):
+            tarball = self.cache_dir / 'npm' / lock['npm']['file']
+            if not tarball.exists() or hashlib.sha256(tarball.read_bytes()).hexdigest() != lock['npm']['sha256']:
+                raise ValueError(f"{tarball.name} is missing or does not match {CACHE_LOCK}")
+        return lock
+    
     def run_post_install_checks(self):
         """Run post-installation verification"""
         print("🔍 Running post-installation checks...")
@@ -454,33 +701,152 @@ create an issue in the project repository.
         
         print(summary)
     
+    def installation_steps(self):
+        """
+        The installation as a DAG of (key, name, function, dependencies).
+        
+        Steps with no dependency path between them run concurrently, so
+        the pip, npm and git downloads overlap. The two pip steps are
+        independent; pip_install runs one pip at a time.
+        """
+        return [
+            ('prerequisites', "Prerequisites check", self.check_prerequisites, []),
+            ('directories', "Directory structure", self.create_directory_structure, ['prerequisites']),
+            ('python', "Python dependencies", self.install_python_dependencies, ['prerequisites']),
+            ('templates', "Templates CLI", self.install_templates_cli, ['prerequisites']),
+            ('superclaude', "SuperClaude Framework", self.install_superclaude_framework, ['directories']),
+            ('thinkchain', "ThinkChain components", self.install_thinkchain_tools, ['directories']),
+            ('configuration', "Unified configuration", self.create_unified_configuration, ['directories']),
+            ('dashboards', "Dashboard files", self.install_dashboard_files, ['directories'])
+        ]
+    
+    def install_options(self):
+        """The options that change what a step installs; saved progress only resumes under the same ones"""
+        return {
+            'offline': self.offline,
+            'cache_dir': str(self.cache_dir.resolve()) if self.offline else None
+        }
+    
+    def load_install_state(self):
+        """Steps completed by an earlier run that did not finish, if it ran with the same options"""
+        options = self.install_options()
+        try:
+            with open(self.claude_dir / INSTALL_STATE) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {'options': options, 'completed': {}}
+        if state.get('options') != options:
+            if state.get('completed'):
+                print("🔁 Saved progress was made with other options (--offline/--cache-dir); starting over")
+            return {'options': options, 'completed': {}}
+        return state
+    
+    def mark_step_completed(self, state, key, seconds):
+        with self.state_lock:
+            state['completed'][key] = {'completed_at': time.time(), 'seconds': round(seconds, 2)}
+            self.claude_dir.mkdir(parents=True, exist_ok=True)
+            temp = self.claude_dir / (INSTALL_STATE + '.tmp')
+            with open(temp, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(temp, self.claude_dir / INSTALL_STATE)
+    
+    def run_step(self, name, step_function):
+        """Run one step; returns (succeeded, seconds)"""
+        print(f"\n🔄 {name}...")
+        started = time.perf_counter()
+        try:
+            ok = step_function()
+        except Exception as e:
+            self.errors.append(f"{name} failed: {e}")
+            ok = False
+        seconds = time.perf_counter() - started
+        print(f"✅ {name} completed ({seconds:.1f}s)" if ok else f"❌ {name} failed ({seconds:.1f}s)")
+        return ok, seconds
+    
+    def run_steps(self, steps):
+        """Run the step DAG; steps start as soon as their dependencies succeed"""
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+        
+        state = {'options': self.install_options(), 'completed': {}} if self.force else self.load_install_state()
+        outcomes = {}  # key -> 'done', 'resumed', 'failed' or 'skipped'
+        pending = {key: (name, function, dependencies) for key, name, function, dependencies in steps}
+        names = {key: name for key, (name, _, _) in pending.items()}
+        running = {}  # future -> (key, name)
+        output = sys.stdout = StepOutput(sys.stdout)
+        
+        def run_prefixed(key, name, function):
+            output.begin(f"[{key}] ")
+            try:
+                return self.run_step(name, function)
+            finally:
+                output.end()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+                while pending or running:
+                    progressed = False
+                    for key, (name, function, dependencies) in list(pending.items()):
+                        blocked = [names[d] for d in dependencies if outcomes.get(d) in ('failed', 'skipped')]
+                        if blocked:
+                            del pending[key]
+                            outcomes[key] = 'skipped'
+                            self.timings[name] = (0.0, 'skipped')
+                            self.errors.append(f"{name} skipped: {', '.join(blocked)} did not complete")
+                            print(f"\n⏭️  {name} skipped ({', '.join(blocked)} did not complete)")
+                            progressed = True
+                        elif all(outcomes.get(d) in ('done', 'resumed') for d in dependencies):
+                            del pending[key]
+                            progressed = True
+                            if key in state['completed']:
+                                outcomes[key] = 'resumed'
+                                self.timings[name] = (0.0, 'resumed')
+                                self.components_installed.append(f"{name} (from the previous run)")
+                                print(f"\n⏩ {name} already completed by the previous run")
+                                continue
+                            running[executor.submit(run_prefixed, key, name, function)] = (key, name)
+                    if progressed and not running:
+                        continue  # resumed or skipped steps may have unblocked others
+                    if not running:
+                        break
+                    
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key, name = running.pop(future)
+                        ok, seconds = future.result()
+                        outcomes[key] = 'done' if ok else 'failed'
+                        self.timings[name] = (seconds, outcomes[key])
+                        if ok:
+                            self.mark_step_completed(state, key, seconds)
+        finally:
+            sys.stdout = output.stream
+        
+        return all(outcome in ('done', 'resumed') for outcome in outcomes.values())
+    
+    def display_step_timings(self, wall_seconds):
+        """Per-step time, slowest first"""
+        busy = sum(seconds for seconds, _ in self.timings.values())
+        print(f"\n⏱️  Step timings ({wall_seconds:.1f}s elapsed, {busy:.1f}s of step time):")
+        for name, (seconds, outcome) in sorted(self.timings.items(), key=lambda item: -item[1][0]):
+            print(f"   {name:<25} {seconds:7.1f}s  {outcome}")
+    
     def run_installation(self):
         """Run the complete installation process"""
         self.print_banner()
         
-        success = True
-        
-        # Installation steps
-        steps = [
-            ("Prerequisites check", self.check_prerequisites),
-            ("Directory structure", self.create_directory_structure),
-            ("Python dependencies", self.install_python_dependencies),
-            ("SuperClaude Framework", self.install_superclaude_framework),
-            ("ThinkChain components", self.install_thinkchain_tools),
-            ("Templates CLI", self.install_templates_cli),
-            ("Unified configuration", self.create_unified_configuration),
-            ("Dashboard files", self.install_dashboard_files),
-            ("Post-install checks", self.run_post_install_checks)
-        ]
+        started = time.perf_counter()
+        success = self.run_steps(self.installation_steps())
         
-        for step_name, step_function in steps:
-            print(f"\n🔄 {step_name}...")
-            if not step_function():
-                print(f"❌ {step_name} failed")
-                success = False
-                # Continue with other steps even if one fails
-            else:
-                print(f"✅ {step_name} completed")
+        # Post-install checks always run, after everything else
+        ok, seconds = self.run_step("Post-install checks", self.run_post_install_checks)
+        self.timings["Post-install checks"] = (seconds, 'done' if ok else 'failed')
+        success = success and ok
+        
+        self.display_step_timings(time.perf_counter() - started)
+        if success:
+            (self.claude_dir / INSTALL_STATE).unlink(missing_ok=True)
+        else:
+            print(f"\n💾 Progress saved in {self.claude_dir / INSTALL_STATE}; "
+                  "re-run to resume (--force to start over)")
         
         self.display_completion_summary(success)
         return success
@@ -499,16 +865,36 @@ Usage: python install-ccdk-i124q.py [options]
 Options:
   --help, -h    Show this help message
   --verbose     Enable verbose output
-  --force       Force installation even if components exist
+  --force       Redo every step, ignoring progress saved by a failed run
+  --build-cache Download wheels, npm tarballs and ThinkChain into the
+                install cache and pin them in its lockfile, then exit
+  --offline     Install only from the install cache (no network)
+  --cache-dir PATH
+                Install cache location (default ./ccdk-cache,
+                or CCDK_INSTALL_CACHE)
+  --profile-startup
+                Report where start-up time goes (-X importtime),
+                e.g. --profile-startup --help
 
 This installer will set up the complete CCDK i124q system with:
 - CCDK Foundation (3-tier docs, hooks, Task Master AI)
 - SuperClaude Framework (16 commands, 11 AI personas)
 - ThinkChain Engine (real-time streaming, tool discovery)
 - Templates Analytics (professional dashboards)
+
+Independent steps run concurrently. If a step fails, re-running the
+installer resumes after the steps that already completed.
 """)
         return
     
+    installer.force = '--force' in sys.argv
+    installer.offline = '--offline' in sys.argv
+    if '--cache-dir' in sys.argv[:-1]:
+        installer.cache_dir = Path(sys.argv[sys.argv.index('--cache-dir') + 1])
+    
+    if '--build-cache' in sys.argv:
+        sys.exit(0 if installer.build_cache() else 1)
+    
     try:
         success = installer.run_installation()
         sys.exit(0 if success else 1)
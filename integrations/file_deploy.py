@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Incremental File Deployment for CCDK i124q
+==========================================
+
+Deploys a set of files from a source tree into a target directory,
+touching only what changed. The target keeps a manifest of what was
+deployed (``.ccdk-manifest.json``: sha256, size and mtime per file), so
+a re-run:
+
+- hashes a source file only when its size or mtime changed since the
+  last deploy,
+- skips files whose content and deployed copy are unchanged,
+- replaces changed files atomically (hardlink or copy to a temporary
+  name, then rename), so a running dashboard never reads half a file,
+- removes files it deployed earlier that are no longer in the source.
+
+Files in the target that it did not deploy are never touched.
+
+    from file_deploy import deploy
+    stats = deploy(source_dir, target_dir, ["unified-dashboard.py", "webui"])
+
+It can also be run from a shell:
+
+    python3 integrations/file_deploy.py SOURCE TARGET unified-dashboard.py webui dashboard
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import sys
+import json
+import time
+import errno
+import shutil
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Any, Iterable
+
+MANIFEST_NAME = ".ccdk-manifest.json"
+EXCLUDED_DIRS = {"__pycache__", ".git", ".pytest_cache"}
+EXCLUDED_SUFFIXES = {".pyc", ".pyo", ".tmp"}
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_files(source_dir: Path, paths: Iterable[str]) -> List[str]:
+    """Relative paths of the files under ``paths`` (files or directories), caches excluded"""
+    found = []
+    for entry in paths:
+        path = source_dir / entry
+        if path.is_file():
+            found.append(Path(entry).as_posix())
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+            for name in sorted(files):
+                if Path(name).suffix not in EXCLUDED_SUFFIXES:
+                    found.append((Path(root) / name).relative_to(source_dir).as_posix())
+    return found
+
+
+def load_manifest(target_dir: Path) -> Dict[str, Any]:
+    try:
+        with open(target_dir / MANIFEST_NAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+
+
+def write_manifest(target_dir: Path, manifest: Dict[str, Any]):
+    temp = target_dir / (MANIFEST_NAME + ".tmp")
+    with open(temp, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(temp, target_dir / MANIFEST_NAME)
+
+
+def place(source: Path, destination: Path, link: bool) -> str:
+    """Put ``source`` at ``destination`` atomically; returns 'linked' or 'copied'"""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if link and destination.exists() and os.path.samefile(source, destination):
+        return "linked"  # already a link to the source, which was edited in place
+    temp = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    if temp.exists():
+        temp.unlink()
+    how = "copied"
+    if link:
+        try:
+            os.link(source, temp)
+            how = "linked"
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EACCES):
+                raise
+    if how == "copied":
+        shutil.copy2(source, temp)
+    os.replace(temp, destination)
+    return how
+
+
+def deploy(source_dir: Path, target_dir: Path, paths: Iterable[str], link: bool = True) -> Dict[str, Any]:
+    """
+    Make ``target_dir`` hold the current version of ``paths`` from ``source_dir``.
+
+    Returns counts of files linked, copied, unchanged and removed, plus
+    the time taken. Hardlinks are used when source and target share a
+    filesystem and ``link`` is set; deployed files must then be updated
+    by replacement (as this function does), never edited in place.
+    """
+    started = time.perf_counter()
+    source_dir, target_dir = Path(source_dir), Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(target_dir)["files"]
+    deployed = {}
+    stats = {"linked": 0, "copied": 0, "unchanged": 0, "removed": 0}
+
+    for relative in source_files(source_dir, paths):
+        source = source_dir / relative
+        destination = target_dir / relative
+        source_stat = source.stat()
+        record = previous.get(relative, {})
+
+        # Hash the source only if it changed since it was last deployed
+        if record.get("source_size") == source_stat.st_size and record.get("source_mtime") == source_stat.st_mtime_ns:
+            digest = record["sha256"]
+        else:
+            digest = file_sha256(source)
+
+        try:
+            target_stat = destination.stat()
+        except OSError:
+            target_stat = None
+        intact = (target_stat is not None and record.get("sha256") == digest
+                  and record.get("size") == target_stat.st_size and record.get("mtime") == target_stat.st_mtime_ns)
+        if intact:
+            stats["unchanged"] += 1
+        else:
+            stats[place(source, destination, link)] += 1
+            target_stat = destination.stat()
+        deployed[relative] = {
+            "sha256": digest,
+            "size": target_stat.st_size,
+            "mtime": target_stat.st_mtime_ns,
+            "source_size": source_stat.st_size,
+            "source_mtime": source_stat.st_mtime_ns,
+        }
+
+    # Only files this function deployed before are candidates for removal
+    for relative in sorted(set(previous) - set(deployed)):
+        stale = target_dir / relative
+        if stale.is_file():
+            stale.unlink()
+            stats["removed"] += 1
+        parent = stale.parent
+        while parent != target_dir and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+    if deployed != previous:
+        write_manifest(target_dir, {"files": deployed, "source": str(source_dir.resolve())})
+    stats["seconds"] = round(time.perf_counter() - started, 4)
+    return stats
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    changed = stats["linked"] + stats["copied"]
+    return (f"{changed} updated ({stats['linked']} linked, {stats['copied']} copied), "
+            f"{stats['unchanged']} unchanged, {stats['removed']} removed in {stats['seconds'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Deploy only new or changed files, removing stale ones")
+    parser.add_argument("source", help="Source directory")
+    parser.add_argument("target", help="Target directory")
+    parser.add_argument("paths", nargs="+", help="Files or directories, relative to the source")
+    parser.add_argument("--copy", action="store_true", help="Always copy, never hardlink")
+    args = parser.parse_args()
+
+    try:
+        result = deploy(Path(args.source), Path(args.target), args.paths, link=not args.copy)
+    except OSError as e:
+        print(f"❌ Deploy failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ {args.target}: {format_stats(result)}")
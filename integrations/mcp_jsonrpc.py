@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Pipelined MCP JSON-RPC Client for CCDK i124q
+============================================
+
+Asyncio JSON-RPC 2.0 client for MCP servers speaking the stdio transport
+(one JSON message per line on stdin/stdout).
+
+Many requests can be in flight on one server connection at a time;
+responses are matched to requests by id, so a slow call does not hold up
+the ones behind it. Backpressure comes from a bounded outgoing queue and
+a cap on in-flight requests. Every request has its own timeout, and a
+request that times out or whose caller is cancelled is withdrawn and
+announced to the server with ``notifications/cancelled``.
+
+    client = McpStdioClient("npx", ["-y", "@modelcontextprotocol/server-memory"])
+    await client.start()
+    await client.initialize()
+    tools = await client.request("tools/list", timeout=10)
+    await client.close()
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import json
+import asyncio
+import itertools
+from collections import deque
+from typing import Dict, List, Any, Optional
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+DEFAULT_CLIENT_INFO = {"name": "ccdk-i124q", "version": "1.0.0"}
+
+DEFAULT_MAX_IN_FLIGHT = 256
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_TIMEOUT = 60.0
+STREAM_LIMIT = 16 * 1024 * 1024  # max size of one JSON-RPC line
+
+
+class JsonRpcError(Exception):
+    """Error response returned by the server"""
+
+    def __init__(self, error: Dict[str, Any]):
+        super().__init__(error.get("message", "JSON-RPC error"))
+        self.code = error.get("code")
+        self.data = error.get("data")
+
+
+class McpStdioClient:
+    """One MCP server process and a pipelined JSON-RPC session over its stdio"""
+
+    def __init__(self, command: str, args: Optional[List[str]] = None, env: Optional[Dict[str, str]] = None,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.command = command
+        self.args = list(args or [])
+        self.env = env
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.ids = itertools.count(1)
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size
+        self.in_flight: Optional[asyncio.Semaphore] = None
+        self.outgoing: Optional[asyncio.Queue] = None
+        self.tasks: List[asyncio.Task] = []
+        self.stderr_tail = deque(maxlen=50)
+        self.server_info: Optional[Dict[str, Any]] = None
+        self.closed_error: Optional[Exception] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        """Spawn the server and start the reader/writer pumps"""
+        env = os.environ.copy()
+        env.update(self.env or {})
+        self.process = await asyncio.create_subprocess_exec(
+            self.command,
+            *self.args,
+            env=env,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT
+        )
+        self.in_flight = asyncio.Semaphore(self.max_in_flight)
+        self.outgoing = asyncio.Queue(maxsize=self.queue_size)
+        self.closed_error = None
+        self.tasks = [
+            asyncio.create_task(self._write_loop()),
+            asyncio.create_task(self._read_loop()),
+            asyncio.create_task(self._drain_stderr()),
+        ]
+
+    async def initialize(self, client_info: Optional[Dict[str, Any]] = None,
+                         timeout: Optional[float] = 30.0) -> Dict[str, Any]:
+        """MCP handshake: ``initialize`` followed by ``notifications/initialized``"""
+        result = await self.request("initialize", {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": client_info or DEFAULT_CLIENT_INFO,
+        }, timeout=timeout)
+        self.server_info = result
+        await self.notify("notifications/initialized")
+        return result
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                      timeout: Optional[float] = DEFAULT_TIMEOUT) -> Any:
+        """Send a request and return its ``result``; raises JsonRpcError on an error response"""
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        response = await self.send_request(message, timeout)
+        if "error" in response:
+            raise JsonRpcError(response["error"])
+        return response.get("result")
+
+    async def send_request(self, message: Dict[str, Any], timeout: Optional[float] = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+        """
+        Send a raw JSON-RPC request (its ``id`` is replaced) and return the raw response.
+
+        Raises asyncio.TimeoutError on timeout and ConnectionError when the
+        server exits; in both cases, and on cancellation, the request is
+        withdrawn and the server is told with ``notifications/cancelled``.
+        """
+        if self.closed_error is not None:
+            raise self.closed_error
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        async with self.in_flight:
+            self.pending[request_id] = future
+            try:
+                await self.outgoing.put(dict(message, id=request_id))
+                return await asyncio.wait_for(future, timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._cancel_on_server(request_id, "timeout or caller cancelled")
+                raise
+            finally:
+                self.pending.pop(request_id, None)
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """Send a notification (no response expected)"""
+        if self.closed_error is not None:
+            raise self.closed_error
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self.outgoing.put(message)
+
+    def _cancel_on_server(self, request_id: int, reason: str):
+        if self.closed_error is None and not self.outgoing.full():
+            self.outgoing.put_nowait({
+                "jsonrpc": "2.0",
+                "method": "notifications/cancelled",
+                "params": {"requestId": request_id, "reason": reason},
+            })
+
+    async def _write_loop(self):
+        """Single writer: batch everything queued into one write before draining"""
+        try:
+            while True:
+                messages = [await self.outgoing.get()]
+                while not self.outgoing.empty():
+                    messages.append(self.outgoing.get_nowait())
+                self.process.stdin.write(b"".join(
+                    (json.dumps(m, separators=(",", ":")) + "\n").encode("utf-8") for m in messages
+                ))
+                await self.process.stdin.drain()
+        except (ConnectionError, BrokenPipeError):
+            self._fail_pending(ConnectionError("MCP server closed its stdin"))
+
+    async def _read_loop(self):
+        """Route responses by id; answer server-initiated requests"""
+        try:
+            while True:
+                try:
+                    line = await self.process.stdout.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    continue  # oversized line, drop it
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(message, dict):
+                    continue  # valid JSON, but not a JSON-RPC message
+                if "method" in message:
+                    if "id" in message:
+                        if message["method"] == "ping":
+                            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+                        else:
+                            reply = {"jsonrpc": "2.0", "id": message["id"],
+                                     "error": {"code": -32601, "message": "Method not found"}}
+                        if not self.outgoing.full():
+                            self.outgoing.put_nowait(reply)
+                    continue
+                message_id = message.get("id")
+                future = self.pending.get(message_id) if isinstance(message_id, int) else None
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except Exception as e:
+            # Nothing will route responses any more: fail callers now instead of at their timeouts
+            self._fail_pending(ConnectionError(f"MCP response reader failed: {e!r}"))
+            return
+        code = await self.process.wait()
+        self._fail_pending(ConnectionError(f"MCP server exited (exit code {code})"))
+
+    async def _drain_stderr(self):
+        """Keep the stderr pipe empty so the server never blocks on it"""
+        while True:
+            line = await self.process.stderr.readline()
+            if not line:
+                return
+            self.stderr_tail.append(line.decode("utf-8", errors="replace").rstrip())
+
+    def _fail_pending(self, error: Exception):
+        self.closed_error = error
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def wait(self) -> int:
+        """Wait for the server process to exit and return its exit code"""
+        return await self.process.wait()
+
+    async def close(self, timeout: float = 5.0):
+        """Terminate the server and stop the pumps"""
+        if self.running:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        self._fail_pending(ConnectionError("MCP client closed"))
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+MCP Server Supervisor for CCDK i124q
+====================================
+
+Long-running daemon that keeps the MCP servers configured in ThinkChain's
+``mcp_config.json`` warm and shares them between callers.
+
+- Servers are started on their first request, socket-activation style,
+  and stopped again after an idle TTL; a cap on running servers evicts
+  the least recently used idle one (``"maxRunningServers": 0`` means no
+  cap). Per server in ``mcp_config.json``:
+
+      "activation": "lazy" | "eager",   # eager: start with the supervisor
+      "idle_ttl": 300                    # seconds idle before stopping, 0 = never
+
+- While running, a server is initialized once (the MCP ``initialize``
+  handshake result is cached and replayed to clients) and restarted with
+  exponential backoff whenever it exits.
+- JSON-RPC requests from many clients are pipelined over the server's
+  stdio pipes by ``mcp_jsonrpc.McpStdioClient``: request ids are rewritten
+  to supervisor-unique ids and the responses are routed back to the
+  caller that sent them.
+- Clients talk to the supervisor over a local Unix socket using
+  newline-delimited JSON, so the bridge and hooks skip server startup.
+
+Usage:
+    python3 integrations/mcp_supervisor.py start      # detach into the background
+    python3 integrations/mcp_supervisor.py serve      # run in the foreground
+    python3 integrations/mcp_supervisor.py status
+    python3 integrations/mcp_supervisor.py call --server sqlite --method tools/list
+    python3 integrations/mcp_supervisor.py stop
+
+Unix sockets are required, so the supervisor is not available on Windows.
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import sys
+import json
+import time
+import errno
+import socket
+import asyncio
+import itertools
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from mcp_jsonrpc import McpStdioClient
+
+# Same defaults as thinkchain-bridge.py
+THINKCHAIN_DIR = Path(os.environ.get("THINKCHAIN_DIR", "C:/Users/wtyle/thinkchain"))
+BRIDGE_CACHE_DIR = Path(os.environ.get("THINKCHAIN_BRIDGE_CACHE", THINKCHAIN_DIR / ".bridge_cache"))
+SUPERVISOR_SOCKET = Path(os.environ.get("MCP_SUPERVISOR_SOCKET", BRIDGE_CACHE_DIR / "mcp-supervisor.sock"))
+SUPERVISOR_LOG = BRIDGE_CACHE_DIR / "mcp-supervisor.log"
+
+CLIENT_INFO = {"name": "ccdk-i124q-mcp-supervisor", "version": "1.0.0"}
+
+INITIAL_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+STABLE_UPTIME = 30.0  # a server up this long resets its backoff
+HANDSHAKE_TIMEOUT = 30.0
+DEFAULT_REQUEST_TIMEOUT = 60.0
+STREAM_LIMIT = 16 * 1024 * 1024  # max size of one JSON-RPC line
+
+# Lazy activation: per-server "idle_ttl" overrides the default, and
+# "maxRunningServers" in mcp_config.json (or MCP_MAX_RUNNING) caps running servers
+DEFAULT_IDLE_TTL = 300.0
+DEFAULT_MAX_RUNNING = 4
+REAP_INTERVAL = 5.0
+
+
+def load_mcp_config(config_path: Path) -> Dict[str, Any]:
+    """Parsed mcp_config.json, or an empty config when it does not exist"""
+    if not config_path.exists():
+        return {}
+    with open(config_path) as f:
+        return json.load(f)
+
+
+def load_mcp_servers(config_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Enabled servers from an mcp_config.json"""
+    config = load_mcp_config(config_path)
+    return {name: cfg for name, cfg in config.get("mcpServers", {}).items() if cfg.get("enabled", False)}
+
+
+def jsonrpc_error(request_id: Any, message: str, code: int = -32000) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class ManagedServer:
+    """One supervised MCP server process and its pipelined JSON-RPC client"""
+
+    def __init__(self, name: str, config: Dict[str, Any]):
+        self.name = name
+        self.config = config
+        self.eager = config.get("activation", "lazy") == "eager"
+        self.idle_ttl = float(config.get("idle_ttl", 0 if self.eager else DEFAULT_IDLE_TTL))
+        self.client: Optional[McpStdioClient] = None
+        self.task: Optional[asyncio.Task] = None
+        self.ready = asyncio.Event()
+        self.init_result: Optional[Dict[str, Any]] = None
+        self.backoff = INITIAL_BACKOFF
+        self.restarts = 0
+        self.started_at: Optional[float] = None
+        self.last_exit: Optional[str] = None
+        self.last_used = 0.0
+        self.in_flight = 0
+        self.activations = 0
+        self.deactivations: Dict[str, int] = {"idle": 0, "evicted": 0}
+        self.requests_served = 0
+        self.stopping = False
+
+    @property
+    def active(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def activate(self):
+        """Start supervising the server process (no-op when already active)"""
+        if not self.active:
+            self.stopping = False
+            self.activations += 1
+            self.last_used = time.monotonic()
+            self.task = asyncio.create_task(self.supervise())
+
+    def begin_deactivate(self, reason: str) -> Optional[tuple]:
+        """Stop the server at once (see ``begin_stop``); the next request activates it again"""
+        if not self.active:
+            return None
+        self.deactivations[reason] = self.deactivations.get(reason, 0) + 1
+        print(f"💤 MCP server {self.name} stopped ({reason})")
+        return self.begin_stop()
+
+    async def supervise(self):
+        """Start the server and restart it with exponential backoff until stopped"""
+        while not self.stopping:
+            started = time.monotonic()
+            try:
+                await self._start()
+                code = await self.client.wait()
+                self.last_exit = f"exit code {code}"
+            except Exception as e:
+                self.last_exit = f"start failed: {e}"
+            self.ready.clear()
+            self.started_at = None
+            if self.client is not None:
+                await self.client.close()
+            if self.stopping:
+                break
+            if time.monotonic() - started >= STABLE_UPTIME:
+                self.backoff = INITIAL_BACKOFF
+            print(f"⚠️  MCP server {self.name} stopped ({self.last_exit}); restarting in {self.backoff:.0f}s")
+            await asyncio.sleep(self.backoff)
+            self.backoff = min(self.backoff * 2, MAX_BACKOFF)
+            self.restarts += 1
+
+    async def _start(self):
+        self.client = McpStdioClient(
+            self.config.get("command", ""),
+            self.config.get("args", []),
+            self.config.get("env", {})
+        )
+        await self.client.start()
+        # MCP handshake, done once per process and replayed to every client
+        self.init_result = await self.client.initialize(CLIENT_INFO, HANDSHAKE_TIMEOUT)
+        self.started_at = time.monotonic()
+        self.ready.set()
+        print(f"✅ MCP server {self.name} ready (pid {self.client.pid})")
+
+    async def request(self, message: Dict[str, Any], timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """Forward one client JSON-RPC message; returns the response with the client's id restored"""
+        client_id = message.get("id")
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return jsonrpc_error(client_id, f"MCP server '{self.name}' is not ready")
+
+        method = message.get("method")
+        if method == "initialize":
+            return {"jsonrpc": "2.0", "id": client_id, "result": self.init_result}
+        if client_id is None:
+            # Notification: the supervisor already completed the handshake for everyone
+            if method != "notifications/initialized":
+                await self.client.notify(method, message.get("params"))
+            return None
+
+        try:
+            response = await self.client.send_request(message, timeout)
+        except asyncio.TimeoutError:
+            return jsonrpc_error(client_id, f"MCP request '{method}' timed out after {timeout}s")
+        except ConnectionError as e:
+            return jsonrpc_error(client_id, f"MCP server '{self.name}': {e}")
+        self.requests_served += 1
+        return dict(response, id=client_id)
+
+    def begin_stop(self) -> tuple:
+        """
+        Cancel supervision without waiting; returns the (task, client) to pass to ``finish_stop``.
+
+        The server counts as stopped from here on, so the caller can drop
+        its locks before the (up to 5s) wait for the process to exit.
+        """
+        self.stopping = True
+        task, client = self.task, self.client
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()  # may be sleeping in its restart backoff
+        self.task = None
+        self.ready.clear()
+        self.started_at = None
+        return task, client
+
+    @staticmethod
+    async def finish_stop(stopping: Optional[tuple]):
+        """Wait for a server stopped by ``begin_stop`` to exit"""
+        if stopping is None:
+            return
+        task, client = stopping
+        if client is not None:
+            await client.close()
+        if task is not None and task is not asyncio.current_task():
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def stop(self):
+        await self.finish_stop(self.begin_stop())
+
+    def status(self) -> Dict[str, Any]:
+        running = self.client is not None and self.client.running
+        return {
+            "activation": "eager" if self.eager else "lazy",
+            "active": self.active,
+            "running": running,
+            "ready": self.ready.is_set(),
+            "pid": self.client.pid if running else None,
+            "uptime": round(time.monotonic() - self.started_at, 1) if self.started_at else 0,
+            "idle_for": round(time.monotonic() - self.last_used, 1) if self.active and not self.in_flight else 0,
+            "idle_ttl": self.idle_ttl,
+            "activations": self.activations,
+            "deactivations": self.deactivations,
+            "restarts": self.restarts,
+            "next_backoff": self.backoff,
+            "in_flight": self.in_flight,
+            "requests_served": self.requests_served,
+            "last_exit": self.last_exit,
+            "stderr_tail": list(self.client.stderr_tail)[-5:] if self.client else [],
+        }
+
+
+class MCPSupervisor:
+    """
+    Owns all managed servers and the Unix-socket API.
+
+    Servers are activated on their first request (``"activation": "eager"``
+    starts one with the supervisor instead), stopped again after
+    ``idle_ttl`` seconds without requests, and at most ``max_running``
+    lazy servers run at once (0 = no cap): activating one more first stops
+    the least recently used idle server, or waits until one becomes idle.
+    Servers are only picked for stopping under the capacity lock; waiting
+    for their processes to exit happens outside it.
+    """
+
+    def __init__(self, config_path: Path, socket_path: Path = SUPERVISOR_SOCKET,
+                 max_running: Optional[int] = None):
+        self.config_path = config_path
+        self.socket_path = Path(socket_path)
+        self.servers: Dict[str, ManagedServer] = {}
+        self.max_running = max_running
+        self.capacity: Optional[asyncio.Condition] = None
+        self.stopped = asyncio.Event()
+
+    async def serve(self):
+        config = load_mcp_config(self.config_path)
+        if self.max_running is None:
+            self.max_running = int(os.environ.get("MCP_MAX_RUNNING", config.get("maxRunningServers", DEFAULT_MAX_RUNNING)))
+        if self.max_running < 0:
+            raise ValueError(f"maxRunningServers must be 0 (no cap) or more, not {self.max_running}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if SupervisorClient(self.socket_path).probe():
+            raise OSError(errno.EADDRINUSE, f"An MCP supervisor is already listening on {self.socket_path}")
+        if self.socket_path.exists():
+            self.socket_path.unlink()  # left behind by a supervisor that died
+        for name, server_config in load_mcp_servers(self.config_path).items():
+            self.servers[name] = ManagedServer(name, server_config)
+            if self.servers[name].eager:
+                self.servers[name].activate()
+        self.capacity = asyncio.Condition()
+        reaper = asyncio.create_task(self._reap_idle())
+
+        server = await asyncio.start_unix_server(self._handle_client, path=str(self.socket_path), limit=STREAM_LIMIT)
+        os.chmod(self.socket_path, 0o600)
+        cap = f"at most {self.max_running}" if self.max_running else "no cap on"
+        print(f"🔌 MCP supervisor listening on {self.socket_path} "
+              f"({len(self.servers)} servers, {cap} lazy servers running)")
+
+        try:
+            await self.stopped.wait()
+        finally:
+            server.close()
+            reaper.cancel()
+            await asyncio.gather(*(s.stop() for s in self.servers.values()))
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    def _running_lazy(self) -> List[ManagedServer]:
+        return [s for s in self.servers.values() if s.active and not s.eager]
+
+    def _at_capacity(self) -> bool:
+        return bool(self.max_running) and len(self._running_lazy()) >= self.max_running
+
+    async def _acquire(self, server: ManagedServer, timeout: Optional[float]):
+        """Activate ``server`` if needed (evicting LRU idle servers over the cap) and count the request"""
+        evicted = []
+        async with self.capacity:
+            if not server.active and not server.eager:
+                def has_room() -> bool:
+                    return not self._at_capacity() or any(not s.in_flight for s in self._running_lazy())
+
+                await asyncio.wait_for(self.capacity.wait_for(has_room), timeout)
+                while self._at_capacity():
+                    idle = [s for s in self._running_lazy() if not s.in_flight]
+                    evicted.append(min(idle, key=lambda s: s.last_used).begin_deactivate("evicted"))
+            server.activate()
+            server.in_flight += 1
+            server.last_used = time.monotonic()
+        for stopping in evicted:
+            await ManagedServer.finish_stop(stopping)
+
+    async def _release(self, server: ManagedServer):
+        async with self.capacity:
+            server.in_flight -= 1
+            server.last_used = time.monotonic()
+            self.capacity.notify_all()
+
+    async def _reap_idle(self):
+        """Stop servers that have been idle longer than their ``idle_ttl``"""
+        while True:
+            await asyncio.sleep(REAP_INTERVAL)
+            now = time.monotonic()
+            async with self.capacity:
+                idle = [server.begin_deactivate("idle") for server in self.servers.values()
+                        if (server.active and server.idle_ttl > 0 and not server.in_flight
+                            and now - server.last_used >= server.idle_ttl)]
+                self.capacity.notify_all()
+            await asyncio.gather(*(ManagedServer.finish_stop(stopping) for stopping in idle))
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Each line is one request; responses are written as they complete, echoing ``tag``"""
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(request: Dict[str, Any]):
+            response = await self._dispatch(request)
+            if response is None:
+                return
+            response["tag"] = request.get("tag")
+            async with write_lock:
+                writer.write((json.dumps(response) + "\n").encode("utf-8"))
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    continue
+                task = asyncio.create_task(answer(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # client went away, or the supervisor is shutting down
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        op = request.get("op")
+        if op == "call":
+            server = self.servers.get(request.get("server"))
+            message = request.get("message", {})
+            if server is None:
+                return {"message": jsonrpc_error(message.get("id"), f"Unknown MCP server '{request.get('server')}'")}
+            timeout = request.get("timeout", DEFAULT_REQUEST_TIMEOUT)
+            try:
+                await self._acquire(server, timeout)
+            except asyncio.TimeoutError:
+                return {"message": jsonrpc_error(message.get("id"),
+                                                 f"No capacity to start MCP server '{server.name}' "
+                                                 f"({self.max_running} servers busy)")}
+            try:
+                response = await server.request(message, timeout)
+            finally:
+                await self._release(server)
+            return {"message": response}
+        if op == "status":
+            return {
+                "max_running": self.max_running,
+                "running": sum(1 for s in self.servers.values() if s.active),
+                "servers": {name: server.status() for name, server in self.servers.items()},
+            }
+        if op == "shutdown":
+            self.stopped.set()
+            return {"ok": True}
+        return {"error": f"Unknown op '{op}'"}
+
+
+class SupervisorClient:
+    """Blocking client for the supervisor's Unix-socket API"""
+
+    def __init__(self, socket_path: Path = SUPERVISOR_SOCKET):
+        self.socket_path = Path(socket_path)
+        self.sock: Optional[socket.socket] = None
+        self.reader = None
+        self.ids = itertools.count(1)
+
+    def is_running(self) -> bool:
+        """True when a supervisor accepts connections on the socket"""
+        if not hasattr(socket, "AF_UNIX") or not self.socket_path.exists():
+            return False
+        try:
+            self._connect()
+            return True
+        except OSError:
+            return False
+
+    def probe(self) -> bool:
+        """Like ``is_running``, without keeping the connection open"""
+        running = self.is_running()
+        self.close()
+        return running
+
+    def _connect(self):
+        if self.sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(str(self.socket_path))
+            self.sock = sock
+            self.reader = sock.makefile("rb")
+
+    def _roundtrip(self, request: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        self._connect()
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            line = self.reader.readline()
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise ConnectionError("MCP supervisor closed the connection")
+        return json.loads(line)
+
+    def request(self, server: str, message: Dict[str, Any], timeout: float = DEFAULT_REQUEST_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """Send a raw JSON-RPC message to a supervised server"""
+        reply = self._roundtrip({"op": "call", "server": server, "message": message, "timeout": timeout},
+                                timeout + 5 if timeout else None)
+        return reply.get("message")
+
+    def call(self, server: str, method: str, params: Optional[Dict[str, Any]] = None,
+             timeout: float = DEFAULT_REQUEST_TIMEOUT) -> Dict[str, Any]:
+        """Call a JSON-RPC method on a supervised server and return the response"""
+        message = {"jsonrpc": "2.0", "id": next(self.ids), "method": method}
+        if params is not None:
+            message["params"] = params
+        return self.request(server, message, timeout)
+
+    def status(self) -> Dict[str, Any]:
+        return self._roundtrip({"op": "status"}, 10)
+
+    def shutdown(self) -> Dict[str, Any]:
+        return self._roundtrip({"op": "shutdown"}, 10)
+
+    def close(self):
+        if self.sock is not None:
+            self.reader.close()
+            self.sock.close()
+            self.sock = None
+            self.reader = None
+
+
+def start_detached(config_path: Path, socket_path: Path, wait: float = 10.0) -> bool:
+    """Launch ``serve`` in its own session and wait for the socket to accept connections"""
+    SUPERVISOR_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(SUPERVISOR_LOG, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve",
+             "--config", str(config_path), "--socket", str(socket_path)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+            start_new_session=True
+        )
+    client = SupervisorClient(socket_path)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if client.is_running():
+            client.close()
+            return True
+        time.sleep(0.1)
+    return False
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="MCP server supervisor for CCDK i124q")
+    parser.add_argument("action", choices=["serve", "start", "stop", "status", "call"])
+    parser.add_argument("--config", default=str(THINKCHAIN_DIR / "mcp_config.json"), help="Path to mcp_config.json")
+    parser.add_argument("--socket", default=str(SUPERVISOR_SOCKET), help="Unix socket path")
+    parser.add_argument("--server", help="Server name for call")
+    parser.add_argument("--method", help="JSON-RPC method for call")
+    parser.add_argument("--params", help="JSON-RPC params as JSON")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_REQUEST_TIMEOUT, help="Request timeout in seconds")
+    args = parser.parse_args()
+
+    client = SupervisorClient(Path(args.socket))
+
+    if args.action == "serve":
+        supervisor = MCPSupervisor(Path(args.config), Path(args.socket))
+        try:
+            asyncio.run(supervisor.serve())
+        except KeyboardInterrupt:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    elif args.action == "start":
+        if client.is_running():
+            print(f"✅ MCP supervisor already running on {args.socket}")
+        elif start_detached(Path(args.config), Path(args.socket)):
+            print(f"✅ MCP supervisor started on {args.socket} (log: {SUPERVISOR_LOG})")
+        else:
+            print(f"❌ MCP supervisor did not come up; see {SUPERVISOR_LOG}")
+            sys.exit(1)
+
+    elif not client.is_running():
+        print("❌ MCP supervisor is not running")
+        sys.exit(1)
+
+    elif args.action == "stop":
+        client.shutdown()
+        print("✅ MCP supervisor stopped")
+
+    elif args.action == "status":
+        print(json.dumps(client.status(), indent=2))
+
+    elif args.action == "call" and args.server and args.method:
+        params = json.loads(args.params) if args.params else None
+        print(json.dumps(client.call(args.server, args.method, params, args.timeout), indent=2))
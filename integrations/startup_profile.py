@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Start-up Profiling for CCDK i124q Entry Points
+==============================================
+
+Backs the ``--profile-startup`` flag of the launcher, installer,
+dashboards, pre-fork server and ThinkChain bridge. The command is re-run
+in a child interpreter with ``-X importtime``; its output passes through
+unchanged and a summary of where start-up time went is printed to stderr:
+
+    python3 launch-ccdk-i124q.py --profile-startup --check
+    python3 integrations/thinkchain-bridge.py --profile-startup list
+
+Entry points check for the flag before their own imports, so this
+module costs nothing when the flag is absent:
+
+    if "--profile-startup" in sys.argv:
+        from startup_profile import run_profiled
+        sys.exit(run_profiled(__file__))
+
+Servers never exit on their own, so they mark the end of start-up just
+before they start serving; the report is printed at that point:
+
+    if os.environ.get("CCDK_PROFILE_STARTUP"):
+        print("startup-profile: ready", file=sys.stderr, flush=True)
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import sys
+import time
+import signal
+import subprocess
+from typing import Dict, List, Any, Optional
+
+FLAG = "--profile-startup"
+READY_ENV = "CCDK_PROFILE_STARTUP"      # set in the profiled child
+READY_MARKER = "startup-profile: ready"  # stderr line a server prints when start-up is over
+TOP_N = 15
+
+
+def parse_importtime(text: str) -> List[Dict[str, Any]]:
+    """Parse ``-X importtime`` lines into {module, self_us, cumulative_us, depth} records"""
+    records = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        records.append({
+            "module": name.strip(),
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1]),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+        })
+    return records
+
+
+def summarize(records: List[Dict[str, Any]], wall_ms: Optional[float] = None,
+              top: int = TOP_N) -> Dict[str, Any]:
+    """Totals plus the most expensive top-level imports (cumulative) and modules (self time)"""
+    roots = [r for r in records if r["depth"] == 0]
+    return {
+        "wall_ms": round(wall_ms, 1) if wall_ms is not None else None,
+        "import_ms": round(sum(r["cumulative_us"] for r in roots) / 1000, 1),
+        "modules": len(records),
+        "top_imports": sorted(roots, key=lambda r: r["cumulative_us"], reverse=True)[:top],
+        "top_modules": sorted(records, key=lambda r: r["self_us"], reverse=True)[:top],
+    }
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    lines = ["", "=" * 60, "⏱️  Start-up Profile", "=" * 60]
+    if summary["wall_ms"] is not None:
+        lines.append(f"Wall time:    {summary['wall_ms']:.1f} ms")
+    lines.append(f"Import time:  {summary['import_ms']:.1f} ms across {summary['modules']} modules")
+    lines.append("\nSlowest top-level imports (including their dependencies):")
+    for record in summary["top_imports"]:
+        lines.append(f"  {record['cumulative_us'] / 1000:8.1f} ms  {record['module']}")
+    lines.append("\nSlowest modules (own import time):")
+    for record in summary["top_modules"]:
+        lines.append(f"  {record['self_us'] / 1000:8.1f} ms  {record['module']}")
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def run_profiled(script: str, argv: Optional[List[str]] = None) -> int:
+    """
+    Re-run ``script`` under ``-X importtime`` without the flag; returns its exit code.
+
+    The report is printed when the child prints READY_MARKER, or when it
+    exits if it never does. Inherited file descriptors stay open, so a
+    server handed a listening socket can still be profiled.
+    """
+    argv = [arg for arg in (sys.argv[1:] if argv is None else argv) if arg != FLAG]
+    started = time.perf_counter()
+    child = subprocess.Popen(
+        [sys.executable, "-X", "importtime", os.path.abspath(script), *argv],
+        stderr=subprocess.PIPE, text=True, close_fds=False, env=dict(os.environ, **{READY_ENV: "1"})
+    )
+    # Stop requests aimed at this process are meant for the command
+    signal.signal(signal.SIGTERM, lambda *_: child.terminate())
+    timings: List[str] = []
+    reported = False
+
+    def report():
+        wall_ms = (time.perf_counter() - started) * 1000
+        print(format_report(summarize(parse_importtime("\n".join(timings)), wall_ms)), file=sys.stderr, flush=True)
+
+    # Pass the command's own stderr through; keep only the timing lines for the report
+    try:
+        for line in child.stderr:
+            line = line.rstrip("\n")
+            if line.startswith("import time:"):
+                if not reported:
+                    timings.append(line)
+            elif line == READY_MARKER:
+                if not reported:
+                    report()
+                    reported = True
+            else:
+                print(line, file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        if child.poll() is None:
+            child.send_signal(signal.SIGINT)
+    returncode = child.wait()
+    if not reported:
+        report()
+    return returncode
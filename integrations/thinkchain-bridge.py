@@ -17,42 +17,92 @@ Author: CCDK i124q Integration Team
 
 import os
 import sys
+
+if __name__ == "__main__" and "--profile-startup" in sys.argv:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from startup_profile import run_profiled
+    sys.exit(run_profiled(__file__))
+
 import json
-import asyncio
+import time
+import inspect
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, TYPE_CHECKING
 import subprocess
 
 # Add ThinkChain to path
-THINKCHAIN_DIR = Path("C:/Users/wtyle/thinkchain")
+THINKCHAIN_DIR = Path(os.environ.get("THINKCHAIN_DIR", "C:/Users/wtyle/thinkchain"))
 if THINKCHAIN_DIR.exists():
     sys.path.insert(0, str(THINKCHAIN_DIR))
 
+# Bridge helper modules live next to this script
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from thinkchain_manifest import ToolManifest, LazyTool
+from thinkchain_pool import ToolInstancePool
+from thinkchain_registry import ToolRegistry
+from thinkchain_workers import ToolProcessPool
+from thinkchain_cache import ToolResultCache, make_cache_key, MISS, RESULT_CACHE_DB
+from thinkchain_schema import SchemaValidationError
+from thinkchain_stream import is_stream, iter_tool_output, collect_tool_output, encode_ndjson, encode_sse
+from thinkchain_client import BridgeClient, BRIDGE_SOCKET
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor  # imported lazily at runtime by execute_many
+
+# On-disk caches (tool discovery manifest, ...)
+BRIDGE_CACHE_DIR = Path(os.environ.get("THINKCHAIN_BRIDGE_CACHE", THINKCHAIN_DIR / ".bridge_cache"))
+
+# Process pool for tools declaring execution = "process"
+PROCESS_POOL_SIZE = int(os.environ.get("THINKCHAIN_WORKERS", "0")) or None  # None = CPU count
+PROCESS_POOL_MAX_CALLS = int(os.environ.get("THINKCHAIN_WORKER_MAX_CALLS", "200"))
+PROCESS_CALL_TIMEOUT = float(os.environ.get("THINKCHAIN_WORKER_TIMEOUT", "300"))
+
 class ThinkChainBridge:
     """Bridge between Claude Code and ThinkChain functionality"""
     
     def __init__(self):
         self.thinkchain_dir = THINKCHAIN_DIR
-        self.tools_cache = {}
+        self.registry = ToolRegistry()
+        self.reload_lock = threading.RLock()
+        self.watcher_stop = None
         self.mcp_servers = {}
+        self.manifest = ToolManifest(self.thinkchain_dir / "tools", BRIDGE_CACHE_DIR / "manifest.json")
+        self.tool_pool = ToolInstancePool()
+        self.process_pool = None
+        self.result_cache = ToolResultCache(RESULT_CACHE_DB)
         self.initialized = False
+    
+    @property
+    def tools_cache(self):
+        """Current copy-on-write snapshot of tool name -> LazyTool"""
+        return self.registry.entries
         
-    def initialize(self) -> bool:
-        """Initialize ThinkChain components that don't require API key"""
+    def initialize(self, scan: bool = True) -> bool:
+        """
+        Initialize ThinkChain components that don't require API key.
+        
+        Tool discovery goes through the on-disk manifest: only tool files
+        whose mtime/hash changed since the last run are imported. Calling
+        this again just rescans the directory stats. With ``scan=False``
+        the manifest is trusted as-is and no tool file is touched.
+        """
         try:
-            # Import ThinkChain components
-            from tool_discovery import get_tool_discovery, get_claude_tools
+            if not self.initialized:
+                self.manifest.load()
+                
+                # Load MCP configuration
+                mcp_config_path = self.thinkchain_dir / "mcp_config.json"
+                if mcp_config_path.exists():
+                    with open(mcp_config_path) as f:
+                        config = json.load(f)
+                        self.mcp_servers = config.get("mcpServers", {})
             
-            # Initialize tool discovery
-            self.tool_discovery = get_tool_discovery()
-            self.tools_cache = self.tool_discovery.discovered_tools
-            
-            # Load MCP configuration
-            mcp_config_path = self.thinkchain_dir / "mcp_config.json"
-            if mcp_config_path.exists():
-                with open(mcp_config_path) as f:
-                    config = json.load(f)
-                    self.mcp_servers = config.get("mcpServers", {})
+            # Refresh tool discovery (imports changed files only)
+            with self.reload_lock:
+                loaded = self.manifest.refresh() if scan else {}
+                self._sync_tools_cache(loaded)
             
             self.initialized = True
             return True
@@ -69,12 +119,13 @@ class ThinkChainBridge:
         tools = []
         
         # Local Python tools
-        for tool_name, tool_class in self.tools_cache.items():
+        for tool_name, tool in self.tools_cache.items():
             tools.append({
                 "name": tool_name,
                 "type": "local",
-                "description": getattr(tool_class, "__doc__", "No description"),
-                "requires_api": False
+                "description": tool.description,
+                "requires_api": False,
+                "generation": tool.generation
             })
         
         # MCP server tools
@@ -89,24 +140,91 @@ class ThinkChainBridge:
         
         return tools
     
+    def _ensure_tools(self, tool_names: List[str]):
+        """Cold start: revalidate only the requested tools' files"""
+        if self.initialized:
+            return
+        self.initialize(scan=False)
+        for tool_name in dict.fromkeys(tool_names):
+            with self.reload_lock:
+                loaded = self.manifest.refresh_tool(tool_name)
+                if loaded is not None:
+                    self._sync_tools_cache(loaded)
+            if loaded is None:
+                self.initialize()
+                return
+    
     def execute_local_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Execute a local tool without API call"""
-        if not self.initialized:
-            self.initialize()
+        self._ensure_tools([tool_name])
+        # One registry lookup per call: a hot reload during the call does not affect it
+        proxy = self.tools_cache.get(tool_name)
+        invalid = self._validate_args(tool_name, proxy, kwargs)
+        if invalid is not None:
+            return invalid
+        return self._execute_checked(tool_name, proxy, kwargs)
+    
+    def _validate_args(self, tool_name: str, proxy: Optional[LazyTool],
+                       kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Check arguments against the tool's compiled input schema; returns an error result or None"""
+        if proxy is None:
+            return None  # reported as "not found" by the dispatch path
+        try:
+            proxy.validate(kwargs)
+        except SchemaValidationError as e:
+            return {"success": False, "error": f"Invalid arguments for tool '{tool_name}': {e}", "invalid_arguments": True}
+        except Exception as e:
+            return {"success": False, "error": f"Cannot validate arguments for tool '{tool_name}': {e}"}
+        return None
+    
+    def _execute_checked(self, tool_name: str, proxy: Optional[LazyTool], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a call whose arguments were already validated"""
+        # Deterministic tools may answer from the result cache
+        cache_key = self._result_cache_key(tool_name, proxy, kwargs)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not MISS:
+                return {"success": True, "result": cached, "cached": True}
         
+        response = self._execute_uncached(tool_name, proxy, kwargs)
+        if cache_key is not None and response.get("success"):
+            self.result_cache.put(cache_key, tool_name, response["result"], proxy.ttl)
+        return response
+    
+    def _result_cache_key(self, tool_name: str, proxy: Optional[LazyTool], kwargs: Dict[str, Any]) -> Optional[str]:
+        """Cache key for calls to tools declaring ``cacheable = True``, else None"""
+        if proxy is None or not proxy.cacheable:
+            return None
+        return make_cache_key(tool_name, proxy.sha256, kwargs)
+    
+    def _execute_uncached(self, tool_name: str, proxy: Optional[LazyTool], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool in-process or on the worker pool, bypassing the result cache"""
         try:
-            if tool_name not in self.tools_cache:
+            # Process-isolated tools never get imported into the bridge
+            if proxy is not None and proxy.execution == "process":
+                return self.get_process_pool().execute(
+                    tool_name, proxy.file, proxy.class_name, proxy.sha256, kwargs,
+                    timeout=PROCESS_CALL_TIMEOUT,
+                    cpu_seconds=proxy.cpu_seconds,
+                    memory_mb=proxy.memory_mb
+                )
+            
+            # Get the tool class
+            tool_class = proxy.load() if proxy is not None else None
+            if tool_class is None:
                 return {
                     "success": False,
                     "error": f"Tool '{tool_name}' not found"
                 }
             
-            # Get the tool class
-            tool_class = self.tools_cache[tool_name]
-            
-            # Instantiate and execute
-            tool_instance = tool_class()
-            result = tool_instance.execute(**kwargs)
+            # Instantiate (or reuse a pooled instance) and execute
+            with self.tool_pool.lease(tool_name, tool_class) as tool_instance:
+                result = tool_instance.execute(**kwargs)
+                if inspect.isawaitable(result):
+                    import asyncio
+                    result = asyncio.run(result)
+                elif is_stream(result):
+                    result = collect_tool_output(result)
             
             return {
                 "success": True,
@@ -119,11 +237,256 @@ class ThinkChainBridge:
                 "error": str(e)
             }
     
+    def stream_local_tool(self, tool_name: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a tool and yield its output as events (see thinkchain_stream).
+        
+        Partial results of generator tools are yielded as they are produced
+        and never collected; other tools yield their whole result at the end.
+        """
+        started = time.perf_counter()
+        yield {"event": "start", "tool": tool_name}
+        
+        def end(response: Dict[str, Any], **extra) -> Dict[str, Any]:
+            return {"event": "end", **response, **extra,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)}
+        
+        self._ensure_tools([tool_name])
+        proxy = self.tools_cache.get(tool_name)
+        invalid = self._validate_args(tool_name, proxy, kwargs)
+        if invalid is not None:
+            yield end(invalid)
+            return
+        cache_key = self._result_cache_key(tool_name, proxy, kwargs)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not MISS:
+                yield end({"success": True, "result": cached, "cached": True})
+                return
+        
+        # Process-isolated tools return one pickled reply, so they end in a single event
+        try:
+            tool_class = proxy.load() if proxy is not None and proxy.execution != "process" else None
+            if tool_class is not None:
+                tool_instance = self.tool_pool.acquire(tool_name, tool_class)
+        except Exception as e:
+            yield end({"success": False, "error": str(e)})
+            return
+        if tool_class is None:
+            yield end(self._execute_checked(tool_name, proxy, kwargs))
+            return
+        
+        healthy = False
+        try:
+            output = tool_instance.execute(**kwargs)
+            if not is_stream(output):
+                if inspect.isawaitable(output):
+                    import asyncio
+                    output = asyncio.run(output)
+                if cache_key is not None:
+                    self.result_cache.put(cache_key, tool_name, output, proxy.ttl)
+                healthy = True
+                yield end({"success": True, "result": output})
+                return
+            
+            chunks = 0
+            for chunk in iter_tool_output(output):
+                yield {"event": "partial", "seq": chunks, "data": chunk}
+                chunks += 1
+            healthy = True
+            yield end({"success": True}, chunks=chunks)
+        except Exception as e:
+            yield end({"success": False, "error": str(e)})
+        finally:
+            # An abandoned or failed stream may leave a per-caller instance mid-call
+            self.tool_pool.release(tool_name, tool_instance,
+                                   healthy=healthy or self.tool_pool.is_shared(tool_class))
+    
+    def execute_many(self, calls: List[Dict[str, Any]], max_concurrency: int = 8,
+                     timeout: Optional[float] = 60.0) -> List[Dict[str, Any]]:
+        """
+        Execute independent tool calls concurrently.
+        
+        Each call is ``{"tool": name, "args": {...}}``. Blocking tools run on a
+        thread pool, tools with an ``async def execute`` run on the event loop.
+        Results come back in call order, each with its own success flag,
+        error and ``elapsed_ms``; one failing or timed-out call does not
+        affect the others. A timed-out blocking tool keeps its worker thread
+        until it returns, so ``max_concurrency`` should leave headroom.
+        """
+        import asyncio
+        return asyncio.run(self.execute_many_async(calls, max_concurrency, timeout))
+    
+    async def execute_many_async(self, calls: List[Dict[str, Any]], max_concurrency: int = 8,
+                                 timeout: Optional[float] = 60.0) -> List[Dict[str, Any]]:
+        """Async variant of ``execute_many`` for callers already inside an event loop"""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        self._ensure_tools([call.get("tool", "") for call in calls])
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency),
+                                      thread_name_prefix="thinkchain-tool")
+        try:
+            async def run_call(call: Dict[str, Any]) -> Dict[str, Any]:
+                tool_name = call.get("tool", "")
+                kwargs = call.get("args") or {}
+                async with semaphore:
+                    started = time.perf_counter()
+                    try:
+                        result = await asyncio.wait_for(
+                            self._execute_call_async(executor, tool_name, kwargs), timeout)
+                    except asyncio.TimeoutError:
+                        result = {"success": False, "error": f"Tool '{tool_name}' timed out after {timeout}s"}
+                    except Exception as e:
+                        result = {"success": False, "error": str(e)}
+                    result["tool"] = tool_name
+                    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+                    return result
+            
+            return await asyncio.gather(*(run_call(call) for call in calls))
+        finally:
+            # Do not block on threads still running timed-out tools
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def _execute_call_async(self, executor: "ThreadPoolExecutor", tool_name: str,
+                                  kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one call: await async tools, offload blocking and process-mode ones to the executor"""
+        proxy = self.tools_cache.get(tool_name)
+        invalid = self._validate_args(tool_name, proxy, kwargs)
+        if invalid is not None:
+            return invalid
+        tool_class = None
+        if proxy is not None and proxy.execution != "process":
+            tool_class = proxy.load()
+        if tool_class is None or not inspect.iscoroutinefunction(getattr(tool_class, "execute", None)):
+            import asyncio
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, partial(self._execute_checked, tool_name, proxy, kwargs))
+        
+        cache_key = self._result_cache_key(tool_name, proxy, kwargs)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not MISS:
+                return {"success": True, "result": cached, "cached": True}
+        
+        with self.tool_pool.lease(tool_name, tool_class) as tool_instance:
+            result = await tool_instance.execute(**kwargs)
+        if cache_key is not None:
+            self.result_cache.put(cache_key, tool_name, result, proxy.ttl)
+        return {"success": True, "result": result}
+    
+    def get_tool_class(self, tool_name: str) -> Optional[type]:
+        """Return a tool class, importing its module on first use"""
+        proxy = self.tools_cache.get(tool_name)
+        if proxy is None:
+            return None
+        return proxy.load()
+    
+    def get_process_pool(self) -> ToolProcessPool:
+        """Start (once) the warm worker pool, pre-importing every process-mode tool"""
+        if self.process_pool is None:
+            preload = sorted({
+                f"tools.{Path(proxy.file).stem}"
+                for proxy in self.tools_cache.values()
+                if proxy.execution == "process"
+            })
+            self.process_pool = ToolProcessPool(
+                sys_paths=[str(self.thinkchain_dir), str(Path(__file__).resolve().parent)],
+                preload=preload,
+                size=PROCESS_POOL_SIZE,
+                max_calls_per_worker=PROCESS_POOL_MAX_CALLS
+            )
+            self.process_pool.start()
+        return self.process_pool
+    
+    def shutdown(self):
+        """Stop worker processes started by this bridge and flush cache stats"""
+        self.stop_tool_watcher()
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+            self.process_pool = None
+        self.result_cache.close()
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Instance pool hit/miss metrics for reusable tools"""
+        self.tool_pool.evict_idle()
+        stats = self.tool_pool.get_stats()
+        if self.process_pool is not None:
+            stats["process_pool"] = self.process_pool.get_stats()
+        stats["result_cache"] = self.result_cache.get_stats()
+        return stats
+    
+    def _sync_tools_cache(self, loaded: Dict[str, type]) -> List[str]:
+        """
+        Publish manifest changes to the registry; returns the changed tool names.
+        
+        Only added, changed and removed tools are swapped. Proxies for
+        unchanged files are kept (with any class they already imported);
+        classes imported while scanning are attached directly.
+        """
+        current = self.tools_cache
+        manifest_tools = self.manifest.tools()
+        changes = {}
+        for tool_name, tool_info in manifest_tools.items():
+            proxy = current.get(tool_name)
+            if tool_name in loaded:
+                changes[tool_name] = LazyTool(self.manifest, tool_info, loaded[tool_name])
+            elif proxy is None or proxy.sha256 != tool_info["sha256"]:
+                changes[tool_name] = LazyTool(self.manifest, tool_info)
+        for tool_name in current:
+            if tool_name not in manifest_tools:
+                changes[tool_name] = None
+        self.registry.swap(changes)
+        return list(changes)
+    
+    def reload_tool_file(self, tool_file: Path) -> Dict[str, Any]:
+        """
+        Hot-reload one tool file (added, changed or deleted).
+        
+        Only the tools defined by that file are swapped in the registry;
+        calls already running keep the previous version.
+        """
+        if not self.initialized:
+            self.initialize(scan=False)
+        with self.reload_lock:
+            loaded = self.manifest.refresh_file(Path(tool_file))
+            self.manifest.save()
+            changed = self._sync_tools_cache(loaded)
+        return {"changed": changed, "generation": self.registry.generation}
+    
+    def start_tool_watcher(self, interval: float = 1.0):
+        """Poll the tools directory and hot-reload files as they change"""
+        if self.watcher_stop is not None:
+            return
+        self.watcher_stop = threading.Event()
+        stop = self.watcher_stop
+        
+        def watch():
+            # refresh() only stats files; unchanged ones cost no reads
+            while not stop.wait(interval):
+                try:
+                    with self.reload_lock:
+                        self._sync_tools_cache(self.manifest.refresh())
+                except Exception as e:
+                    print(f"Tool watcher error: {e}")
+        
+        threading.Thread(target=watch, name="thinkchain-tool-watcher", daemon=True).start()
+    
+    def stop_tool_watcher(self):
+        if self.watcher_stop is not None:
+            self.watcher_stop.set()
+            self.watcher_stop = None
+    
     def simulate_thinking_stream(self, prompt: str) -> str:
         """
         Simulate ThinkChain's thinking process without API
         This provides the thinking structure without actual Claude API calls
         """
+        return "\n".join(self.iter_thinking_stream(prompt))
+    
+    def iter_thinking_stream(self, prompt: str) -> Iterator[str]:
+        """Yield the simulated thinking steps one at a time, as a stream"""
         steps = [
             f"🤔 Analyzing prompt: {prompt[:100]}...",
             "📊 Breaking down into components...",
@@ -132,11 +495,8 @@ class ThinkChainBridge:
             "⚡ Ready for execution"
         ]
         
-        output = []
         for step in steps:
-            output.append(f"<thinking>{step}</thinking>")
-        
-        return "\n".join(output)
+            yield f"<thinking>{step}</thinking>"
     
     def create_tool_from_spec(self, spec: Dict[str, Any]) -> bool:
         """Create a new tool dynamically from specification"""
@@ -151,11 +511,14 @@ class ThinkChainBridge:
             tools_dir = self.thinkchain_dir / "tools"
             tool_file = tools_dir / f"{tool_name}.py"
             
-            with open(tool_file, "w") as f:
+            # Write next to the target and rename, so no reader sees a partial file
+            tmp_file = tools_dir / f".{tool_name}.py.tmp"
+            with open(tmp_file, "w") as f:
                 f.write(tool_code)
+            os.replace(tmp_file, tool_file)
             
-            # Refresh tool discovery
-            self.initialize()
+            # Hot-reload this file only
+            self.reload_tool_file(tool_file)
             
             return True
             
@@ -169,38 +532,75 @@ class ThinkChainMCPBridge:
     def __init__(self):
         self.servers = {}
         self.processes = {}
+        # The MCP modules pull in asyncio; load them only when MCP is used
+        from mcp_supervisor import SupervisorClient
+        self.supervisor = SupervisorClient()
+    
+    def call_mcp(self, server_name: str, method: str, params: Optional[Dict] = None,
+                 timeout: float = 60.0) -> Dict[str, Any]:
+        """
+        Call a JSON-RPC method on a warm server kept by the MCP supervisor.
+        
+        The supervisor owns the server processes, so no server is started
+        (or initialized) per call. It is started on the first call if it is
+        not running yet, and it starts each server on that server's first
+        request.
+        """
+        from mcp_supervisor import start_detached
+        if not self.supervisor.is_running() and not start_detached(
+                THINKCHAIN_DIR / "mcp_config.json", self.supervisor.socket_path):
+            return {
+                "success": False,
+                "error": "MCP supervisor did not start (see .bridge_cache/mcp-supervisor.log)"
+            }
+        try:
+            response = self.supervisor.call(server_name, method, params, timeout)
+        except (OSError, ValueError) as e:
+            return {"success": False, "error": f"MCP supervisor request failed: {e}"}
+        if "error" in response:
+            return {"success": False, "error": response["error"].get("message", "MCP error"), "response": response}
+        return {"success": True, "result": response.get("result")}
     
     async def start_mcp_server(self, server_name: str, config: Dict) -> bool:
-        """Start an MCP server"""
+        """Start an MCP server and complete its handshake"""
+        from mcp_jsonrpc import McpStdioClient
+        client = McpStdioClient(config.get("command", ""), config.get("args", []), config.get("env", {}))
         try:
-            command = config.get("command", "")
-            args = config.get("args", [])
-            env = os.environ.copy()
-            env.update(config.get("env", {}))
-            
-            # Start the server process
-            process = await asyncio.create_subprocess_exec(
-                command,
-                *args,
-                env=env,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            self.processes[server_name] = process
-            return True
-            
+            await client.start()
+            await client.initialize()
         except Exception as e:
             print(f"Failed to start MCP server {server_name}: {e}")
+            await client.close()
             return False
+        
+        self.processes[server_name] = client
+        return True
+    
+    async def mcp_request(self, server_name: str, method: str, params: Optional[Dict] = None,
+                          timeout: float = 60.0) -> Dict[str, Any]:
+        """
+        Call a JSON-RPC method on a server started with start_mcp_server.
+        
+        Calls are pipelined, so many can be awaited concurrently on one server.
+        """
+        import asyncio
+        from mcp_jsonrpc import JsonRpcError
+        client = self.processes.get(server_name)
+        if client is None:
+            return {"success": False, "error": f"MCP server '{server_name}' is not started"}
+        try:
+            return {"success": True, "result": await client.request(method, params, timeout)}
+        except JsonRpcError as e:
+            return {"success": False, "error": str(e), "code": e.code}
+        except asyncio.TimeoutError:
+            return {"success": False, "error": f"MCP request '{method}' timed out after {timeout}s"}
+        except ConnectionError as e:
+            return {"success": False, "error": str(e)}
     
     async def stop_mcp_server(self, server_name: str) -> bool:
         """Stop an MCP server"""
         if server_name in self.processes:
-            process = self.processes[server_name]
-            process.terminate()
-            await process.wait()
-            del self.processes[server_name]
+            await self.processes.pop(server_name).close()
             return True
         return False
 
@@ -251,20 +651,95 @@ __all__ = ['think_without_api', 'execute_tool', 'bridge']
     
     return wrapper_path
 
+# =============================================================================
+# RESIDENT DAEMON (thinkchain-bridge.py serve)
+# =============================================================================
+
+BRIDGE_DAEMON_LOG = BRIDGE_CACHE_DIR / "bridge-daemon.log"
+
+
+def serve_bridge(socket_path: Path = BRIDGE_SOCKET):
+    """Run the resident bridge: discovery once, warm pools and caches, hot-reloaded tools"""
+    from thinkchain_server import serve, unix_sockets_supported
+    if not unix_sockets_supported():
+        print("❌ The bridge daemon needs Unix sockets, which this platform does not support")
+        sys.exit(1)
+    
+    bridge = ThinkChainBridge()
+    bridge.initialize()
+    bridge.start_tool_watcher()
+    try:
+        serve(bridge, socket_path)
+    except OSError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        bridge.shutdown()
+
+
+def start_bridge_daemon(socket_path: Path = BRIDGE_SOCKET, wait: float = 30.0) -> bool:
+    """Launch ``serve`` in its own session and wait until it accepts connections"""
+    BRIDGE_DAEMON_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(BRIDGE_DAEMON_LOG, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve", "--socket", str(socket_path)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+            start_new_session=True
+        )
+    client = BridgeClient(socket_path)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if client.connect():
+            client.close()
+            return True
+        time.sleep(0.1)
+    return False
+
 # CLI interface for testing
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="ThinkChain Bridge for CCDK i124q")
-    parser.add_argument("action", choices=["list", "execute", "test", "init"])
+    parser.add_argument("action", choices=["list", "execute", "stream", "execute-batch", "test", "init",
+                                           "serve", "start", "stop"])
     parser.add_argument("--tool", help="Tool name for execution")
     parser.add_argument("--args", help="Tool arguments as JSON")
+    parser.add_argument("--file", help="JSONL file of {\"tool\": ..., \"args\": {...}} calls for execute-batch")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max concurrent calls for execute-batch")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-call timeout in seconds for execute-batch")
+    parser.add_argument("--format", choices=["ndjson", "sse"], default="ndjson", help="Event encoding for stream")
+    parser.add_argument("--socket", default=str(BRIDGE_SOCKET), help="Unix socket of the resident bridge")
+    parser.add_argument("--no-daemon", action="store_true", help="Run in this process even if the daemon is up")
     
     args = parser.parse_args()
+    socket_path = Path(args.socket)
     
-    bridge = ThinkChainBridge()
+    # list/execute/stream/execute-batch go to the resident bridge when it is running
+    daemon = BridgeClient(socket_path)
+    use_daemon = (not args.no_daemon and args.action in ("list", "execute", "stream", "execute-batch")
+                  and daemon.connect())
+    bridge = None if use_daemon or args.action in ("serve", "start", "stop") else ThinkChainBridge()
     
-    if args.action == "init":
+    if args.action == "serve":
+        serve_bridge(socket_path)
+    
+    elif args.action == "start":
+        if daemon.connect():
+            print(f"✅ ThinkChain bridge already running on {socket_path}")
+        elif start_bridge_daemon(socket_path):
+            print(f"✅ ThinkChain bridge started on {socket_path} (log: {BRIDGE_DAEMON_LOG})")
+        else:
+            print(f"❌ ThinkChain bridge did not come up; see {BRIDGE_DAEMON_LOG}")
+            sys.exit(1)
+    
+    elif args.action == "stop":
+        if daemon.connect():
+            daemon.shutdown()
+            print("✅ ThinkChain bridge stopped")
+        else:
+            print("❌ ThinkChain bridge is not running")
+    
+    elif args.action == "init":
         if bridge.initialize():
             print("✅ ThinkChain bridge initialized successfully")
             wrapper_path = create_claude_code_wrapper()
@@ -273,26 +748,60 @@ if __name__ == "__main__":
             print("❌ Failed to initialize ThinkChain bridge")
     
     elif args.action == "list":
-        bridge.initialize()
-        tools = bridge.list_available_tools()
+        if use_daemon:
+            tools = daemon.list_tools()
+        else:
+            bridge.initialize()
+            tools = bridge.list_available_tools()
         print(f"\n🛠️ Available Tools ({len(tools)}):\n")
         for tool in tools:
             print(f"  • {tool['name']} ({tool['type']})")
             print(f"    {tool['description']}")
             print(f"    Requires API: {tool.get('requires_api', False)}")
+            if "generation" in tool:
+                print(f"    Generation: {tool['generation']}")
             print()
     
     elif args.action == "execute" and args.tool:
-        bridge.initialize()
+        # execute_local_tool initializes lazily and only checks this tool's file
         kwargs = json.loads(args.args) if args.args else {}
-        result = bridge.execute_local_tool(args.tool, **kwargs)
+        if use_daemon:
+            result = daemon.execute(args.tool, kwargs)
+        else:
+            result = bridge.execute_local_tool(args.tool, **kwargs)
         print(json.dumps(result, indent=2))
     
+    elif args.action == "stream" and args.tool:
+        # One event per line, flushed as soon as the tool produces it
+        kwargs = json.loads(args.args) if args.args else {}
+        encode = encode_sse if args.format == "sse" else encode_ndjson
+        events = daemon.stream(args.tool, kwargs) if use_daemon else bridge.stream_local_tool(args.tool, **kwargs)
+        for event in events:
+            sys.stdout.write(encode(event))
+            sys.stdout.flush()
+    
+    elif args.action == "execute-batch" and args.file:
+        with open(args.file) as f:
+            calls = [json.loads(line) for line in f if line.strip()]
+        if use_daemon:
+            results = daemon.execute_many(calls, args.concurrency, args.timeout)
+        else:
+            results = bridge.execute_many(calls, args.concurrency, args.timeout)
+        for result in results:
+            print(json.dumps(result))
+    
     elif args.action == "test":
         bridge.initialize()
         print("🧪 Testing ThinkChain Bridge...")
         print(f"✅ ThinkChain directory: {bridge.thinkchain_dir}")
         print(f"✅ Tools discovered: {len(bridge.tools_cache)}")
         print(f"✅ MCP servers configured: {len(bridge.mcp_servers)}")
+        pool_totals = bridge.get_pool_stats()["totals"]
+        print(f"✅ Instance pool: {pool_totals['hits']} hits / {pool_totals['misses']} misses")
         print("\n📝 Sample thinking stream:")
-        print(bridge.simulate_thinking_stream("Test prompt"))
\ No newline at end of file
+        for step in bridge.iter_thinking_stream("Test prompt"):
+            print(step, flush=True)
+    
+    daemon.close()
+    if bridge is not None:
+        bridge.shutdown()
\ No newline at end of file
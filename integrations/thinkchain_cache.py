@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Result Cache for CCDK i124q
+======================================
+
+Memoizing cache for deterministic ThinkChain tools.
+
+Tools opt in with class attributes:
+
+    class CurrencyRatesTool(BaseTool):
+        cacheable = True   # results depend only on the arguments
+        ttl = 600          # optional, seconds a result stays valid (default 3600)
+
+Keys are built from the tool name, the sha256 of the tool file and the
+canonicalized keyword arguments, so editing a tool invalidates its entries.
+Lookups go to an in-memory LRU first and then to an SQLite file shared by
+every bridge process; both tiers evict by age (TTL) and by total size.
+Hit/miss counters are flushed to the SQLite file for the analytics dashboard.
+
+Only results that survive a JSON round trip unchanged are stored, so a
+hit returns exactly what a miss would have (a tuple result or a dict
+with int keys, which JSON would turn into a list or str keys, is simply
+not cached).
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+DEFAULT_TTL = 3600
+MEMORY_MAX_ENTRIES = 1024
+MEMORY_MAX_BYTES = 16 * 1024 * 1024
+DISK_MAX_BYTES = 256 * 1024 * 1024
+
+# Flush hit/miss counters to disk every N lookups
+STATS_FLUSH_EVERY = 100
+
+STAT_KEYS = ("memory_hits", "disk_hits", "misses", "stores", "evictions")
+
+# Same resolution as the bridge, so the dashboards find its cache file
+THINKCHAIN_DIR = Path(os.environ.get("THINKCHAIN_DIR", "C:/Users/wtyle/thinkchain"))
+BRIDGE_CACHE_DIR = Path(os.environ.get("THINKCHAIN_BRIDGE_CACHE", THINKCHAIN_DIR / ".bridge_cache"))
+RESULT_CACHE_DB = BRIDGE_CACHE_DIR / "results.sqlite"
+
+MISS = object()
+
+
+def make_cache_key(tool_name: str, tool_sha256: str, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Stable key for a call, or None when the arguments are not JSON-canonicalizable"""
+    try:
+        canonical = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(f"{tool_name}\0{tool_sha256}\0{canonical}".encode("utf-8")).hexdigest()
+
+
+def read_cache_stats(db_path: Path = RESULT_CACHE_DB) -> Dict[str, Any]:
+    """Read persisted counters and tier size from a cache file (used by the dashboards)"""
+    stats = {key: 0 for key in STAT_KEYS}
+    stats.update(entries=0, bytes=0, hit_rate=0.0)
+    if not Path(db_path).exists():
+        return stats
+    conn = sqlite3.connect(str(db_path))
+    try:
+        for name, value in conn.execute("SELECT name, value FROM stats"):
+            stats[name] = value
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        stats.update(entries=entries, bytes=size)
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
+    hits = stats["memory_hits"] + stats["disk_hits"]
+    if hits + stats["misses"]:
+        stats["hit_rate"] = round(hits / (hits + stats["misses"]), 3)
+    return stats
+
+
+class ToolResultCache:
+    """Two-tier (memory LRU + SQLite) cache of tool results"""
+
+    def __init__(self, db_path: Path, memory_max_entries: int = MEMORY_MAX_ENTRIES,
+                 memory_max_bytes: int = MEMORY_MAX_BYTES, disk_max_bytes: int = DISK_MAX_BYTES):
+        self.db_path = Path(db_path)
+        self.memory_max_entries = memory_max_entries
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (json, expires)
+        self.memory_bytes = 0
+        self.lock = threading.Lock()
+        self.conn = None
+        self.disk_bytes = 0  # running total of row sizes, resynced when over budget
+        self.stats = {key: 0 for key in STAT_KEYS}
+        self.pending = {key: 0 for key in STAT_KEYS}
+        self.lookups = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self.conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, tool TEXT, value TEXT, size INTEGER,"
+                " expires REAL, last_access REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS results_last_access ON results(last_access)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER)")
+            self.conn.commit()
+            self.disk_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        return self.conn
+
+    def _count(self, stat: str, n: int = 1):
+        self.stats[stat] += n
+        self.pending[stat] += n
+
+    def _memory_put(self, key: str, value: str, expires: float):
+        old = self.memory.pop(key, None)
+        if old is not None:
+            self.memory_bytes -= len(old[0])
+        self.memory[key] = (value, expires)
+        self.memory_bytes += len(value)
+        while self.memory and (len(self.memory) > self.memory_max_entries or self.memory_bytes > self.memory_max_bytes):
+            _, (evicted, _) = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+            self._count("evictions")
+
+    def get(self, key: str) -> Any:
+        """Return the cached result, or the ``MISS`` sentinel"""
+        now = time.time()
+        with self.lock:
+            self.lookups += 1
+            entry = self.memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self.memory.move_to_end(key)
+                    self._count("memory_hits")
+                    self._maybe_flush()
+                    return json.loads(entry[0])
+                del self.memory[key]
+                self.memory_bytes -= len(entry[0])
+
+            try:
+                db = self._db()
+                row = db.execute("SELECT value, expires FROM results WHERE key = ? AND expires > ?",
+                                 (key, now)).fetchone()
+                if row is not None:
+                    db.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+                    db.commit()
+            except sqlite3.Error:
+                row = None
+
+            if row is None:
+                self._count("misses")
+                self._maybe_flush()
+                return MISS
+            self._memory_put(key, row[0], row[1])
+            self._count("disk_hits")
+            self._maybe_flush()
+            return json.loads(row[0])
+
+    def put(self, key: str, tool_name: str, result: Any, ttl: Optional[float] = None):
+        """
+        Store a result in both tiers for ``ttl`` seconds (default ``DEFAULT_TTL``).
+
+        Results that are not JSON-serializable, or would come back
+        different from JSON, are not cached; neither is anything with a
+        ``ttl`` of 0 or less.
+        """
+        ttl = ttl if ttl is not None else DEFAULT_TTL
+        if ttl <= 0:
+            return
+        try:
+            value = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+            if json.loads(value) != result:
+                return
+        except (TypeError, ValueError):
+            return
+        now = time.time()
+        expires = now + ttl
+        with self.lock:
+            self._memory_put(key, value, expires)
+            self._count("stores")
+            try:
+                db = self._db()
+                old = db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+                db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                           (key, tool_name, value, len(value), expires, now))
+                self.disk_bytes += len(value) - (old[0] if old else 0)
+                if self.disk_bytes > self.disk_max_bytes:
+                    self._evict_disk(db, now)
+                db.commit()
+            except sqlite3.Error:
+                pass
+
+    def _evict_disk(self, db: sqlite3.Connection, now: float):
+        """
+        Drop expired rows, then least recently used rows until under the size budget.
+
+        The running total only sees this process's writes, so it is
+        recomputed here before anything is evicted.
+        """
+        db.execute("DELETE FROM results WHERE expires <= ?", (now,))
+        self.disk_bytes = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if self.disk_bytes <= self.disk_max_bytes:
+            return
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY last_access").fetchall():
+            db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._count("evictions")
+            self.disk_bytes -= size
+            if self.disk_bytes <= self.disk_max_bytes:
+                break
+
+    def _maybe_flush(self):
+        if self.lookups % STATS_FLUSH_EVERY == 0:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not any(self.pending.values()):
+            return
+        try:
+            db = self._db()
+            for name, delta in self.pending.items():
+                if delta:
+                    db.execute("INSERT OR IGNORE INTO stats VALUES (?, 0)", (name,))
+                    db.execute("UPDATE stats SET value = value + ? WHERE name = ?", (delta, name))
+            db.commit()
+            self.pending = {key: 0 for key in STAT_KEYS}
+        except sqlite3.Error:
+            pass
+
+    def flush_stats(self):
+        """Persist counters accumulated since the last flush"""
+        with self.lock:
+            self._flush_locked()
+
+    def clear(self):
+        """Drop every cached result in both tiers"""
+        with self.lock:
+            self.memory.clear()
+            self.memory_bytes = 0
+            try:
+                db = self._db()
+                db.execute("DELETE FROM results")
+                db.commit()
+                self.disk_bytes = 0
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        with self.lock:
+            self._flush_locked()
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for this process plus the current memory tier size"""
+        with self.lock:
+            stats = dict(self.stats, memory_entries=len(self.memory), memory_bytes=self.memory_bytes)
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = round(hits / lookups, 3) if lookups else 0.0
+        return stats
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Bridge Client for CCDK i124q
+=======================================
+
+Thin client for the resident bridge started with
+``thinkchain-bridge.py serve``. It imports nothing but the standard
+library basics, so hooks can call tools without paying for bridge
+start-up, tool discovery or config parsing on every invocation.
+
+Protocol: a Unix stream socket carrying frames of a 4-byte big-endian
+length followed by a UTF-8 JSON object. Each request frame gets one
+response frame, except ``stream``, which gets one frame per event up to
+and including the ``end`` event. A connection may carry many requests.
+
+    client = BridgeClient()
+    if client.connect():
+        print(client.execute("echo", {"text": "hi"}))
+
+Hooks can also run it directly:
+
+    python3 integrations/thinkchain_client.py execute --tool echo --args '{"text": "hi"}'
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import sys
+import json
+import socket
+import struct
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator
+
+# Same defaults as thinkchain-bridge.py
+THINKCHAIN_DIR = Path(os.environ.get("THINKCHAIN_DIR", "C:/Users/wtyle/thinkchain"))
+BRIDGE_CACHE_DIR = Path(os.environ.get("THINKCHAIN_BRIDGE_CACHE", THINKCHAIN_DIR / ".bridge_cache"))
+BRIDGE_SOCKET = Path(os.environ.get("THINKCHAIN_BRIDGE_SOCKET", BRIDGE_CACHE_DIR / "bridge.sock"))
+
+MAX_FRAME = 256 * 1024 * 1024
+_LENGTH = struct.Struct("!I")
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    payload = json.dumps(message, separators=(",", ":"), default=str).encode("utf-8")
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def recv_frame(stream) -> Dict[str, Any]:
+    """Read one frame from a binary file object; raises EOFError when the peer closed"""
+    header = stream.read(_LENGTH.size)
+    if len(header) < _LENGTH.size:
+        raise EOFError("connection closed")
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"frame of {length} bytes exceeds the {MAX_FRAME} byte limit")
+    payload = stream.read(length)
+    if len(payload) < length:
+        raise EOFError("connection closed mid-frame")
+    return json.loads(payload)
+
+
+class BridgeClient:
+    """Blocking client for the resident ThinkChain bridge"""
+
+    def __init__(self, socket_path: Path = BRIDGE_SOCKET, timeout: Optional[float] = None):
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+        self.sock: Optional[socket.socket] = None
+        self.reader = None
+
+    def connect(self) -> bool:
+        """Connect to the daemon; False when it is not running"""
+        if self.sock is not None:
+            return True
+        if not hasattr(socket, "AF_UNIX") or not self.socket_path.exists():
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            return False
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+        return True
+
+    def _send(self, message: Dict[str, Any]):
+        if not self.connect():
+            raise ConnectionError(f"ThinkChain bridge daemon is not running on {self.socket_path}")
+        try:
+            self.sock.sendall(encode_frame(message))
+        except OSError:
+            self.close()
+            raise
+
+    def _recv(self) -> Dict[str, Any]:
+        try:
+            return recv_frame(self.reader)
+        except (OSError, EOFError):
+            self.close()
+            raise ConnectionError("ThinkChain bridge daemon closed the connection")
+
+    def request(self, op: str, **fields) -> Dict[str, Any]:
+        self._send(dict(fields, op=op))
+        return self._recv()
+
+    def ping(self) -> Dict[str, Any]:
+        return self.request("ping")
+
+    def list_tools(self) -> List[Dict[str, Any]]:
+        return self.request("list")["tools"]
+
+    def execute(self, tool: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.request("execute", tool=tool, args=args or {})
+
+    def execute_many(self, calls: List[Dict[str, Any]], max_concurrency: int = 8,
+                     timeout: Optional[float] = 60.0) -> List[Dict[str, Any]]:
+        return self.request("execute_many", calls=calls, concurrency=max_concurrency, timeout=timeout)["results"]
+
+    def stream(self, tool: str, args: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield stream events as the daemon forwards them"""
+        self._send({"op": "stream", "tool": tool, "args": args or {}})
+        while True:
+            event = self._recv()
+            yield event
+            if event.get("event") == "end":
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return self.request("stats")
+
+    def shutdown(self) -> Dict[str, Any]:
+        return self.request("shutdown")
+
+    def close(self):
+        if self.sock is not None:
+            self.reader.close()
+            self.sock.close()
+            self.sock = None
+            self.reader = None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Client for the resident ThinkChain bridge")
+    parser.add_argument("action", choices=["ping", "list", "execute", "stream", "stats"])
+    parser.add_argument("--tool", help="Tool name for execute/stream")
+    parser.add_argument("--args", help="Tool arguments as JSON")
+    args = parser.parse_args()
+
+    client = BridgeClient()
+    if not client.connect():
+        print(json.dumps({"success": False, "error": f"ThinkChain bridge daemon is not running on {client.socket_path}"}))
+        sys.exit(2)
+
+    tool_args = json.loads(args.args) if args.args else {}
+    if args.action == "execute" and args.tool:
+        result = client.execute(args.tool, tool_args)
+        print(json.dumps(result))
+        sys.exit(0 if result.get("success") else 1)
+    elif args.action == "stream" and args.tool:
+        for event in client.stream(args.tool, tool_args):
+            sys.stdout.write(json.dumps(event) + "\n")
+            sys.stdout.flush()
+    elif args.action == "list":
+        print(json.dumps(client.list_tools()))
+    elif args.action == "stats":
+        print(json.dumps(client.stats()))
+    else:
+        print(json.dumps(client.ping()))
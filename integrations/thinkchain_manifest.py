@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Manifest for CCDK i124q
+=======================================
+
+Persistent discovery cache for the ThinkChain bridge.
+
+Each tool file in the ThinkChain ``tools/`` directory is recorded with its
+mtime, size and sha256 together with the tools it defines (name, class,
+description, input schema and the schema compiled to validator source). On
+startup only files whose stat or content changed are imported again;
+everything else is served from the manifest.
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import re
+import sys
+import json
+import inspect
+import hashlib
+import tempfile
+import importlib
+import importlib.util
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from thinkchain_schema import compile_schema, load_validator
+
+MANIFEST_VERSION = 4
+
+# Files in tools/ that never define tools themselves
+SKIP_FILES = {"__init__.py", "base.py"}
+
+
+def file_sha256(path: Path) -> str:
+    """Return the sha256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_write_json(path: Path, data: Any):
+    """Write JSON to path via a temp file in the same directory + rename"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _is_tool_class(obj: Any, module_name: str) -> bool:
+    """True for concrete tool classes defined in the given module"""
+    if not inspect.isclass(obj) or obj.__module__ != module_name:
+        return False
+    if inspect.isabstract(obj) or not callable(getattr(obj, "execute", None)):
+        return False
+    try:
+        from tools.base import BaseTool
+        return issubclass(obj, BaseTool) and obj is not BaseTool
+    except ImportError:
+        return True
+
+
+def describe_tool_class(tool_class: type) -> Dict[str, Any]:
+    """Extract name, description, input schema and execution/caching settings from a tool class"""
+    info = {
+        "class": tool_class.__name__,
+        "name": tool_class.__name__,
+        "description": (tool_class.__doc__ or "No description").strip(),
+        "input_schema": {},
+        "execution": getattr(tool_class, "execution", "inprocess"),
+        "cpu_seconds": getattr(tool_class, "cpu_seconds", None),
+        "memory_mb": getattr(tool_class, "memory_mb", None),
+        "cacheable": bool(getattr(tool_class, "cacheable", False)),
+        "ttl": getattr(tool_class, "ttl", None),
+    }
+    try:
+        instance = tool_class()
+    except Exception:
+        instance = None
+    for key in ("name", "description", "input_schema"):
+        if instance is None:
+            break
+        try:
+            value = getattr(instance, key)
+        except Exception:
+            continue
+        if value:
+            info[key] = value
+
+    # Compiled once here; unsupported schemas leave the tool unvalidated
+    try:
+        info["validator"] = compile_schema(info["input_schema"])
+    except (ValueError, TypeError, re.error) as e:
+        info["validator"] = None
+        print(f"Cannot compile input schema of tool {info['name']}: {e}")
+    return info
+
+
+def _exec_module_version(module_name: str, path: Path):
+    """Execute ``path`` as a fresh module named ``module_name`` and publish it in sys.modules"""
+    package = module_name.rpartition(".")[0]
+    if package:
+        importlib.import_module(package)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    previous = sys.modules.get(module_name)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        if previous is not None:
+            sys.modules[module_name] = previous
+        else:
+            sys.modules.pop(module_name, None)
+        raise
+    return module
+
+
+class ToolManifest:
+    """On-disk cache of discovered ThinkChain tools keyed by file mtime and hash"""
+
+    def __init__(self, tools_dir: Path, path: Path):
+        self.tools_dir = Path(tools_dir)
+        self.path = Path(path)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+
+    def load(self) -> bool:
+        """Load the manifest from disk; a missing or stale manifest is ignored"""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != MANIFEST_VERSION or data.get("tools_dir") != str(self.tools_dir):
+            return False
+        self.files = data.get("files", {})
+        return True
+
+    def save(self):
+        """Persist the manifest if anything changed since the last save"""
+        if not self.dirty:
+            return
+        atomic_write_json(self.path, {
+            "version": MANIFEST_VERSION,
+            "tools_dir": str(self.tools_dir),
+            "files": self.files,
+        })
+        self.dirty = False
+
+    def tool_files(self) -> List[Path]:
+        """All candidate tool files in the tools directory"""
+        if not self.tools_dir.exists():
+            return []
+        return sorted(p for p in self.tools_dir.glob("*.py") if p.name not in SKIP_FILES)
+
+    def refresh(self) -> Dict[str, type]:
+        """
+        Bring the manifest up to date with the tools directory.
+
+        Unchanged files are not read, files whose mtime moved but whose
+        content hash did not are not imported, and deleted files are dropped.
+        Returns the tool classes imported while scanning changed files.
+        """
+        loaded = {}
+        seen = set()
+        for tool_file in self.tool_files():
+            seen.add(tool_file.name)
+            loaded.update(self.refresh_file(tool_file))
+        for file_name in list(self.files):
+            if file_name not in seen:
+                del self.files[file_name]
+                self.dirty = True
+        self.save()
+        return loaded
+
+    def refresh_file(self, tool_file: Path) -> Dict[str, type]:
+        """Rescan a single tool file if it changed; returns newly imported classes"""
+        tool_file = Path(tool_file)
+        try:
+            stat = tool_file.stat()
+        except OSError:
+            if self.files.pop(tool_file.name, None) is not None:
+                self.dirty = True
+            return {}
+
+        entry = self.files.get(tool_file.name)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return {}
+
+        sha256 = file_sha256(tool_file)
+        if entry and entry["sha256"] == sha256:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self.dirty = True
+            return {}
+
+        classes = self.import_file(tool_file)
+        self.files[tool_file.name] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "tools": [describe_tool_class(cls) for cls in classes],
+        }
+        self.dirty = True
+        return {info["name"]: cls for info, cls in zip(self.files[tool_file.name]["tools"], classes)}
+
+    def import_file(self, tool_file: Path) -> List[type]:
+        """
+        Import the current version of a tool file and return its tool classes.
+
+        Each call executes the file into a new module object instead of
+        reloading the existing one in place, so classes of the previous
+        version (still used by in-flight calls) keep their own globals.
+        """
+        module_name = f"tools.{tool_file.stem}"
+        try:
+            module = _exec_module_version(module_name, tool_file)
+        except Exception as e:
+            print(f"Failed to import tool file {tool_file.name}: {e}")
+            return []
+        return [obj for _, obj in inspect.getmembers(module) if _is_tool_class(obj, module_name)]
+
+    def tools(self) -> Dict[str, Dict[str, Any]]:
+        """Map of tool name -> manifest entry (with the defining file)"""
+        result = {}
+        for file_name, entry in self.files.items():
+            for info in entry["tools"]:
+                result[info["name"]] = dict(info, file=file_name, sha256=entry["sha256"])
+        return result
+
+    def refresh_tool(self, tool_name: str) -> Optional[Dict[str, type]]:
+        """
+        Revalidate only the file that defines ``tool_name``.
+
+        Returns None when the tool is not in the manifest, so the caller
+        can fall back to a full ``refresh()``.
+        """
+        for file_name, entry in self.files.items():
+            if any(info["name"] == tool_name for info in entry["tools"]):
+                loaded = self.refresh_file(self.tools_dir / file_name)
+                self.save()
+                return loaded
+        return None
+
+    def load_class(self, file_name: str, class_name: str) -> Optional[type]:
+        """Import a tool module recorded in the manifest and return the class"""
+        module_name = f"tools.{Path(file_name).stem}"
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        return getattr(module, class_name, None)
+
+
+class LazyTool:
+    """
+    Manifest-backed stand-in for a tool class.
+
+    Carries the name, description and input schema recorded in the manifest
+    and only imports the tool module the first time the class is needed.
+    Calling the proxy instantiates the real tool class.
+    """
+
+    def __init__(self, manifest: ToolManifest, info: Dict[str, Any], tool_class: Optional[type] = None):
+        self.manifest = manifest
+        self.name = info["name"]
+        self.description = info.get("description", "No description")
+        self.input_schema = info.get("input_schema", {})
+        self.file = info["file"]
+        self.class_name = info["class"]
+        self.sha256 = info["sha256"]
+        self.execution = info.get("execution", "inprocess")
+        self.cpu_seconds = info.get("cpu_seconds")
+        self.memory_mb = info.get("memory_mb")
+        self.cacheable = info.get("cacheable", False)
+        self.ttl = info.get("ttl")
+        self.generation = 0  # set by ToolRegistry when published
+        self.validator_source = info.get("validator")
+        self._validator = None
+        self._tool_class = tool_class
+
+    @property
+    def loaded(self) -> bool:
+        return self._tool_class is not None
+
+    def load(self) -> type:
+        """Import the tool module (once) and return the real class"""
+        if self._tool_class is None:
+            tool_class = self.manifest.load_class(self.file, self.class_name)
+            if tool_class is None:
+                raise ImportError(f"Class {self.class_name} not found in {self.file}")
+            self._tool_class = tool_class
+        return self._tool_class
+
+    def validate(self, kwargs: Dict[str, Any]):
+        """Check call arguments against the input schema; raises SchemaValidationError"""
+        if self.validator_source is None:
+            return
+        if self._validator is None:
+            self._validator = load_validator(self.validator_source)
+        self._validator(kwargs)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "lazy"
+        return f"<LazyTool {self.name} ({self.file}:{self.class_name}, {state})>"
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Instance Pool for CCDK i124q
+============================================
+
+Opt-in reuse of tool instances across ``execute_local_tool`` calls.
+
+Tools that do expensive work in ``__init__`` (loading models, parsing
+configs, opening clients) can declare themselves poolable:
+
+    class MyTool(BaseTool):
+        reusable = True        # instances may be reused between calls
+        thread_safe = False    # one caller per instance at a time
+        pool_size = 4          # optional, max idle instances kept
+        pool_idle_ttl = 300    # optional, seconds before an idle instance is evicted
+
+        def reset(self):       # optional health reset between uses
+            ...                # return False or raise to discard the instance
+
+A ``thread_safe`` tool shares a single instance among all callers. An
+exception raised by one caller does not discard it; only an explicit
+``release(..., healthy=False)`` retires it, and it is closed once the
+last caller still using it releases it. Tools that declare nothing get
+a fresh instance per call, as before.
+
+Author: CCDK i124q Integration Team
+"""
+
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TTL = 300.0
+
+
+def _close_instance(instance: Any):
+    """Give a discarded instance the chance to release its resources"""
+    close = getattr(instance, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
+
+
+class _ToolPool:
+    """Idle instances of one tool class"""
+
+    def __init__(self, tool_class: type):
+        self.tool_class = tool_class
+        self.thread_safe = bool(getattr(tool_class, "thread_safe", False))
+        self.max_size = int(getattr(tool_class, "pool_size", DEFAULT_POOL_SIZE))
+        self.idle_ttl = float(getattr(tool_class, "pool_idle_ttl", DEFAULT_IDLE_TTL))
+        self.idle = deque()  # (instance, released_at)
+        self.shared = None
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "discarded": 0}
+
+    def evict_idle(self, now: float):
+        while self.idle and now - self.idle[0][1] > self.idle_ttl:
+            instance, _ = self.idle.popleft()
+            _close_instance(instance)
+            self.stats["evictions"] += 1
+
+
+class ToolInstancePool:
+    """Per-tool pools of reusable tool instances with hit/miss metrics"""
+
+    def __init__(self):
+        self.pools: Dict[str, _ToolPool] = {}
+        # id(shared instance) -> callers using it; kept after the instance is
+        # retired or its pool replaced, so it is closed by the last caller
+        self.shared_leases: Dict[int, int] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def is_poolable(tool_class: type) -> bool:
+        return bool(getattr(tool_class, "reusable", False) or getattr(tool_class, "thread_safe", False))
+
+    @staticmethod
+    def is_shared(tool_class: type) -> bool:
+        return bool(getattr(tool_class, "thread_safe", False))
+
+    def _drop_pool(self, pool: _ToolPool) -> list:
+        """Detach a pool's instances; returns those nobody is using, to be closed"""
+        unused = [instance for instance, _ in pool.idle]
+        pool.idle.clear()
+        if pool.shared is not None:
+            if not self.shared_leases.get(id(pool.shared)):
+                self.shared_leases.pop(id(pool.shared), None)
+                unused.append(pool.shared)
+            pool.shared = None
+        return unused
+
+    def _pool_for(self, tool_name: str, tool_class: type) -> _ToolPool:
+        pool = self.pools.get(tool_name)
+        if pool is None or pool.tool_class is not tool_class:
+            # New tool, or the class was reloaded: drop instances of the old class
+            if pool is not None:
+                for instance in self._drop_pool(pool):
+                    _close_instance(instance)
+            pool = self.pools[tool_name] = _ToolPool(tool_class)
+        return pool
+
+    def acquire(self, tool_name: str, tool_class: type) -> Any:
+        """Check out an instance, creating one on a pool miss"""
+        if not self.is_poolable(tool_class):
+            return tool_class()
+
+        with self.lock:
+            pool = self._pool_for(tool_name, tool_class)
+            pool.evict_idle(time.monotonic())
+            if pool.thread_safe and pool.shared is not None:
+                pool.stats["hits"] += 1
+                self.shared_leases[id(pool.shared)] += 1
+                return pool.shared
+            if pool.idle:
+                pool.stats["hits"] += 1
+                return pool.idle.pop()[0]
+            pool.stats["misses"] += 1
+
+        instance = tool_class()
+        if not pool.thread_safe:
+            return instance
+        with self.lock:
+            shared = pool.shared
+            if shared is None:
+                pool.shared = shared = instance
+                self.shared_leases[id(instance)] = 0
+            else:
+                pool.stats["discarded"] += 1  # another caller created it first
+            self.shared_leases[id(shared)] += 1
+        if shared is not instance:
+            _close_instance(instance)
+        return shared
+
+    def release(self, tool_name: str, instance: Any, healthy: bool = True):
+        """
+        Return an instance after use; unhealthy or surplus instances are discarded.
+
+        For a shared thread-safe instance, ``healthy=False`` retires it:
+        later callers get a new instance, and the retired one is closed
+        when the last caller still using it releases it.
+        """
+        tool_class = type(instance)
+        if not self.is_poolable(tool_class):
+            return
+
+        # Shared thread-safe instances are never reset under other callers
+        if healthy and not self.is_shared(tool_class):
+            reset = getattr(instance, "reset", None)
+            if callable(reset):
+                try:
+                    healthy = reset() is not False
+                except Exception:
+                    healthy = False
+
+        with self.lock:
+            pool = self.pools.get(tool_name)
+            if id(instance) in self.shared_leases:
+                in_use = pool is not None and pool.shared is instance
+                if in_use and not healthy:
+                    pool.shared = None
+                    pool.stats["discarded"] += 1
+                    in_use = False
+                self.shared_leases[id(instance)] -= 1
+                if in_use or self.shared_leases[id(instance)] > 0:
+                    return
+                del self.shared_leases[id(instance)]
+            elif pool is None or pool.tool_class is not tool_class:
+                pass  # the pool was cleared or the class reloaded
+            elif healthy and len(pool.idle) < pool.max_size:
+                pool.idle.append((instance, time.monotonic()))
+                return
+            else:
+                pool.stats["discarded"] += 1
+        _close_instance(instance)
+
+    @contextmanager
+    def lease(self, tool_name: str, tool_class: type):
+        """
+        Context manager around acquire/release.
+
+        An exception marks a per-caller instance unhealthy; a shared
+        thread-safe instance stays in place for its other callers.
+        """
+        instance = self.acquire(tool_name, tool_class)
+        try:
+            yield instance
+        except Exception:
+            self.release(tool_name, instance, healthy=self.is_shared(tool_class))
+            raise
+        self.release(tool_name, instance)
+
+    def evict_idle(self):
+        """Evict idle instances older than each tool's TTL"""
+        with self.lock:
+            now = time.monotonic()
+            for pool in self.pools.values():
+                pool.evict_idle(now)
+
+    def clear(self, tool_name: Optional[str] = None):
+        """Drop pooled instances for one tool, or for every tool"""
+        unused = []
+        with self.lock:
+            names = [tool_name] if tool_name else list(self.pools)
+            for name in names:
+                pool = self.pools.pop(name, None)
+                if pool is not None:
+                    unused.extend(self._drop_pool(pool))
+        for instance in unused:
+            _close_instance(instance)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-tool and total hit/miss/eviction counters"""
+        with self.lock:
+            tools = {}
+            totals = {"hits": 0, "misses": 0, "evictions": 0, "discarded": 0}
+            for name, pool in self.pools.items():
+                tools[name] = dict(pool.stats, idle=len(pool.idle), shared=pool.shared is not None)
+                for key in totals:
+                    totals[key] += pool.stats[key]
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate"] = round(totals["hits"] / lookups, 3) if lookups else 0.0
+        return {"tools": tools, "totals": totals}
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Registry for CCDK i124q
+=======================================
+
+Copy-on-write map of tool name -> ``LazyTool`` for the ThinkChain bridge.
+
+Readers take the current snapshot (an immutable mapping) without locking
+and keep using it for the whole call. A reload builds a new snapshot in
+which only the added, changed or removed tools differ, and publishes it
+with a single reference swap. Calls already in flight keep the proxy and
+class from the snapshot they started with; new calls see the new
+version. Every swap bumps a generation number, and each entry records
+the generation in which it was last replaced.
+
+Tool modules are never reloaded in place: the manifest executes each new
+version of a tool file into a fresh module object, so classes from the
+old version keep their own module globals.
+
+Author: CCDK i124q Integration Team
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+
+class ToolRegistry:
+    """Atomically swapped snapshots of the discovered tools"""
+
+    def __init__(self):
+        self._entries: Mapping[str, Any] = MappingProxyType({})
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    @property
+    def entries(self) -> Mapping[str, Any]:
+        """The current snapshot; it never changes after being returned"""
+        return self._entries
+
+    def swap(self, changes: Dict[str, Optional[Any]]) -> int:
+        """Publish a snapshot with ``changes`` applied (None removes a tool); returns the generation"""
+        with self.lock:
+            if not changes:
+                return self.generation
+            entries = dict(self._entries)
+            self.generation += 1
+            for name, proxy in changes.items():
+                if proxy is None:
+                    entries.pop(name, None)
+                else:
+                    proxy.generation = self.generation
+                    entries[name] = proxy
+            self._entries = MappingProxyType(entries)
+            return self.generation
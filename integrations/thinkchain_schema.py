@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Argument Validation for CCDK i124q
+=============================================
+
+Compiles a tool's JSON Schema ``input_schema`` into Python source for a
+validator function. The source is generated once at discovery time and
+stored in the tool manifest; each bridge process turns it into a function
+the first time the tool is called. A bad call is then rejected before the
+tool is imported, instantiated or sent to a worker.
+
+Supported keywords: type, enum, const, properties, required,
+additionalProperties, items, minItems, maxItems, uniqueItems, minLength,
+maxLength, pattern, minimum, maximum, exclusiveMinimum, exclusiveMaximum,
+multipleOf, allOf, anyOf, oneOf, not. Other keywords are ignored, so
+schemas using them still validate everything that is supported.
+
+    source = compile_schema({"type": "object", "required": ["text"],
+                             "properties": {"text": {"type": "string"}}})
+    validate = load_validator(source)
+    validate({"text": 1})   # SchemaValidationError: args.text: must be string
+
+Author: CCDK i124q Integration Team
+"""
+
+import re
+from typing import Dict, List, Any, Callable
+
+TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, (list, tuple))",
+    "null": "{v} is None",
+}
+
+_validators: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+
+
+class SchemaValidationError(ValueError):
+    """Arguments do not match the tool's input schema"""
+
+    def __init__(self, path: str, message: str):
+        super().__init__(f"{path}: {message}")
+        self.path = path
+
+
+class _Compiler:
+    """Generates one Python function per schema node that needs its own scope"""
+
+    def __init__(self):
+        self.functions: List[List[str]] = []
+        self.constants: List[str] = []
+        self.counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, expression: str) -> str:
+        name = self._name("_c")
+        self.constants.append(f"{name} = {expression}")
+        return name
+
+    def function(self, schema: Any) -> str:
+        """Compile ``schema`` into ``def _vN(data, path)`` and return its name"""
+        name = self._name("_v")
+        lines = [f"def {name}(data, path):"]
+        self.functions.append(lines)
+        body: List[str] = []
+        self.emit(schema, "data", "path", body, 1)
+        lines.extend(body or ["    pass"])
+        return name
+
+    def emit(self, schema: Any, v: str, path: str, out: List[str], depth: int):
+        pad = "    " * depth
+
+        def fail(message: str, at: str = path):
+            return f"{pad}    raise SchemaValidationError({at}, {message!r})"
+
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            out.append(f"{pad}raise SchemaValidationError({path}, 'is not allowed')")
+            return
+        if not isinstance(schema, dict):
+            raise ValueError(f"Invalid schema node: {schema!r}")
+
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else list(types)
+            unknown = [t for t in types if t not in TYPE_CHECKS]
+            if unknown:
+                raise ValueError(f"Unknown type {unknown[0]!r}")
+            check = " or ".join(TYPE_CHECKS[t].format(v=v) for t in types)
+            out.append(f"{pad}if not ({check}):")
+            out.append(fail(f"must be {' or '.join(types)}"))
+
+        if "const" in schema:
+            out.append(f"{pad}if {v} != {self.constant(repr(schema['const']))}:")
+            out.append(fail(f"must be {schema['const']!r}"))
+        if "enum" in schema:
+            out.append(f"{pad}if {v} not in {self.constant(repr(list(schema['enum'])))}:")
+            out.append(fail(f"must be one of {list(schema['enum'])!r}"))
+
+        # String keywords
+        if any(k in schema for k in ("minLength", "maxLength", "pattern")):
+            out.append(f"{pad}if isinstance({v}, str):")
+            if "minLength" in schema:
+                out.append(f"{pad}    if len({v}) < {int(schema['minLength'])}:")
+                out.append("    " + fail(f"must be at least {schema['minLength']} characters"))
+            if "maxLength" in schema:
+                out.append(f"{pad}    if len({v}) > {int(schema['maxLength'])}:")
+                out.append("    " + fail(f"must be at most {schema['maxLength']} characters"))
+            if "pattern" in schema:
+                re.compile(schema["pattern"])  # a bad pattern fails here, at discovery time
+                regex = self.constant(f"re.compile({schema['pattern']!r})")
+                out.append(f"{pad}    if not {regex}.search({v}):")
+                out.append("    " + fail(f"must match {schema['pattern']!r}"))
+
+        # Numeric keywords; draft-4 spells exclusive bounds as booleans next to minimum/maximum
+        bounds = []
+        for keyword, exclusive, op, strict_op, sign in (("minimum", "exclusiveMinimum", "<", "<=", ">"),
+                                                         ("maximum", "exclusiveMaximum", ">", ">=", "<")):
+            limit, flag = schema.get(keyword), schema.get(exclusive)
+            if _is_number(limit):
+                if flag is True:
+                    bounds.append((limit, strict_op, f"must be {sign} {limit}"))
+                else:
+                    bounds.append((limit, op, f"must be {sign}= {limit}"))
+            if _is_number(flag):
+                bounds.append((flag, strict_op, f"must be {sign} {flag}"))
+        if "multipleOf" in schema and not (_is_number(schema["multipleOf"]) and schema["multipleOf"] > 0):
+            raise ValueError(f"multipleOf must be a number greater than 0, not {schema['multipleOf']!r}")
+        if bounds or "multipleOf" in schema:
+            out.append(f"{pad}if isinstance({v}, (int, float)) and not isinstance({v}, bool):")
+            for limit, op, message in bounds:
+                out.append(f"{pad}    if {v} {op} {limit!r}:")
+                out.append("    " + fail(message))
+            if "multipleOf" in schema:
+                out.append(f"{pad}    if abs({v} / {schema['multipleOf']!r} - round({v} / {schema['multipleOf']!r})) > 1e-9:")
+                out.append("    " + fail(f"must be a multiple of {schema['multipleOf']}"))
+
+        # Object keywords
+        properties = schema.get("properties") or {}
+        required = schema.get("required") or []
+        additional = schema.get("additionalProperties", True)
+        if properties or required or additional is not True:
+            out.append(f"{pad}if isinstance({v}, dict):")
+            for key in required:
+                out.append(f"{pad}    if {key!r} not in {v}:")
+                out.append("    " + fail("is a required argument", f"{path} + {'.' + key!r}"))
+            for key, subschema in properties.items():
+                if subschema is True or subschema == {}:
+                    continue
+                item = self._name("_p")
+                body: List[str] = []
+                self.emit(subschema, item, f"{path} + {'.' + key!r}", body, depth + 2)
+                if body:
+                    out.append(f"{pad}    if {key!r} in {v}:")
+                    out.append(f"{pad}        {item} = {v}[{key!r}]")
+                    out.extend(body)
+            if additional is not True:
+                key_var = self._name("_k")
+                known = self.constant(f"frozenset({sorted(properties)!r})")
+                out.append(f"{pad}    for {key_var} in {v}:")
+                out.append(f"{pad}        if {key_var} not in {known}:")
+                key_path = f"{path} + '.' + str({key_var})"
+                if additional is False:
+                    out.append(f"{pad}            raise SchemaValidationError({key_path}, 'is not an accepted argument')")
+                else:
+                    out.append(f"{pad}            {self.function(additional)}({v}[{key_var}], {key_path})")
+
+        # Array keywords
+        items = schema.get("items")
+        array_keys = ("minItems", "maxItems", "uniqueItems")
+        if isinstance(items, dict) and items or any(k in schema for k in array_keys):
+            out.append(f"{pad}if isinstance({v}, (list, tuple)):")
+            if "minItems" in schema:
+                out.append(f"{pad}    if len({v}) < {int(schema['minItems'])}:")
+                out.append("    " + fail(f"must have at least {schema['minItems']} items"))
+            if "maxItems" in schema:
+                out.append(f"{pad}    if len({v}) > {int(schema['maxItems'])}:")
+                out.append("    " + fail(f"must have at most {schema['maxItems']} items"))
+            if schema.get("uniqueItems"):
+                out.append(f"{pad}    if len(set(map(repr, {v}))) != len({v}):")
+                out.append("    " + fail("must not contain duplicate items"))
+            if isinstance(items, dict) and items:
+                index, item = self._name("_i"), self._name("_e")
+                body = []
+                self.emit(items, item, f"{path} + '[' + str({index}) + ']'", body, depth + 2)
+                if body:
+                    out.append(f"{pad}    for {index}, {item} in enumerate({v}):")
+                    out.extend(body)
+
+        # Combinators
+        for subschema in schema.get("allOf", []):
+            self.emit(subschema, v, path, out, depth)
+        for keyword in ("anyOf", "oneOf"):
+            if keyword in schema:
+                if not isinstance(schema[keyword], list) or not schema[keyword]:
+                    raise ValueError(f"{keyword} must be a non-empty list, not {schema[keyword]!r}")
+                functions = ", ".join(self.function(s) for s in schema[keyword]) + ","
+                matched = self._name("_m")
+                out.append(f"{pad}{matched} = _count_matches(({functions}), {v}, {path})")
+                condition = f"{matched} == 0" if keyword == "anyOf" else f"{matched} != 1"
+                message = "must match at least one schema" if keyword == "anyOf" else "must match exactly one schema"
+                out.append(f"{pad}if {condition}:")
+                out.append(fail(message))
+        if "not" in schema:
+            out.append(f"{pad}if _count_matches(({self.function(schema['not'])},), {v}, {path}):")
+            out.append(fail("must not match the excluded schema"))
+
+
+def compile_schema(schema: Any) -> str:
+    """Python source defining ``validate(args)`` for a tool's input schema"""
+    compiler = _Compiler()
+    root = compiler.function(schema if schema not in (None, {}) else True)
+    lines = list(compiler.constants)
+    for function in compiler.functions:
+        lines.extend(function)
+    lines.append("def validate(args):")
+    lines.append(f"    {root}(args, 'args')")
+    source = "\n".join(lines) + "\n"
+    # Fail at discovery, not on every later call that loads the validator
+    try:
+        compile(source, "<tool-schema>", "exec")
+    except SyntaxError as e:
+        raise ValueError(f"Schema compiles to invalid validator source: {e}") from e
+    return source
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _count_matches(functions, value, path) -> int:
+    matches = 0
+    for function in functions:
+        try:
+            function(value, path)
+            matches += 1
+        except SchemaValidationError:
+            pass
+    return matches
+
+
+def load_validator(source: str) -> Callable[[Dict[str, Any]], None]:
+    """Turn compiled source into its ``validate`` function (memoized per source)"""
+    validate = _validators.get(source)
+    if validate is None:
+        namespace = {"re": re, "SchemaValidationError": SchemaValidationError, "_count_matches": _count_matches}
+        exec(compile(source, "<tool-schema>", "exec"), namespace)
+        validate = _validators[source] = namespace["validate"]
+    return validate
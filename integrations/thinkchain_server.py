@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Bridge Socket Server for CCDK i124q
+==============================================
+
+Socket side of ``thinkchain-bridge.py serve``. It serves a live
+``ThinkChainBridge`` on a Unix socket using the frame protocol in
+thinkchain_client. Each connection gets its own thread; a connection can
+carry any number of requests.
+
+It is kept out of thinkchain-bridge.py so that one-shot CLI calls do not
+import ``socketserver``.
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import errno
+import signal
+import threading
+import socketserver
+from pathlib import Path
+from typing import Dict, Any
+
+from thinkchain_client import BridgeClient, encode_frame, recv_frame
+
+
+def unix_sockets_supported() -> bool:
+    return hasattr(socketserver, "ThreadingUnixStreamServer")
+
+
+class BridgeRequestHandler(socketserver.StreamRequestHandler):
+    """Serves framed JSON requests (see thinkchain_client) on one connection"""
+
+    def handle(self):
+        bridge = self.server.bridge
+        while True:
+            try:
+                request = recv_frame(self.rfile)
+            except (EOFError, OSError, ValueError):
+                return
+            try:
+                if request.get("op") == "stream":
+                    self.stream(bridge, request)
+                    continue
+                self.wfile.write(encode_frame(self.dispatch(bridge, request)))
+            except OSError:
+                return  # client went away
+
+    def stream(self, bridge, request: Dict[str, Any]):
+        """Write a tool's stream events; a failure inside the bridge ends the stream with an error event"""
+        try:
+            events = bridge.stream_local_tool(request.get("tool", ""), **(request.get("args") or {}))
+            for event in events:
+                self.wfile.write(encode_frame(event))
+        except OSError:
+            raise  # client went away
+        except Exception as e:
+            self.wfile.write(encode_frame({"event": "end", "success": False, "error": str(e)}))
+
+    def dispatch(self, bridge, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        try:
+            if op == "execute":
+                return bridge.execute_local_tool(request.get("tool", ""), **(request.get("args") or {}))
+            if op == "execute_many":
+                results = bridge.execute_many(request.get("calls", []), request.get("concurrency", 8),
+                                              request.get("timeout", 60.0))
+                return {"success": True, "results": results}
+            if op == "list":
+                return {"success": True, "tools": bridge.list_available_tools()}
+            if op == "stats":
+                return dict(bridge.get_pool_stats(), generation=bridge.registry.generation)
+            if op == "ping":
+                return {"ok": True, "pid": os.getpid(), "generation": bridge.registry.generation}
+            if op == "shutdown":
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return {"ok": True}
+            return {"success": False, "error": f"Unknown op '{op}'"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+
+def serve(bridge, socket_path: Path):
+    """
+    Serve ``bridge`` on ``socket_path`` until SIGTERM, Ctrl+C or a shutdown request.
+
+    Raises OSError (EADDRINUSE) when a live daemon already answers on the
+    socket; a socket file left behind by a dead one is replaced.
+    """
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    probe = BridgeClient(socket_path, timeout=5)
+    if probe.connect():
+        probe.close()
+        raise OSError(errno.EADDRINUSE, f"A ThinkChain bridge is already listening on {socket_path}")
+    if socket_path.exists():
+        socket_path.unlink()
+    server = socketserver.ThreadingUnixStreamServer(str(socket_path), BridgeRequestHandler)
+    server.daemon_threads = True
+    server.bridge = bridge
+    os.chmod(socket_path, 0o600)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    print(f"🔌 ThinkChain bridge listening on {socket_path} ({len(bridge.tools_cache)} tools)", flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            socket_path.unlink()
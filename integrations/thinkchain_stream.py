@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Streaming for CCDK i124q
+========================================
+
+Streaming protocol for ThinkChain tools.
+
+A tool streams by making ``execute`` a generator (or an async generator)
+that yields partial results as they are produced:
+
+    class LogTailTool(BaseTool):
+        def execute(self, path: str):
+            with open(path) as f:
+                for line in f:
+                    yield line
+
+``ThinkChainBridge.stream_local_tool`` turns a call into a sequence of
+events that are forwarded as soon as they exist, so the first byte does
+not wait for the tool to finish and the output is never held in memory
+as a whole:
+
+    {"event": "start", "tool": "log_tail"}
+    {"event": "partial", "seq": 0, "data": "first line\\n"}
+    ...
+    {"event": "end", "success": true, "chunks": 1200, "elapsed_ms": 84.2}
+
+Tools that return a plain value produce ``start`` and an ``end`` event
+carrying ``result``; failures end with ``success: false`` and ``error``.
+Events are written as newline-delimited JSON or as Server-Sent Events.
+
+Author: CCDK i124q Integration Team
+"""
+
+import json
+import inspect
+from typing import Dict, Any, Iterator
+
+
+def is_stream(output: Any) -> bool:
+    """True when a tool's ``execute`` returned a (sync or async) generator"""
+    return inspect.isgenerator(output) or inspect.isasyncgen(output)
+
+
+def iter_tool_output(output: Any) -> Iterator[Any]:
+    """Iterate partial results of a generator or async generator, one at a time"""
+    if inspect.isgenerator(output):
+        yield from output
+        return
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(output.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(output.aclose())
+        loop.close()
+
+
+def collect_tool_output(output: Any) -> Any:
+    """Buffer a streamed output for callers that need one value (joined when all chunks are text)"""
+    chunks = list(iter_tool_output(output))
+    if chunks and all(isinstance(chunk, str) for chunk in chunks):
+        return "".join(chunks)
+    return chunks
+
+
+def encode_ndjson(event: Dict[str, Any]) -> str:
+    """One event as a newline-delimited JSON line"""
+    return json.dumps(event, default=str) + "\n"
+
+
+def encode_sse(event: Dict[str, Any]) -> str:
+    """One event as a Server-Sent Events message (``event:`` is the event type)"""
+    return f"event: {event.get('event', 'message')}\ndata: {json.dumps(event, default=str)}\n\n"
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Process Pool for CCDK i124q
+======================================
+
+Process-isolated execution for ThinkChain tools.
+
+Tools that declare ``execution = "process"`` run in a pool of warm worker
+processes instead of inside the bridge, so a CPU-heavy tool does not hold
+the bridge's GIL and a crashing tool only takes its worker down:
+
+    class ImageResizeTool(BaseTool):
+        execution = "process"   # default is "inprocess"
+        cpu_seconds = 10        # optional per-call CPU budget (RLIMIT_CPU)
+        memory_mb = 512         # optional per-call address-space budget (RLIMIT_AS)
+
+Workers are started up front with the process-mode tool modules already
+imported, are recycled after a fixed number of calls, and are replaced
+whenever one crashes, exceeds its budget or times out. Arguments and
+results are pickled with protocol 5; large ``bytes``/``bytearray`` values
+travel as out-of-band buffers instead of being copied into the pickle.
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import sys
+import queue
+import signal
+import struct
+import pickle
+import inspect
+import importlib
+import threading
+from typing import Dict, List, Any, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, budgets are not enforced
+    resource = None
+
+DEFAULT_MAX_CALLS_PER_WORKER = 200
+
+# bytes-like values at least this large are sent as out-of-band buffers
+OOB_THRESHOLD = 64 * 1024
+
+_COUNT = struct.Struct("!I")
+
+
+# =============================================================================
+# FRAMING (pickle protocol 5 with out-of-band buffers)
+# =============================================================================
+
+def _wrap_large_buffers(value: Any) -> Any:
+    """Mark large bytes-like values (also inside dicts/lists) for out-of-band transfer"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return pickle.PickleBuffer(value) if memoryview(value).nbytes >= OOB_THRESHOLD else value
+    if isinstance(value, dict):
+        return {k: _wrap_large_buffers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_wrap_large_buffers(v) for v in value]
+    return value
+
+
+def send_message(conn, message: Any):
+    """Send a message as a pickle-5 header frame plus one frame per out-of-band buffer"""
+    buffers = []
+    header = pickle.dumps(message, protocol=5, buffer_callback=buffers.append)
+    conn.send_bytes(_COUNT.pack(len(buffers)))
+    conn.send_bytes(header)
+    for buffer in buffers:
+        conn.send_bytes(buffer.raw())
+
+
+def recv_message(conn) -> Any:
+    """Receive a message written by ``send_message``"""
+    (count,) = _COUNT.unpack(conn.recv_bytes())
+    header = conn.recv_bytes()
+    buffers = [conn.recv_bytes() for _ in range(count)]
+    return pickle.loads(header, buffers=buffers)
+
+
+# =============================================================================
+# WORKER PROCESS
+# =============================================================================
+
+def _set_limit(kind: int, soft: int):
+    """Lower/raise a soft rlimit without touching the hard limit"""
+    _, hard = resource.getrlimit(kind)
+    if hard != resource.RLIM_INFINITY and (soft == resource.RLIM_INFINITY or soft > hard):
+        soft = hard
+    resource.setrlimit(kind, (soft, hard))
+
+
+def _apply_budget(cpu_seconds: Optional[float], memory_mb: Optional[int]):
+    """Apply per-call rlimits; RLIMIT_CPU is cumulative, so offset it by CPU already used"""
+    if resource is None:
+        return
+    if cpu_seconds:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        _set_limit(resource.RLIMIT_CPU, int(usage.ru_utime + usage.ru_stime + cpu_seconds) + 1)
+    else:
+        _set_limit(resource.RLIMIT_CPU, resource.RLIM_INFINITY)
+    _set_limit(resource.RLIMIT_AS, int(memory_mb) * 1024 * 1024 if memory_mb else resource.RLIM_INFINITY)
+
+
+def _worker_main(conn, sys_paths: List[str], preload: List[str]):
+    """Worker loop: import tool modules once, then serve execute requests until told to stop"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for path in reversed(sys_paths):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    from thinkchain_pool import ToolInstancePool
+    from thinkchain_stream import is_stream, collect_tool_output
+    instance_pool = ToolInstancePool()
+    module_hashes: Dict[str, str] = {}
+
+    for module_name in preload:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass  # reported on first call instead
+
+    while True:
+        try:
+            request = recv_message(conn)
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+
+        module_name = request["module"]
+        try:
+            # Reload the module when the tool file changed since it was imported
+            module = sys.modules.get(module_name)
+            if module is None:
+                module = importlib.import_module(module_name)
+            elif module_hashes.get(module_name, request["sha256"]) != request["sha256"]:
+                module = importlib.reload(module)
+            module_hashes[module_name] = request["sha256"]
+            tool_class = getattr(module, request["class"])
+
+            _apply_budget(request.get("cpu_seconds"), request.get("memory_mb"))
+            with instance_pool.lease(request["tool"], tool_class) as tool_instance:
+                result = tool_instance.execute(**request["kwargs"])
+                if inspect.isawaitable(result):
+                    import asyncio
+                    result = asyncio.run(result)
+                elif is_stream(result):
+                    result = collect_tool_output(result)
+            reply = {"success": True, "result": _wrap_large_buffers(result)}
+        except MemoryError:
+            reply = {"success": False, "error": f"Tool '{request['tool']}' exceeded its memory budget"}
+        except Exception as e:
+            reply = {"success": False, "error": str(e)}
+        finally:
+            _apply_budget(None, None)
+
+        try:
+            send_message(conn, reply)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            send_message(conn, {"success": False, "error": f"Tool result is not picklable: {e}"})
+        except (EOFError, OSError):
+            return
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.calls = 0
+
+
+class ToolProcessPool:
+    """Bounded pool of warm, recyclable tool worker processes"""
+
+    def __init__(self, sys_paths: List[str], preload: Optional[List[str]] = None,
+                 size: Optional[int] = None,
+                 max_calls_per_worker: int = DEFAULT_MAX_CALLS_PER_WORKER):
+        self.sys_paths = list(sys_paths)
+        self.preload = list(preload or [])
+        self.size = max(1, size or os.cpu_count() or 1)
+        self.max_calls_per_worker = max_calls_per_worker
+        import multiprocessing
+        methods = multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self.idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(self.size)
+        self.lock = threading.Lock()
+        self.closed = False
+        self.stats = {"calls": 0, "started": 0, "recycled": 0, "crashed": 0, "timeouts": 0}
+
+    def start(self):
+        """Pre-fork the full set of warm workers"""
+        for _ in range(self.size - self.idle.qsize()):
+            self.idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=_worker_main,
+            args=(child_conn, self.sys_paths, self.preload),
+            name="thinkchain-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        with self.lock:
+            self.stats["started"] += 1
+        return _Worker(process, parent_conn)
+
+    def _retire(self, worker: _Worker, graceful: bool = True):
+        try:
+            if graceful:
+                send_message(worker.conn, None)
+                worker.process.join(1)
+        except (EOFError, OSError):
+            pass
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join(1)
+        worker.conn.close()
+
+    def execute(self, tool_name: str, tool_file: str, class_name: str, sha256: str,
+                kwargs: Dict[str, Any], timeout: Optional[float] = None,
+                cpu_seconds: Optional[float] = None, memory_mb: Optional[int] = None) -> Dict[str, Any]:
+        """Run one tool call on a worker; crashes, budgets and timeouts become error results"""
+        if self.closed:
+            return {"success": False, "error": "Process pool is shut down"}
+
+        request = {
+            "tool": tool_name,
+            "module": f"tools.{os.path.splitext(tool_file)[0]}",
+            "class": class_name,
+            "sha256": sha256,
+            "kwargs": _wrap_large_buffers(kwargs),
+            "cpu_seconds": cpu_seconds,
+            "memory_mb": memory_mb,
+        }
+
+        self.slots.acquire()
+        try:
+            try:
+                worker = self.idle.get_nowait()
+            except queue.Empty:
+                worker = self._spawn()
+
+            try:
+                send_message(worker.conn, request)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                # Nothing reached the worker, so it is still clean
+                self.idle.put(worker)
+                return {"success": False, "error": f"Tool arguments are not picklable: {e}"}
+            except (EOFError, OSError):
+                pass  # the dead worker is detected by the recv below
+
+            try:
+                if not worker.conn.poll(timeout):
+                    self._retire(worker, graceful=False)
+                    with self.lock:
+                        self.stats["timeouts"] += 1
+                    return {"success": False, "error": f"Tool '{tool_name}' timed out after {timeout}s"}
+                reply = recv_message(worker.conn)
+            except (EOFError, OSError):
+                worker.process.join(1)
+                exitcode = worker.process.exitcode
+                self._retire(worker, graceful=False)
+                with self.lock:
+                    self.stats["crashed"] += 1
+                if exitcode == -getattr(signal, "SIGXCPU", 0):
+                    return {"success": False, "error": f"Tool '{tool_name}' exceeded its CPU budget"}
+                return {"success": False, "error": f"Tool '{tool_name}' worker crashed (exit code {exitcode})"}
+
+            worker.calls += 1
+            with self.lock:
+                self.stats["calls"] += 1
+            if worker.calls >= self.max_calls_per_worker or self.closed:
+                self._retire(worker)
+                with self.lock:
+                    self.stats["recycled"] += 1
+            else:
+                self.idle.put(worker)
+            return reply
+        finally:
+            self.slots.release()
+
+    def shutdown(self):
+        """Stop all idle workers; busy workers are retired when their call returns"""
+        self.closed = True
+        while True:
+            try:
+                self._retire(self.idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return dict(self.stats, size=self.size, idle=self.idle.qsize(),
+                        max_calls_per_worker=self.max_calls_per_worker)
@@ -6,23 +6,262 @@ Starts all enhanced dashboards and services with proper monitoring
 
 import os
 import sys
+
+if __name__ == '__main__' and '--profile-startup' in sys.argv:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'integrations'))
+    from startup_profile import run_profiled
+    sys.exit(run_profiled(__file__))
+
 import subprocess
 import time
 import signal
 import threading
 from pathlib import Path
 import json
-import requests
+import re
+from collections import deque
+
+# Readiness probes: polled with exponential backoff until the service's deadline
+READY_TIMEOUT = 30.0
+PROBE_INITIAL_DELAY = 0.05
+PROBE_MAX_DELAY = 0.5
+PROBE_TIMEOUT = 1.0
+
+# Supervision: restart backoff, and the crash-loop circuit breaker
+RESTART_INITIAL_DELAY = 0.5
+RESTART_MAX_DELAY = 30.0
+STABLE_AFTER = 60.0          # a run this long resets the backoff
+CRASH_LOOP_MAX_EXITS = 5     # this many exits within the window...
+CRASH_LOOP_WINDOW = 120.0
+CRASH_LOOP_COOLDOWN = 300.0  # ...stops restarts for this long
+STOP_TIMEOUT = 10.0          # graceful stop before services are killed
+
+# Listening sockets are bound by the launcher and inherited by services
+LISTEN_HOST = '0.0.0.0'
+LISTEN_BACKLOG = 1024
+
+# Service manifest: what to run and in which order (CCDK_SERVICES or --services to override)
+SERVICE_MANIFEST = Path(os.environ.get('CCDK_SERVICES', Path(__file__).resolve().parent / 'services.json'))
+RESTART_POLICIES = ('always', 'on-failure', 'never')
+
+# Multi-worker mode: dashboards run under the pre-forking server
+PREFORK_SERVER = Path(__file__).resolve().parent / 'serve-dashboard.py'
+
+# Launcher status API (GET /status, GET /logs/<service>)
+STATUS_PORT = int(os.environ.get('CCDK_LAUNCHER_PORT', '4040'))
+
+# Service output: rotating files plus a bounded in-memory tail per service
+LOG_DIR = Path(os.environ.get('CCDK_LOG_DIR', Path.home() / '.claude' / 'logs' / 'services'))
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+LOG_RING_LINES = 1000
+LOG_MAX_LINE = 4096
+
+# Resource accounting: /proc samples per service, kept as a bounded time series
+SAMPLE_INTERVAL = float(os.environ.get('CCDK_SAMPLE_INTERVAL', '5'))
+SAMPLE_HISTORY = 720         # one hour at the default interval
+LIMIT_BREACHES = 3           # consecutive samples over a limit before a restart
+LIMIT_KEYS = ('cpu_percent', 'rss_mb', 'fds', 'threads')
+
+def process_tree(pid):
+    """``pid`` and all of its descendants (pre-forked workers included)"""
+    pids = [pid]
+    for parent in pids:
+        for task in Path(f'/proc/{parent}/task').glob('*'):
+            try:
+                pids.extend(int(child) for child in (task / 'children').read_text().split())
+            except OSError:
+                pass  # task exited, or a kernel without the children file
+    return pids
+
+def read_proc_usage(pid):
+    """CPU seconds, RSS bytes, open fds and threads of a process tree; None if it is gone"""
+    usage = {'cpu_seconds': 0.0, 'rss_bytes': 0, 'fds': 0, 'threads': 0}
+    ticks = os.sysconf('SC_CLK_TCK')
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    found = False
+    for member in process_tree(pid):
+        try:
+            stat = Path(f'/proc/{member}/stat').read_text()
+            fds = len(os.listdir(f'/proc/{member}/fd'))
+        except OSError:
+            continue
+        # Fields after the parenthesised command name start at field 3 (state)
+        fields = stat[stat.rindex(')') + 2:].split()
+        usage['cpu_seconds'] += (int(fields[11]) + int(fields[12])) / ticks
+        usage['threads'] += int(fields[17])
+        usage['rss_bytes'] += int(fields[21]) * page_size
+        usage['fds'] += fds
+        found = True
+    return usage if found else None
+
+def load_manifest(path=None, app_dir=None):
+    """
+    Service dicts from a manifest (JSON, or TOML on Python 3.11+).
+    
+    Each entry under "services" is keyed by name and has a "script"
+    (relative to ``app_dir``) or a "command", a "port", and optionally
+    "description", "env", "probe", "ready_timeout", "restart" (always,
+    on-failure, never), "limits", "workers", "optional" and "depends_on".
+    In commands, {python} and {port} are replaced with the interpreter
+    and the service's port.
+    """
+    path = Path(path or SERVICE_MANIFEST)
+    if path.suffix == '.toml':
+        import tomllib
+        with open(path, 'rb') as f:
+            manifest = tomllib.load(f)
+    else:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    
+    base = Path(app_dir) if app_dir else path.parent
+    services = []
+    for name, spec in manifest.get('services', {}).items():
+        service = dict(spec, name=name)
+        if ('script' in service) == ('command' in service):
+            raise ValueError(f"{path.name}: '{name}' needs either a script or a command")
+        if not isinstance(service.get('port'), int):
+            raise ValueError(f"{path.name}: '{name}' needs an integer port")
+        if service.get('restart', 'always') not in RESTART_POLICIES:
+            raise ValueError(f"{path.name}: '{name}' has restart '{service['restart']}', "
+                             f"expected one of {', '.join(RESTART_POLICIES)}")
+        service.setdefault('description', name)
+        service['depends_on'] = list(service.get('depends_on', []))
+        service['env'] = {key: str(value) for key, value in service.get('env', {}).items()}
+        if 'script' in service:
+            service['script'] = base / service['script']
+        else:
+            service['command'] = [str(arg).replace('{python}', sys.executable).replace('{port}', str(service['port']))
+                                  for arg in service['command']]
+        services.append(service)
+    return services
+
+def service_waves(services):
+    """Group services into start-up waves; each wave depends only on earlier ones"""
+    names = {service['name'] for service in services}
+    for service in services:
+        unknown = set(service['depends_on']) - names
+        if unknown:
+            raise ValueError(f"'{service['name']}' depends on unknown service(s): {', '.join(sorted(unknown))}")
+    
+    waves = []
+    placed = set()
+    remaining = list(services)
+    while remaining:
+        wave = [service for service in remaining if set(service['depends_on']) <= placed]
+        if not wave:
+            raise ValueError(f"Dependency cycle between: {', '.join(service['name'] for service in remaining)}")
+        waves.append(wave)
+        placed.update(service['name'] for service in wave)
+        remaining = [service for service in remaining if service['name'] not in placed]
+    return waves
+
+class ResourceSeries:
+    """Ring buffer of (time, cpu_percent, rss_mb, fds, threads) samples for one service"""
+    
+    FIELDS = ('time',) + LIMIT_KEYS
+    
+    def __init__(self, size=None):
+        self.samples = deque(maxlen=size or SAMPLE_HISTORY)
+        self.lock = threading.Lock()
+        self.baseline = None  # (pid, time, cpu_seconds) of the previous sample
+    
+    def add(self, pid, usage, now=None):
+        """Record a reading from read_proc_usage(); CPU is averaged since the previous sample"""
+        now = time.time() if now is None else now
+        cpu_percent = 0.0
+        if self.baseline and self.baseline[0] == pid and now > self.baseline[1]:
+            # Exited workers take their CPU time with them, so the delta can dip below zero
+            cpu_percent = max(0.0, (usage['cpu_seconds'] - self.baseline[2]) / (now - self.baseline[1]) * 100)
+        self.baseline = (pid, now, usage['cpu_seconds'])
+        sample = (round(now, 1), round(cpu_percent, 1), round(usage['rss_bytes'] / 2**20, 1),
+                  usage['fds'], usage['threads'])
+        with self.lock:
+            self.samples.append(sample)
+        return dict(zip(self.FIELDS, sample))
+    
+    def latest(self):
+        with self.lock:
+            return dict(zip(self.FIELDS, self.samples[-1])) if self.samples else None
+    
+    def series(self, count=None):
+        with self.lock:
+            samples = list(self.samples)
+        return {'fields': list(self.FIELDS), 'samples': samples[-count:] if count else samples}
+
+class ServiceLog:
+    """Drains a service's stdout/stderr into a rotating log file and a ring buffer"""
+    
+    def __init__(self, name, log_dir=None):
+        import logging
+        import logging.handlers
+        
+        log_dir = Path(log_dir or LOG_DIR)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self.path = log_dir / (re.sub(r'[^A-Za-z0-9_.-]+', '-', name).strip('-').lower() + '.log')
+        self.handler = logging.handlers.RotatingFileHandler(
+            self.path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8')
+        self.handler.setFormatter(logging.Formatter('%(asctime)s [%(stream)s] %(message)s'))
+        self.lines = deque(maxlen=LOG_RING_LINES)
+        self.lock = threading.Lock()
+        self.ready_pattern = None
+        self.ready = None
+    
+    def expect(self, pattern):
+        """Arm a readiness event that the next line matching ``pattern`` sets"""
+        with self.lock:
+            self.ready_pattern = re.compile(pattern) if pattern else None
+            self.ready = threading.Event() if pattern else None
+    
+    def pump(self, stream, label):
+        """Read one pipe until EOF so the child never blocks on a full pipe buffer"""
+        import logging
+        try:
+            for raw in iter(stream.readline, b''):
+                line = raw.decode('utf-8', 'replace').rstrip('\r\n')[:LOG_MAX_LINE]
+                record = logging.LogRecord('ccdk.service', logging.INFO, '', 0, line, None, None)
+                record.stream = label
+                with self.lock:
+                    self.lines.append((record.created, label, line))
+                    if self.ready_pattern is not None and self.ready_pattern.search(line):
+                        self.ready.set()
+                        self.ready_pattern = None
+                self.handler.handle(record)
+        except (OSError, ValueError):
+            pass  # pipe closed during shutdown
+        finally:
+            stream.close()
+    
+    def tail(self, count=50):
+        with self.lock:
+            return list(self.lines)[-count:]
+    
+    def close(self):
+        self.handler.close()
 
 class CCDKi124qLauncher:
     def __init__(self):
         self.app_dir = Path('/app')
         self.processes = {}
         self.running = True
+        self.stop_event = threading.Event()
+        self.status_server = None
+        self.logs = {}
+        self.workers = {}  # service name (or '*' for all) -> worker processes
+        self.sockets = {}  # service name -> listening socket owned by the launcher
+        self.resources = {}  # service name -> ResourceSeries
+        self.limits = {}  # service name (or '*' for all) -> {'rss_mb': N, ...}
+        self.manifest = SERVICE_MANIFEST
         
     def print_banner(self):
         """Display launch banner"""
-        banner = """
+        try:
+            services = load_manifest(self.manifest, self.app_dir)
+        except (OSError, ValueError):
+            services = []  # reported by the health check
+        systems = '\n'.join(f"   • {service['name']} (Port {service['port']})" for service in services)
+        banner = f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║  🚀 CCDK i124q - Professional Dashboard Launcher            ║
@@ -32,122 +271,231 @@ class CCDKi124qLauncher:
 ╚══════════════════════════════════════════════════════════════╝
 
 🌟 Launching all integrated systems:
-   • Unified Dashboard (Port 4000)
-   • Enhanced WebUI (Port 7000)  
-   • Enhanced Analytics (Port 5005)
-   • Templates Analytics (Port 3333)
+{systems}
    
 🎯 37+ Total capabilities across CCDK + SuperClaude + ThinkChain + Templates
 """
         print(banner)
     
-    def start_service(self, name, script_path, port, description):
-        """Start a dashboard service"""
+    def start_service(self, service):
+        """Start a service and wait until its readiness probe passes"""
+        name = service['name']
+        port = service['port']
         print(f"🔄 Starting {name}...")
         
         try:
-            if not script_path.exists():
-                print(f"❌ Script not found: {script_path}")
+            if 'script' in service and not Path(service['script']).exists():
+                print(f"❌ Script not found: {service['script']}")
                 return False
             
-            process = subprocess.Popen(
-                [sys.executable, str(script_path)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=self.app_dir
-            )
-            
-            self.processes[name] = {
-                'process': process,
-                'port': port,
-                'description': description,
-                'script': str(script_path)
-            }
-            
-            # Wait a moment for startup
-            time.sleep(2)
-            
-            # Check if service is responding
-            if self.check_service_health(port):
-                print(f"✅ {name} started successfully on port {port}")
-                return True
-            else:
-                print(f"⚠️  {name} started but not yet responding on port {port}")
-                return True  # Still consider it started
-                
+            sock = self.listen_socket(service)
+            command = self.service_command(service, sock)
+            process = self.spawn(name, command, service.get('probe', {}).get('ready_line'), sock,
+                                 service.get('env'))
         except Exception as e:
-            print(f"❌ Failed to start {name}: {e}")
+            self.close_socket(name)
+            if service.get('optional'):
+                print(f"⚠️  {name} unavailable: {e}")
+            else:
+                print(f"❌ Failed to start {name}: {e}")
             return False
+        
+        self.processes[name] = {
+            'process': process,
+            'port': port,
+            'description': service['description'],
+            'script': str(service.get('script', ' '.join(command))),
+            'command': command,
+            'service': service,
+            'state': 'starting',
+            'started_at': time.time(),
+            'restarts': 0,
+            'exits': [],
+            'last_exit_code': None,
+            'breaches': 0,
+            'limit_restarts': 0,
+            'last_limit': None
+        }
+        
+        started = time.monotonic()
+        if self.wait_until_ready(process, service):
+            print(f"✅ {name} ready on port {port} ({time.monotonic() - started:.1f}s)")
+            self.processes[name]['state'] = 'running'
+            threading.Thread(target=self.supervise, args=(name,), name=f"supervise-{name}",
+                             daemon=True).start()
+            return True
+        
+        if process.poll() is not None:
+            print(f"❌ {name} exited during startup (code {process.returncode})")
+            time.sleep(0.1)  # let the pumps catch the last lines
+            for _, label, line in self.logs[name].tail(5):
+                print(f"   {label}: {line}")
+        else:
+            print(f"❌ {name} not ready on port {port} after {service.get('ready_timeout', READY_TIMEOUT):.0f}s")
+            process.terminate()
+        del self.processes[name]
+        self.close_socket(name)
+        return False
+    
+    def listen_socket(self, service):
+        """
+        The service's listening socket, bound once by the launcher.
+        
+        Services inherit it instead of binding the port themselves, so it
+        stays open across restarts: connections wait in the backlog until
+        the new process accepts them instead of being refused. External
+        commands bind their own port unless they set 'inherit_socket'.
+        """
+        name = service['name']
+        if name in self.sockets:
+            return self.sockets[name]
+        if service.get('command') and not service.get('inherit_socket'):
+            return None
+        
+        import socket
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((LISTEN_HOST, service['port']))
+            sock.listen(LISTEN_BACKLOG)
+        except OSError:
+            sock.close()
+            raise
+        self.sockets[name] = sock
+        return sock
+    
+    def close_socket(self, name):
+        """Release a stopped service's port; the next start binds it again"""
+        sock = self.sockets.pop(name, None)
+        if sock is not None:
+            sock.close()
+    
+    def service_command(self, service, sock=None):
+        """Command line for a service: its own, or its script (pre-forked if it has workers)"""
+        if service.get('command'):
+            return service['command']
+        workers = service.get('workers', self.workers.get(service['name'], self.workers.get('*', 0)))
+        if workers:
+            service['workers'] = workers
+            # The inherited socket accepts before every worker is up; the master reports that
+            service.setdefault('probe', {'ready_line': r'Serving .* with \d+ workers'})
+            listen = ['--fd', str(sock.fileno())] if sock is not None else ['--port', str(service['port'])]
+            return [sys.executable, str(PREFORK_SERVER), str(service['script']),
+                    *listen, '--workers', str(workers)]
+        return [sys.executable, str(service['script'])]
+    
+    def spawn(self, name, command, ready_line=None, sock=None, extra_env=None):
+        """Start a service process with its output pumped into the service's log"""
+        log = self.logs.get(name)
+        if log is None:
+            log = self.logs[name] = ServiceLog(name)
+        log.expect(ready_line)
+        
+        env = dict(os.environ, **extra_env) if extra_env else None
+        pass_fds = ()
+        if sock is not None:
+            fd = sock.fileno()
+            pass_fds = (fd,)
+            env = dict(env or os.environ,
+                       CCDK_LISTEN_FD=str(fd),
+                       # Flask's app.run() serves on this fd instead of binding its port
+                       WERKZEUG_SERVER_FD=str(fd),
+                       WERKZEUG_RUN_MAIN='true')
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.app_dir,
+            env=env,
+            pass_fds=pass_fds
+        )
+        for stream, label in ((process.stdout, 'stdout'), (process.stderr, 'stderr')):
+            threading.Thread(target=log.pump, args=(stream, label), name=f"log-{name}-{label}",
+                             daemon=True).start()
+        return process
+    
+    def wait_until_ready(self, process, service):
+        """Poll the service's readiness probe with exponential backoff until its deadline"""
+        probe = service.get('probe', {'http': '/'})
+        deadline = time.monotonic() + service.get('ready_timeout', READY_TIMEOUT)
+        ready_line = self.logs[service['name']].ready if 'ready_line' in probe else None
+        
+        delay = PROBE_INITIAL_DELAY
+        while True:
+            if process.poll() is not None:
+                return False
+            if ready_line is not None:
+                if ready_line.is_set():
+                    return True
+            elif self.check_service_health(service['port'], probe.get('http', '/'),
+                                           probe.get('status', 200), timeout=PROBE_TIMEOUT):
+                return True
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if ready_line is not None:
+                ready_line.wait(min(delay, remaining))
+            else:
+                time.sleep(min(delay, remaining))
+            delay = min(delay * 2, PROBE_MAX_DELAY)
     
-    def check_service_health(self, port, timeout=5):
-        """Check if a service is responding"""
+    def check_service_health(self, port, path='/', expected_status=200, timeout=5):
+        """Check if a service is responding with the expected status"""
+        import urllib.request
+        import urllib.error
         try:
-            response = requests.get(f'http://localhost:{port}', timeout=timeout)
-            return response.status_code == 200
-        except:
+            with urllib.request.urlopen(f'http://localhost:{port}{path}', timeout=timeout) as response:
+                return response.status == expected_status
+        except urllib.error.HTTPError as e:
+            return e.code == expected_status
+        except Exception:
             return False
     
     def start_all_services(self):
-        """Start all CCDK i124q services"""
-        services = [
-            {
-                'name': 'Unified Dashboard',
-                'script': self.app_dir / 'unified-dashboard.py',
-                'port': 4000,
-                'description': 'Main integration dashboard'
-            },
-            {
-                'name': 'Enhanced WebUI',
-                'script': self.app_dir / 'webui' / 'app-enhanced.py',
-                'port': 7000,
-                'description': 'Command browser with all systems'
-            },
-            {
-                'name': 'Enhanced Analytics',
-                'script': self.app_dir / 'dashboard' / 'app-enhanced.py',
-                'port': 5005,
-                'description': 'Advanced analytics monitoring'
-            }
-        ]
-        
+        """Start the manifest's services: each wave concurrently, once its dependencies are ready"""
+        waves = service_waves(load_manifest(self.manifest, self.app_dir))
         started_services = []
         failed_services = []
+        ready = set()
+        for number, wave in enumerate(waves, 1):
+            startable = []
+            for service in wave:
+                missing = [name for name in service['depends_on'] if name not in ready]
+                if not missing:
+                    startable.append(service)
+                    continue
+                print(f"⏭️  Skipping {service['name']}: {', '.join(missing)} did not start")
+                if not service.get('optional'):
+                    failed_services.append(service)
+            if not startable:
+                continue
+            if len(waves) > 1:
+                print(f"\n🌊 Wave {number}/{len(waves)}: {', '.join(service['name'] for service in startable)}")
+            started, failed = self.start_services(startable)
+            started_services.extend(started)
+            failed_services.extend(failed)
+            ready.update(service['name'] for service in started)
+        return started_services, failed_services
+    
+    def start_services(self, services):
+        """Start services concurrently; returns (started, failed) in the given order"""
+        from concurrent.futures import ThreadPoolExecutor
         
-        for service in services:
-            if self.start_service(
-                service['name'],
-                service['script'],
-                service['port'],
-                service['description']
-            ):
+        # Launch time is that of the slowest service, not the sum
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            results = list(executor.map(self.start_service, services))
+        print(f"\n⏱️  Services started in {time.monotonic() - started:.1f}s")
+        
+        started_services = []
+        failed_services = []
+        for service, ok in zip(services, results):
+            if ok:
                 started_services.append(service)
-            else:
+            elif not service.get('optional'):
                 failed_services.append(service)
         
-        # Try to start Templates Analytics (external)
-        print("\n🔄 Starting Templates Analytics...")
-        try:
-            templates_process = subprocess.Popen(
-                ['claude-code-templates', '--analytics'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            time.sleep(3)
-            if templates_process.poll() is None:  # Still running
-                self.processes['Templates Analytics'] = {
-                    'process': templates_process,
-                    'port': 3333,
-                    'description': 'Templates system analytics',
-                    'script': 'claude-code-templates CLI'
-                }
-                print("✅ Templates Analytics started on port 3333")
-                started_services.append({'name': 'Templates Analytics', 'port': 3333})
-            else:
-                print("⚠️  Templates Analytics may not be available")
-        except Exception as e:
-            print(f"⚠️  Templates Analytics unavailable: {e}")
-        
         return started_services, failed_services
     
     def display_service_status(self, started_services):
@@ -171,45 +519,230 @@ class CCDKi124qLauncher:
         
         print("="*70)
         print("🎯 Access your CCDK i124q system at any of the URLs above")
+        print(f"📜 Service logs in {LOG_DIR} (--tail <service> to follow)")
         print("🔄 Press Ctrl+C to stop all services")
         print("="*70)
     
-    def monitor_services(self):
-        """Monitor running services and restart if needed"""
+    def supervise(self, name):
+        """
+        Restart a service as soon as it exits.
+        
+        One thread per service blocks in wait(), so an exit is seen
+        immediately instead of on the next poll. Restarts back off
+        exponentially; too many exits within CRASH_LOOP_WINDOW open a
+        circuit breaker that holds restarts for CRASH_LOOP_COOLDOWN.
+        An exit requested by restart_service() is restarted at once and
+        does not count towards either, whatever the restart policy.
+        """
+        info = self.processes[name]
+        delay = RESTART_INITIAL_DELAY
+        code = info['process'].wait()
         while self.running:
-            time.sleep(30)  # Check every 30 seconds
+            now = time.time()
+            ran_for = now - info['started_at']
+            info['last_exit_code'] = code
+            policy = info['service'].get('restart', 'always')
+            if info.pop('restart_requested', False):
+                info['state'] = 'restarting'
+                print(f"\n🔄 {name} stopped for a requested restart; restarting now")
+                wait = 0
+            else:
+                if policy == 'never' or (policy == 'on-failure' and code == 0):
+                    info['state'] = 'stopped'
+                    self.close_socket(name)
+                    print(f"\n⏹️  {name} exited (code {code}); not restarted (restart: {policy})")
+                    return
+                info['exits'] = [t for t in info['exits'] if now - t < CRASH_LOOP_WINDOW] + [now]
+                if ran_for >= STABLE_AFTER:
+                    delay = RESTART_INITIAL_DELAY
+                
+                if len(info['exits']) >= CRASH_LOOP_MAX_EXITS:
+                    info['state'] = 'crash-loop'
+                    print(f"\n🛑 {name} exited {len(info['exits'])} times in {CRASH_LOOP_WINDOW:.0f}s; "
+                          f"holding restarts for {CRASH_LOOP_COOLDOWN:.0f}s")
+                    info['exits'] = []
+                    self.close_socket(name)  # connections are refused instead of queueing for the cooldown
+                    wait = CRASH_LOOP_COOLDOWN
+                else:
+                    info['state'] = 'restarting'
+                    print(f"\n⚠️  {name} exited (code {code}) after {ran_for:.1f}s; restarting in {delay:.1f}s")
+                    wait = delay
+                    delay = min(delay * 2, RESTART_MAX_DELAY)
             
-            dead_services = []
-            for name, service_info in self.processes.items():
-                if service_info['process'].poll() is not None:
-                    dead_services.append(name)
+            if self.stop_event.wait(wait):
+                return
+            info['started_at'] = time.time()
+            try:
+                # Same socket as before unless it was released (crash-loop hold); then bound anew
+                sock = self.listen_socket(info['service'])
+                info['command'] = self.service_command(info['service'], sock)
+                info['process'] = self.spawn(name, info['command'],
+                                             info['service'].get('probe', {}).get('ready_line'),
+                                             sock, info['service'].get('env'))
+            except Exception as e:
+                print(f"❌ Failed to restart {name}: {e}")
+                code = None  # counts as another exit
+                continue
+            info['restarts'] += 1
+            if self.wait_until_ready(info['process'], info['service']):
+                info['state'] = 'running'
+                print(f"✅ {name} restarted (restart #{info['restarts']})")
+            elif info['process'].poll() is None:
+                # Up but never ready; it stays failed until it exits or is restarted
+                info['state'] = 'failed'
+                print(f"❌ {name} not ready after restart #{info['restarts']}")
+            code = info['process'].wait()
+    
+    def service_limits(self, name):
+        """Resource limits for a service: its own, else the launcher-wide ones"""
+        limits = dict(self.limits.get('*', {}))
+        limits.update(self.limits.get(name, {}))
+        limits.update(self.processes[name]['service'].get('limits', {}))
+        return {key: value for key, value in limits.items() if key in LIMIT_KEYS}
+    
+    def sample_resources(self):
+        """Take one /proc sample of every running service and enforce its limits"""
+        for name, info in list(self.processes.items()):
+            process = info['process']
+            if process.poll() is not None:
+                continue
+            usage = read_proc_usage(process.pid)
+            if usage is None:
+                continue
+            series = self.resources.get(name)
+            if series is None:
+                series = self.resources[name] = ResourceSeries()
+            sample = series.add(process.pid, usage)
             
-            for service_name in dead_services:
-                print(f"\n⚠️  Service {service_name} has stopped. Attempting restart...")
-                service_info = self.processes[service_name]
-                
-                # Try to restart
-                try:
-                    if service_name == 'Templates Analytics':
-                        new_process = subprocess.Popen(
-                            ['claude-code-templates', '--analytics'],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE
-                        )
-                    else:
-                        new_process = subprocess.Popen(
-                            [sys.executable, service_info['script']],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            cwd=self.app_dir
-                        )
-                    
-                    self.processes[service_name]['process'] = new_process
-                    print(f"✅ {service_name} restarted successfully")
-                    
-                except Exception as e:
-                    print(f"❌ Failed to restart {service_name}: {e}")
-                    del self.processes[service_name]
+            over = [f"{key} {sample[key]} > {limit}"
+                    for key, limit in self.service_limits(name).items() if sample[key] > limit]
+            if not over or info['state'] != 'running':
+                info['breaches'] = 0
+                continue
+            info['breaches'] += 1
+            if info['breaches'] >= LIMIT_BREACHES:
+                print(f"\n♻️  {name} over its limits for {info['breaches']} samples "
+                      f"({', '.join(over)}); restarting")
+                info['breaches'] = 0
+                info['limit_restarts'] += 1
+                info['last_limit'] = ', '.join(over)
+                self.restart_service(name)
+    
+    def monitor_resources(self):
+        while not self.stop_event.wait(SAMPLE_INTERVAL):
+            self.sample_resources()
+    
+    def start_resource_monitor(self):
+        """Sample every service's /proc usage each SAMPLE_INTERVAL seconds"""
+        if not Path('/proc/self/stat').exists():
+            print("⚠️  No /proc on this platform; resource accounting disabled")
+            return False
+        threading.Thread(target=self.monitor_resources, name='resource-monitor', daemon=True).start()
+        return True
+    
+    def restart_service(self, name):
+        """
+        Restart a service without dropping requests where possible.
+        
+        Pre-forked services get SIGHUP: the server replaces its workers one
+        at a time, each old worker finishing its in-flight requests. Other
+        services are terminated and brought back by supervise().
+        """
+        info = self.processes.get(name)
+        if info is None or info['process'].poll() is not None:
+            return {'success': False, 'error': f"Service '{name}' is not running"}
+        if info['service'].get('workers'):
+            info['process'].send_signal(signal.SIGHUP)
+            return {'success': True, 'mode': 'rolling'}
+        info['restart_requested'] = True  # supervise() restarts it at once, outside the crash accounting
+        info['process'].terminate()
+        return {'success': True, 'mode': 'restart'}
+    
+    def get_status(self):
+        """Per-service state, pid, uptime and restart counters"""
+        now = time.time()
+        services = {}
+        for name, info in list(self.processes.items()):
+            process = info['process']
+            alive = process.poll() is None
+            state = info['state']
+            if state == 'running' and not alive:
+                state = 'exited'  # supervise() has not handled the exit yet
+            services[name] = {
+                'state': state,
+                'pid': process.pid if alive else None,
+                'port': info['port'],
+                'uptime_seconds': round(now - info['started_at'], 1) if alive else 0,
+                'restarts': info['restarts'],
+                'workers': info['service'].get('workers', 0),
+                'last_exit_code': info['last_exit_code'],
+                'description': info['description'],
+                'resources': self.resources[name].latest() if alive and name in self.resources else None,
+                'limits': self.service_limits(name),
+                'limit_restarts': info['limit_restarts'],
+                'last_limit': info['last_limit']
+            }
+        return {'services': services, 'timestamp': now}
+    
+    def start_status_server(self, port=STATUS_PORT):
+        """Serve GET /status as JSON on localhost"""
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        launcher = self
+        
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                from urllib.parse import urlsplit, parse_qs, unquote
+                url = urlsplit(self.path)
+                if url.path == '/status':
+                    body = json.dumps(launcher.get_status(), indent=2).encode('utf-8')
+                    content_type = 'application/json'
+                elif url.path.startswith('/logs/') and unquote(url.path[6:]) in launcher.logs:
+                    count = int(parse_qs(url.query).get('lines', ['50'])[0])
+                    lines = launcher.logs[unquote(url.path[6:])].tail(count)
+                    body = ''.join(f"{time.strftime('%H:%M:%S', time.localtime(created))} [{label}] {line}\n"
+                                   for created, label, line in lines).encode('utf-8')
+                    content_type = 'text/plain; charset=utf-8'
+                elif url.path == '/metrics' or url.path.startswith('/metrics/'):
+                    points = int(parse_qs(url.query).get('points', ['0'])[0]) or None
+                    names = [unquote(url.path[9:])] if url.path.startswith('/metrics/') else list(launcher.resources)
+                    if any(name not in launcher.resources for name in names):
+                        self.send_error(404)
+                        return
+                    series = {name: launcher.resources[name].series(points) for name in names}
+                    body = json.dumps(series if url.path == '/metrics' else series[names[0]]).encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_POST(self):
+                from urllib.parse import unquote
+                if not self.path.startswith('/restart/'):
+                    self.send_error(404)
+                    return
+                body = json.dumps(launcher.restart_service(unquote(self.path[9:]))).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        try:
+            self.status_server = ThreadingHTTPServer(('127.0.0.1', port), StatusHandler)
+        except OSError as e:
+            print(f"⚠️  Status API unavailable on port {port}: {e}")
+            return False
+        self.status_server.daemon_threads = True
+        threading.Thread(target=self.status_server.serve_forever, daemon=True).start()
+        return True
     
     def setup_signal_handlers(self):
         """Set up signal handlers for graceful shutdown"""
@@ -224,18 +757,32 @@ class CCDKi124qLauncher:
     
     def cleanup_services(self):
         """Clean up all running services"""
-        for name, service_info in self.processes.items():
+        self.running = False
+        self.stop_event.set()
+        if self.status_server is not None:
+            self.status_server.shutdown()
+            self.status_server = None
+        # Stop everything at once; pre-forked servers drain their workers meanwhile
+        stopping = []
+        for name, service_info in list(self.processes.items()):
+            process = service_info['process']
+            if process.poll() is None:  # Still running
+                print(f"🔄 Stopping {name}...")
+                process.terminate()
+                stopping.append((name, process))
+        deadline = time.monotonic() + STOP_TIMEOUT
+        for name, process in stopping:
             try:
-                process = service_info['process']
-                if process.poll() is None:  # Still running
-                    print(f"🔄 Stopping {name}...")
-                    process.terminate()
-                    time.sleep(2)
-                    if process.poll() is None:  # Still running after terminate
-                        process.kill()
-                    print(f"✅ {name} stopped")
-            except Exception as e:
-                print(f"⚠️  Error stopping {name}: {e}")
+                process.wait(max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            print(f"✅ {name} stopped")
+        for log in self.logs.values():
+            log.close()
+        for sock in self.sockets.values():
+            sock.close()
+        self.sockets.clear()
     
     def run_health_check(self):
         """Run initial health check of the system"""
@@ -251,14 +798,17 @@ class CCDKi124qLauncher:
         else:
             checks.append("❌ CCDK directory structure missing")
         
-        # Check dashboard files
-        dashboard_files = [
-            self.app_dir / 'unified-dashboard.py',
-            self.app_dir / 'webui' / 'app-enhanced.py',
-            self.app_dir / 'dashboard' / 'app-enhanced.py'
-        ]
+        # Check the service manifest and the dashboard files it names
+        try:
+            services = load_manifest(self.manifest, self.app_dir)
+            service_waves(services)
+            checks.append(f"✅ Service manifest ({len(services)} services)")
+        except (OSError, ValueError) as e:
+            services = []
+            checks.append(f"❌ Service manifest {self.manifest}: {e}")
         
-        all_files_exist = all(f.exists() for f in dashboard_files)
+        dashboard_files = [service['script'] for service in services if 'script' in service]
+        all_files_exist = all(Path(f).exists() for f in dashboard_files)
         if all_files_exist:
             checks.append("✅ Dashboard files present")
         else:
@@ -271,12 +821,15 @@ class CCDKi124qLauncher:
         except ImportError:
             checks.append("⚠️  SuperClaude Framework not installed")
         
-        # Check Templates CLI
+        # Check the external commands services run
         import shutil
-        if shutil.which('claude-code-templates'):
-            checks.append("✅ Templates CLI available")
-        else:
-            checks.append("⚠️  Templates CLI not installed")
+        for service in services:
+            if 'command' not in service:
+                continue
+            if shutil.which(service['command'][0]):
+                checks.append(f"✅ {service['name']} command available")
+            else:
+                checks.append(f"⚠️  {service['name']} command not installed")
         
         for check in checks:
             print(f"   {check}")
@@ -321,9 +874,10 @@ class CCDKi124qLauncher:
         # Display service status
         self.display_service_status(started_services)
         
-        # Start monitoring in background
-        monitor_thread = threading.Thread(target=self.monitor_services, daemon=True)
-        monitor_thread.start()
+        # Services are supervised from start_service; expose their status
+        if self.start_status_server():
+            print(f"📡 Launcher status: http://localhost:{STATUS_PORT}/status")
+        self.start_resource_monitor()
         
         # Keep main thread alive
         try:
@@ -334,6 +888,86 @@ class CCDKi124qLauncher:
         
         return True
 
+def show_status(port=STATUS_PORT):
+    """Print the status of a running launcher's services"""
+    import urllib.request
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/status', timeout=5) as response:
+            status = json.load(response)
+    except Exception as e:
+        print(f"❌ No launcher status on port {port}: {e}")
+        return False
+    
+    print(f"{'Service':<25} {'State':<11} {'PID':>7} {'Uptime':>10} {'Restarts':>8} "
+          f"{'CPU%':>6} {'RSS MB':>8} {'FDs':>5} {'Thr':>4}  Last exit")
+    for name, info in status['services'].items():
+        uptime = f"{info['uptime_seconds']:.0f}s"
+        last_exit = '-' if info['last_exit_code'] is None else str(info['last_exit_code'])
+        usage = info.get('resources') or {}
+        print(f"{name:<25} {info['state']:<11} {info['pid'] or '-':>7} {uptime:>10} {info['restarts']:>8} "
+              f"{usage.get('cpu_percent', '-'):>6} {usage.get('rss_mb', '-'):>8} "
+              f"{usage.get('fds', '-'):>5} {usage.get('threads', '-'):>4}  {last_exit}")
+        if info.get('last_limit'):
+            print(f"{'':<25} restarted {info['limit_restarts']}x over limits, last: {info['last_limit']}")
+    return True
+
+def show_tail(name, lines=50, port=STATUS_PORT):
+    """Print the last lines of a service's output from a running launcher"""
+    import urllib.request
+    from urllib.parse import quote
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/logs/{quote(name)}?lines={lines}',
+                                    timeout=5) as response:
+            sys.stdout.write(response.read().decode('utf-8'))
+    except Exception as e:
+        print(f"❌ No output for '{name}' from the launcher on port {port}: {e}")
+        return False
+    return True
+
+def request_restart(name, port=STATUS_PORT):
+    """Ask a running launcher to restart a service (rolling for pre-forked services)"""
+    import urllib.request
+    from urllib.parse import quote
+    try:
+        request = urllib.request.Request(f'http://127.0.0.1:{port}/restart/{quote(name)}', method='POST')
+        with urllib.request.urlopen(request, timeout=5) as response:
+            result = json.load(response)
+    except Exception as e:
+        print(f"❌ Launcher not reachable on port {port}: {e}")
+        return False
+    if result['success']:
+        print(f"🔄 {name}: {'rolling restart' if result['mode'] == 'rolling' else 'restart'} requested")
+    else:
+        print(f"❌ {result['error']}")
+    return result['success']
+
+def parse_service_option(argv, flag, cast=int):
+    """``flag VALUE`` for every service, or ``flag "Service Name=VALUE"`` for one"""
+    values = {}
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            name, _, value = argv[i + 1].rpartition('=')
+            values[name or '*'] = cast(value)
+    return values
+
+def parse_workers(argv):
+    """--workers N for every dashboard, or --workers "Service Name=N" for one"""
+    return parse_service_option(argv, '--workers')
+
+def parse_limits(argv):
+    """--max-rss MB and --max-cpu PERCENT, for every service or one ("Service Name=VALUE")"""
+    limits = {}
+    for flag, key in (('--max-rss', 'rss_mb'), ('--max-cpu', 'cpu_percent')):
+        for name, value in parse_service_option(argv, flag, float).items():
+            limits.setdefault(name, {})[key] = value
+    return limits
+
+def parse_manifest(argv):
+    """--services PATH, else the default manifest"""
+    if '--services' in argv[:-1]:
+        return Path(argv[argv.index('--services') + 1])
+    return SERVICE_MANIFEST
+
 def main():
     """Main function"""
     if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h']:
@@ -346,12 +980,41 @@ Options:
   --help, -h    Show this help message
   --check       Run health check only
   --force       Force start even if health check fails
+  --status      Show restart counters and uptime from a running launcher
+  --tail NAME [LINES]
+                Show the latest output of a running service
+  --workers N   Run every dashboard with N pre-forked workers
+  --workers "NAME=N"
+                Workers for one dashboard (repeatable)
+  --restart NAME
+                Restart a running service; pre-forked dashboards
+                replace their workers one at a time
+  --max-rss MB  Restart a service whose memory stays above MB
+  --max-rss "NAME=MB"
+                Memory limit for one service (repeatable)
+  --max-cpu PERCENT
+                Restart a service whose CPU use stays above PERCENT
+  --services PATH
+                Service manifest to use instead of services.json
+  --profile-startup
+                Report where start-up time goes (-X importtime),
+                e.g. --profile-startup --check
 
-This launcher starts all CCDK i124q dashboard services:
+This launcher starts the services declared in services.json
+(CCDK_SERVICES or --services to use another manifest), by default:
 - Unified Dashboard (Port 4000) - Main integration interface
 - Enhanced WebUI (Port 7000) - Command browser with all systems
 - Enhanced Analytics (Port 5005) - Advanced monitoring dashboard
 - Templates Analytics (Port 3333) - Templates system dashboard
+Services start in parallel once the services they depend on are ready.
+
+Crashed services are restarted immediately with exponential backoff.
+CPU, memory, open files and threads are sampled every 5s
+(CCDK_SAMPLE_INTERVAL to change); a limit exceeded for 3 samples
+in a row restarts the service.
+Status API: http://localhost:4040/status (CCDK_LAUNCHER_PORT to change)
+Resource history: http://localhost:4040/metrics[/<service>]
+Service output: ~/.claude/logs/services/<service>.log (CCDK_LOG_DIR to change)
 
 Press Ctrl+C to stop all services gracefully.
 """)
@@ -359,10 +1022,24 @@ Press Ctrl+C to stop all services gracefully.
     
     if len(sys.argv) > 1 and sys.argv[1] == '--check':
         launcher = CCDKi124qLauncher()
+        launcher.manifest = parse_manifest(sys.argv[1:])
         launcher.run_health_check()
         return
     
+    if len(sys.argv) > 1 and sys.argv[1] == '--status':
+        sys.exit(0 if show_status() else 1)
+    
+    if len(sys.argv) > 2 and sys.argv[1] == '--restart':
+        sys.exit(0 if request_restart(sys.argv[2]) else 1)
+    
+    if len(sys.argv) > 2 and sys.argv[1] == '--tail':
+        lines = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+        sys.exit(0 if show_tail(sys.argv[2], lines) else 1)
+    
     launcher = CCDKi124qLauncher()
+    launcher.workers = parse_workers(sys.argv[1:])
+    launcher.limits = parse_limits(sys.argv[1:])
+    launcher.manifest = parse_manifest(sys.argv[1:])
     try:
         success = launcher.launch()
         if not success:
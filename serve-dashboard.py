@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+CCDK i124q - Pre-forked Dashboard Server
+Runs a dashboard's Flask app on N worker processes sharing one listening socket
+"""
+
+import os
+import sys
+
+if __name__ == '__main__' and '--profile-startup' in sys.argv:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'integrations'))
+    from startup_profile import run_profiled
+    sys.exit(run_profiled(__file__))
+
+import time
+import select
+import signal
+import socket
+import argparse
+import threading
+import traceback
+import importlib.util
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler
+
+GRACEFUL_TIMEOUT = 30.0      # time a stopping worker gets to finish in-flight requests
+READY_TIMEOUT = 30.0
+MIN_WORKER_LIFETIME = 1.0    # a worker dying sooner is respawned after this pause
+LISTEN_BACKLOG = 1024
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """One thread per request; server_close() waits for requests in flight"""
+    daemon_threads = False
+
+
+def load_app(script, attribute='app'):
+    """Import a dashboard script without running its __main__ block and return its WSGI app"""
+    script = Path(script).resolve()
+    if str(script.parent) not in sys.path:
+        sys.path.insert(0, str(script.parent))
+    spec = importlib.util.spec_from_file_location(f"ccdk_dashboard_{time.time_ns()}", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, attribute)
+
+
+def mark_ready():
+    """End of start-up for --profile-startup (see integrations/startup_profile.py)"""
+    if os.environ.get('CCDK_PROFILE_STARTUP'):
+        print('startup-profile: ready', file=sys.stderr, flush=True)
+
+
+def listen(host, port):
+    """Bind the listening socket that every worker accepts from"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, 'SO_REUSEPORT'):
+        # Lets a replacement server bind while the old one is still draining
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(LISTEN_BACKLOG)
+    return sock
+
+
+def make_server(sock, app):
+    """A threaded WSGI server on an already listening socket"""
+    host, port = sock.getsockname()[:2]
+    server = ThreadingWSGIServer((host, port), WSGIRequestHandler, bind_and_activate=False)
+    server.socket.close()
+    server.socket = sock
+    server.server_name = host
+    server.server_port = port
+    server.setup_environ()
+    server.set_app(app)
+    return server
+
+
+def run_worker(sock, app, ready_fd, lifeline_fd):
+    """Worker process: serve until SIGTERM or the master's exit, then finish in-flight requests"""
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the master decides when workers stop
+    server = make_server(sock, app)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    
+    def watch_master():
+        os.read(lifeline_fd, 1)  # EOF once the master is gone, even if it was SIGKILLed
+        server.shutdown()
+    threading.Thread(target=watch_master, daemon=True).start()
+    
+    os.write(ready_fd, b'1')
+    os.close(ready_fd)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+class PreforkServer:
+    """Master process: keeps N workers alive and replaces them one at a time on SIGHUP"""
+
+    def __init__(self, script, sock, workers, attribute='app'):
+        self.script = script
+        self.attribute = attribute
+        self.sock = sock
+        self.size = max(1, workers)
+        self.app = None
+        self.workers = {}        # pid -> start time
+        self.retiring = set()
+        self.respawn_at = []     # times at which to replace workers that died young
+        self.stopping = False
+        # Workers hold the read end; it hits EOF when the master exits
+        self.lifeline_r, self.lifeline_w = os.pipe()
+
+    def spawn_worker(self):
+        """Fork a worker and wait until it is accepting; returns its pid (None if it failed)"""
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            os.close(self.lifeline_w)
+            code = 0
+            try:
+                run_worker(self.sock, self.app, ready_w, self.lifeline_r)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                os._exit(code)
+
+        os.close(ready_w)
+        self.workers[pid] = time.monotonic()
+        try:
+            ready, _, _ = select.select([ready_r], [], [], READY_TIMEOUT)
+            if ready and os.read(ready_r, 1) == b'1':
+                return pid
+        finally:
+            os.close(ready_r)
+        print(f"❌ Worker {pid} did not become ready", flush=True)
+        return None
+
+    def stop_worker(self, pid, timeout=GRACEFUL_TIMEOUT):
+        """SIGTERM a worker and wait for it to drain; SIGKILL it after the timeout"""
+        self.retiring.add(pid)
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        deadline = time.monotonic() + timeout
+        while pid in self.workers:
+            self.reap()
+            if pid not in self.workers:
+                break
+            if time.monotonic() >= deadline:
+                os.kill(pid, signal.SIGKILL)
+                deadline = float('inf')
+            time.sleep(0.02)
+
+    def reap(self):
+        """Collect exited workers; schedule replacements for ones that were not retired"""
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            started = self.workers.pop(pid, None)
+            if pid in self.retiring:
+                self.retiring.discard(pid)
+                continue
+            if started is None or self.stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            print(f"⚠️  Worker {pid} exited (code {code}); replacing it", flush=True)
+            young = time.monotonic() - started < MIN_WORKER_LIFETIME
+            self.respawn_at.append(time.monotonic() + (MIN_WORKER_LIFETIME if young else 0))
+
+    def rolling_restart(self):
+        """Replace every worker with one running freshly loaded code, one at a time"""
+        try:
+            self.app = load_app(self.script, self.attribute)
+        except Exception:
+            print("❌ Reload failed; keeping the running code", flush=True)
+            traceback.print_exc()
+            return
+        for old in list(self.workers):
+            if old in self.retiring:
+                continue
+            new = self.spawn_worker()
+            if new is None:
+                print("❌ Rolling restart aborted; old workers keep serving", flush=True)
+                return
+            if old in self.workers:  # may have exited on its own meanwhile
+                self.stop_worker(old)
+        print(f"🔄 Rolling restart complete ({len(self.workers)} workers)", flush=True)
+
+    def serve(self):
+        self.app = load_app(self.script, self.attribute)
+
+        # Signals arrive as bytes on a self-pipe, so the loop below never polls
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        wake_w.setblocking(False)
+        signal.set_wakeup_fd(wake_w.fileno())
+        for sig in (signal.SIGCHLD, signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: None)
+
+        for _ in range(self.size):
+            self.spawn_worker()
+        host, port = self.sock.getsockname()[:2]
+        print(f"🚀 Serving {Path(self.script).name} on http://{host}:{port} "
+              f"with {len(self.workers)} workers", flush=True)
+        mark_ready()
+
+        while not self.stopping:
+            timeout = max(0.0, min(self.respawn_at) - time.monotonic()) if self.respawn_at else None
+            select.select([wake_r], [], [], timeout)
+            try:
+                received = wake_r.recv(64)
+            except BlockingIOError:
+                received = b''
+
+            for signum in received:
+                if signum in (signal.SIGTERM, signal.SIGINT):
+                    self.stopping = True
+                elif signum == signal.SIGHUP:
+                    self.rolling_restart()
+            self.reap()
+
+            now = time.monotonic()
+            due = [t for t in self.respawn_at if t <= now]
+            self.respawn_at = [t for t in self.respawn_at if t > now]
+            for _ in due:
+                if not self.stopping:
+                    self.spawn_worker()
+
+        for pid in list(self.workers):
+            self.retiring.add(pid)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + GRACEFUL_TIMEOUT
+        while self.workers and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.05)
+        for pid in list(self.workers):
+            os.kill(pid, signal.SIGKILL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a CCDK i124q dashboard with pre-forked workers")
+    parser.add_argument("script", help="Dashboard script defining a Flask/WSGI app")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--fd", type=int, help="Inherited listening socket to serve on instead of binding --port")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes (default 2)")
+    parser.add_argument("--app", default="app", help="Name of the WSGI app in the script")
+    args = parser.parse_args()
+    if args.fd is None and args.port is None:
+        parser.error("one of --port or --fd is required")
+
+    sock = socket.socket(fileno=args.fd) if args.fd is not None else listen(args.host, args.port)
+    if not hasattr(os, 'fork'):
+        # No fork (Windows): one threaded process
+        server = make_server(sock, load_app(args.script, args.app))
+        host, port = sock.getsockname()[:2]
+        print(f"🚀 Serving {Path(args.script).name} on http://{host}:{port}", flush=True)
+        mark_ready()
+        server.serve_forever()
+        return
+
+    PreforkServer(args.script, sock, args.workers, args.app).serve()
+
+if __name__ == '__main__':
+    main()
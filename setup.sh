@@ -26,6 +26,7 @@ INSTALL_NOTIFICATIONS="n"
 OS=""
 AUDIO_PLAYER=""
 OVERWRITE_ALL="n"
+UNCHANGED_COUNT=0
 SKIP_ALL="n"
 
 # Print colored output
@@ -331,7 +332,7 @@ handle_file_conflict() {
     
     # If policies are already set, apply them
     if [ "$OVERWRITE_ALL" = "y" ]; then
-        cp "$source_file" "$dest_file"
+        install_file "$source_file" "$dest_file"
         return 0
     elif [ "$SKIP_ALL" = "y" ]; then
         return 1
@@ -354,7 +355,7 @@ handle_file_conflict() {
     
     case "$choice" in
         o)
-            cp "$source_file" "$dest_file"
+            install_file "$source_file" "$dest_file"
             print_color "$GREEN" "   ✓ Overwritten"
             return 0
             ;;
@@ -364,7 +365,7 @@ handle_file_conflict() {
             ;;
         a)
             OVERWRITE_ALL="y"
-            cp "$source_file" "$dest_file"
+            install_file "$source_file" "$dest_file"
             print_color "$GREEN" "   ✓ Overwritten (will automatically overwrite all future conflicts)"
             return 0
             ;;
@@ -380,6 +381,16 @@ handle_file_conflict() {
     esac
 }
 
+# Replace a file atomically: copy to a temporary name, then rename over the target
+install_file() {
+    local source="$1"
+    local dest="$2"
+    local temp
+    temp="$(dirname "$dest")/.$(basename "$dest").$$.tmp"
+    
+    cp -p "$source" "$temp" && mv -f "$temp" "$dest"
+}
+
 # Copy a file with conflict handling
 copy_with_check() {
     local source="$1"
@@ -387,9 +398,14 @@ copy_with_check() {
     local file_type="$3"
     
     if [ -f "$dest" ]; then
+        # Identical content: nothing to copy and nothing to ask
+        if cmp -s "$source" "$dest"; then
+            UNCHANGED_COUNT=$((UNCHANGED_COUNT + 1))
+            return 0
+        fi
         handle_file_conflict "$source" "$dest" "$file_type"
     else
-        cp "$source" "$dest"
+        install_file "$source" "$dest"
     fi
 }
 
@@ -565,7 +581,11 @@ copy_framework_files() {
         print_color "$YELLOW" "→ Skipped MCP-ASSISTANT-RULES.md (Gemini not selected)"
     fi
     
-    print_color "$GREEN" "✓ Framework files copied"
+    if [ "$UNCHANGED_COUNT" -gt 0 ]; then
+        print_color "$GREEN" "✓ Framework files copied ($UNCHANGED_COUNT already up to date)"
+    else
+        print_color "$GREEN" "✓ Framework files copied"
+    fi
 }
 
 # Set executable permissions
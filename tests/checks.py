@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Shared pass/fail tally for the script-style tests
+
+The test scripts are run directly (``python tests/test-*.py``), so this
+directory is already on sys.path and they import it as a plain module.
+"""
+
+
+class Checks:
+    """Print one [OK]/[FAIL] line per check and the totals at the end"""
+
+    def __init__(self, title):
+        self.passed = 0
+        self.failed = 0
+        print("=" * 60)
+        print(title)
+        print("=" * 60)
+
+    def __call__(self, ok, message):
+        print(f"[OK] {message}" if ok else f"[FAIL] {message}")
+        if ok:
+            self.passed += 1
+        else:
+            self.failed += 1
+
+    def report(self):
+        """Print the totals; True when every check passed"""
+        print("\n" + "-" * 60)
+        print(f"[OK] Passed: {self.passed}")
+        print(f"[FAIL] Failed: {self.failed}")
+        return self.failed == 0
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Fake MCP Server for CCDK i124q tests
+====================================
+
+Minimal MCP server on the stdio transport (one JSON-RPC message per line).
+Requests are handled concurrently, so responses can come back out of order.
+
+Methods:
+    initialize              handshake result
+    ping                    {}
+    echo {value, delay}     returns {"value": value} after ``delay`` seconds
+    tools/list              one fake tool
+    junk {value}            writes non-object JSON lines, then echoes ``value``
+    crash                   exits immediately with code 3
+    stats                   requests seen and cancellations received
+
+With FAKE_MCP_IGNORE_TERM=1 the server ignores SIGTERM, so stopping it
+takes until the client's kill timeout.
+
+Author: CCDK i124q Integration Team
+"""
+
+import os
+import sys
+import json
+import signal
+import asyncio
+
+stats = {"requests": 0, "cancelled": []}
+tasks = {}
+
+
+async def handle(message, write):
+    method = message.get("method")
+    params = message.get("params") or {}
+    if method == "initialize":
+        result = {
+            "protocolVersion": params.get("protocolVersion", "2024-11-05"),
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "fake-mcp", "version": "1.0.0"},
+        }
+    elif method == "ping":
+        result = {}
+    elif method == "echo":
+        if params.get("delay"):
+            await asyncio.sleep(params["delay"])
+        result = {"value": params.get("value")}
+    elif method == "tools/list":
+        result = {"tools": [{"name": "fake_echo", "description": "Echo", "inputSchema": {"type": "object"}}]}
+    elif method == "junk":
+        for line in ("5", "[1, 2]", '"text"', "null", '{"id": [1], "result": {}}'):
+            sys.stdout.write(line + "\n")
+        result = {"value": params.get("value")}
+    elif method == "stats":
+        result = stats
+    elif method == "crash":
+        sys.exit(3)
+    else:
+        write({"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32601, "message": "Method not found"}})
+        return
+    write({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=16 * 1024 * 1024)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    def write(message):
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        message = json.loads(line)
+        if "id" not in message:
+            if message.get("method") == "notifications/cancelled":
+                request_id = message["params"]["requestId"]
+                stats["cancelled"].append(request_id)
+                task = tasks.pop(request_id, None)
+                if task is not None:
+                    task.cancel()
+            continue
+        stats["requests"] += 1
+        if message.get("method") == "crash":
+            sys.exit(3)
+        task = asyncio.create_task(handle(message, write))
+        tasks[message["id"]] = task
+        task.add_done_callback(lambda _, request_id=message["id"]: tasks.pop(request_id, None))
+
+
+if __name__ == "__main__":
+    if os.environ.get("FAKE_MCP_IGNORE_TERM"):
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the launcher and pre-fork dashboard tests
+
+The test scripts are run directly (``python tests/test-*.py``), so this
+directory is already on sys.path and they import it as a plain module.
+"""
+
+import time
+import socket
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_launcher():
+    """Import launch-ccdk-i124q.py as a fresh module"""
+    spec = importlib.util.spec_from_file_location("launcher", ROOT / "launch-ccdk-i124q.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(condition, timeout):
+    """Poll ``condition`` until it is true; returns False after ``timeout`` seconds"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Bridge Daemon Test
+Resident bridge over a Unix socket: results, errors and per-call overhead
+"""
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+BRIDGE = ROOT / "integrations" / "thinkchain-bridge.py"
+
+# Add integrations directory to path
+sys.path.insert(0, str(ROOT / "integrations"))
+
+BASE_TOOL = '''
+class BaseTool:
+    pass
+'''
+
+ECHO_TOOL = '''
+from tools.base import BaseTool
+
+class EchoTool(BaseTool):
+    name = "echo"
+    description = "Echo text back"
+    input_schema = {"type": "object", "required": ["text"],
+                    "properties": {"text": {"type": "string"}, "weight": {"type": "number", "multipleOf": 0.5}}}
+
+    def execute(self, text, weight=None):
+        return text
+'''
+
+BROKEN_TOOL = '''
+from tools.base import BaseTool
+
+class BrokenTool(BaseTool):
+    def __init__(self):
+        raise RuntimeError("cannot start")
+
+    def execute(self):
+        return None
+'''
+
+# Mean round trip for a trivial tool call through the daemon
+MAX_ROUND_TRIP_MS = 1.0
+
+
+def main():
+    check = Checks("THINKCHAIN BRIDGE DAEMON TEST")
+
+    if not hasattr(os, "fork"):
+        print("[SKIP] Unix sockets are not available on this platform")
+        return True
+
+    workdir = Path(tempfile.mkdtemp(prefix="thinkchain-daemon-"))
+    (workdir / "tools").mkdir()
+    (workdir / "tools" / "__init__.py").write_text("")
+    (workdir / "tools" / "base.py").write_text(BASE_TOOL)
+    (workdir / "tools" / "echotool.py").write_text(ECHO_TOOL)
+    (workdir / "tools" / "brokentool.py").write_text(BROKEN_TOOL)
+    socket_path = workdir / "bridge.sock"
+    env = dict(os.environ, THINKCHAIN_DIR=str(workdir), THINKCHAIN_BRIDGE_SOCKET=str(socket_path))
+
+    os.environ.update(env)
+    from thinkchain_client import BridgeClient
+
+    server = subprocess.Popen([sys.executable, str(BRIDGE), "serve"], env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    client = BridgeClient(socket_path, timeout=10)
+    try:
+        print("\n[TEST] Start-up")
+        print("-" * 40)
+        deadline = time.monotonic() + 30
+        while not client.connect() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        check(client.connect(), f"Daemon accepts connections on {socket_path.name}")
+        if not client.connect():
+            return False
+
+        print("\n[TEST] Requests")
+        print("-" * 40)
+        check(client.ping().get("pid") == server.pid, "ping reports the daemon pid")
+        check(sorted(t["name"] for t in client.list_tools()) == ["BrokenTool", "echo"], "list returns the discovered tools")
+        result = client.execute("echo", {"text": "hi"})
+        check(result == {"success": True, "result": "hi"}, f"execute -> {result}")
+        result = client.execute("echo", {})
+        check(result.get("invalid_arguments") is True, "Invalid arguments are rejected")
+        result = client.execute("missing", {})
+        check(result.get("success") is False, "Unknown tool returns an error")
+        results = client.execute_many([{"tool": "echo", "args": {"text": str(i)}} for i in range(5)])
+        check([r.get("result") for r in results] == ["0", "1", "2", "3", "4"], "execute_many keeps call order")
+        events = list(client.stream("echo", {"text": "s"}))
+        check([e["event"] for e in events] == ["start", "end"] and events[-1].get("result") == "s",
+              "stream forwards events up to the end event")
+        result = client.execute("echo", {"text": "x", "weight": 10 ** 400})
+        check(result.get("success") is False and "Cannot validate" in result.get("error", ""),
+              "A validator that raises returns an error result")
+        events = list(client.stream("BrokenTool", {}))
+        check(events[-1].get("event") == "end" and events[-1].get("success") is False
+              and "cannot start" in events[-1].get("error", ""), "A failing stream ends with an error event")
+        check(client.ping().get("pid") == server.pid, "The connection survives a failing stream")
+
+        cli = subprocess.run([sys.executable, str(ROOT / "integrations" / "thinkchain_client.py"),
+                              "execute", "--tool", "echo", "--args", '{"text": "cli"}'],
+                             env=env, capture_output=True, text=True, timeout=30)
+        check(cli.returncode == 0 and '"cli"' in cli.stdout, "Hook client CLI runs through the daemon")
+
+        print("\n[TEST] Round-trip Overhead")
+        print("-" * 40)
+        iterations = 1000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            client.execute("echo", {"text": "x"})
+        per_call_ms = (time.perf_counter() - start) / iterations * 1000
+        check(per_call_ms < MAX_ROUND_TRIP_MS,
+              f"Mean round trip: {per_call_ms:.3f}ms (budget {MAX_ROUND_TRIP_MS}ms)")
+
+        print("\n[TEST] Shutdown")
+        print("-" * 40)
+        client.shutdown()
+        client.close()
+        server.wait(timeout=15)
+        check(not socket_path.exists(), "Daemon removes its socket on exit")
+    finally:
+        client.close()
+        if server.poll() is None:
+            server.kill()
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Incremental File Deployment Test
+Hash manifest, atomic replacement and stale-file removal
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+import importlib.util
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "integrations"))
+
+from file_deploy import deploy, MANIFEST_NAME  # noqa: E402
+
+
+def load_installer():
+    spec = importlib.util.spec_from_file_location("installer", ROOT / "install-ccdk-i124q.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def snapshot(directory):
+    """(inode, mtime) of every file, to prove a run touched nothing"""
+    return {path: (path.stat().st_ino, path.stat().st_mtime_ns) for path in directory.rglob("*") if path.is_file()}
+
+
+def main():
+    check = Checks("INCREMENTAL FILE DEPLOYMENT TEST")
+
+    tmp = Path(tempfile.mkdtemp(prefix="ccdk-deploy-"))
+    source, target = tmp / "source", tmp / "target"
+    (source / "webui" / "static").mkdir(parents=True)
+    (source / "webui" / "__pycache__").mkdir()
+    (source / "app.py").write_text("print('app')\n")
+    (source / "webui" / "app.py").write_text("print('webui')\n")
+    (source / "webui" / "static" / "style.css").write_text("body {}\n")
+    (source / "webui" / "__pycache__" / "app.cpython-311.pyc").write_bytes(b"cache")
+    paths = ["app.py", "webui"]
+
+    try:
+        print("\n[TEST] First Deploy")
+        print("-" * 40)
+        stats = deploy(source, target, paths)
+        check(stats["linked"] + stats["copied"] == 3, f"Three files deployed: {stats}")
+        check(not (target / "webui" / "__pycache__").exists(), "Bytecode caches are not deployed")
+        check((target / MANIFEST_NAME).exists(), "Manifest written")
+
+        print("\n[TEST] Up-to-date Re-run")
+        print("-" * 40)
+        before = snapshot(target)
+        started = time.perf_counter()
+        stats = deploy(source, target, paths)
+        elapsed = time.perf_counter() - started
+        check(stats["unchanged"] == 3 and stats["linked"] + stats["copied"] + stats["removed"] == 0,
+              f"Nothing redeployed: {stats}")
+        check(snapshot(target) == before, "Zero files touched, manifest included")
+        check(elapsed < 1.0, f"Re-run took {elapsed * 1000:.1f} ms")
+
+        print("\n[TEST] Changed and Stale Files")
+        print("-" * 40)
+        (source / "webui" / "app.py").write_text("print('webui v2')\n")
+        (source / "app.py").unlink()
+        shutil.rmtree(source / "webui" / "static")
+        (target / "notes.txt").write_text("mine")
+        stats = deploy(source, target, ["app.py", "webui"])
+        check(stats["linked"] + stats["copied"] == 1 and stats["removed"] == 2, f"One update, two removals: {stats}")
+        check((target / "webui" / "app.py").read_text() == "print('webui v2')\n", "Changed file has the new content")
+        check(not (target / "app.py").exists() and not (target / "webui" / "static").exists(),
+              "Stale files and their empty directories removed")
+        check((target / "notes.txt").exists(), "Files the deployer did not create are left alone")
+        check(not list(target.rglob("*.tmp")), "No temporary files left behind")
+
+        print("\n[TEST] Damaged Target")
+        print("-" * 40)
+        damaged = target / "webui" / "app.py"
+        damaged.unlink()
+        damaged.write_text("edited by hand\n")
+        stats = deploy(source, target, ["webui"], link=False)
+        check(stats["copied"] == 1 and damaged.read_text() == "print('webui v2')\n",
+              "A target that no longer matches the manifest is redeployed")
+        check(damaged.stat().st_ino != (source / "webui" / "app.py").stat().st_ino, "link=False copies")
+
+        print("\n[TEST] Installer Dashboards")
+        print("-" * 40)
+        module = load_installer()
+        installer = module.CCDKi124qInstaller()
+        installer.install_dir = ROOT
+        installer.claude_dir = tmp / "home" / ".claude"
+        check(installer.install_dashboard_files()
+              and (installer.claude_dir / "dashboards" / "webui" / "app-enhanced.py").exists(),
+              "Dashboards deployed to ~/.claude/dashboards")
+        before = snapshot(installer.claude_dir / "dashboards")
+        started = time.perf_counter()
+        installer.install_dashboard_files()
+        elapsed = time.perf_counter() - started
+        check(snapshot(installer.claude_dir / "dashboards") == before and elapsed < 1.0,
+              f"Up-to-date reinstall touched nothing ({elapsed * 1000:.1f} ms)")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
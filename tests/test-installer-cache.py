@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Installer Offline Cache Test
+Lockfile pinning and network-free installs from a vendored cache
+"""
+
+import os
+import sys
+import json
+import platform
+import shutil
+import zipfile
+import tempfile
+import subprocess
+import importlib.util
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_installer():
+    spec = importlib.util.spec_from_file_location("installer", ROOT / "install-ccdk-i124q.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_wheel(directory, name="ccdk_demo", version="1.0", requires=()):
+    """A minimal pure-Python wheel, so the test needs no index"""
+    dist_info = f"{name}-{version}.dist-info"
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    metadata += "".join(f"Requires-Dist: {requirement}\n" for requirement in requires)
+    files = {
+        f"{name}.py": "VALUE = 42\n",
+        f"{dist_info}/METADATA": metadata,
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+    }
+    files[f"{dist_info}/RECORD"] = "".join(f"{path},,\n" for path in files) + f"{dist_info}/RECORD,,\n"
+    wheel = directory / f"{name}-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w") as archive:
+        for path, content in files.items():
+            archive.writestr(path, content)
+    return wheel
+
+
+def main():
+    check = Checks("INSTALLER OFFLINE CACHE TEST")
+
+    module = load_installer()
+    tmp = Path(tempfile.mkdtemp(prefix="ccdk-cache-"))
+    installer = module.CCDKi124qInstaller()
+    installer.cache_dir = tmp / "cache"
+    installer.claude_dir = tmp / "home" / ".claude"
+    installer.offline = True
+    (installer.cache_dir / "wheels").mkdir(parents=True)
+    (installer.cache_dir / "npm").mkdir()
+    saved_env = dict(os.environ)
+
+    try:
+        print("\n[TEST] Missing Cache")
+        print("-" * 40)
+        try:
+            installer.load_cache_lock()
+            check(False, "A missing lockfile is reported")
+        except ValueError as e:
+            check("--build-cache" in str(e), f"A missing lockfile is reported: {e}")
+
+        print("\n[TEST] Lockfile")
+        print("-" * 40)
+        build_wheel(installer.cache_dir / "wheels", requires=["ccdk_dep"])
+        build_wheel(installer.cache_dir / "wheels", name="ccdk_dep")
+        build_wheel(installer.cache_dir / "wheels", name="ccdk_other")
+        has_npm = shutil.which("npm") is not None
+        package = tmp / "demo-cli"
+        package.mkdir()
+        (package / "package.json").write_text(json.dumps(
+            {"name": "demo-cli", "version": "1.2.3", "bin": {"demo-cli": "cli.js"}}))
+        (package / "cli.js").write_text("#!/usr/bin/env node\nconsole.log('hi')\n")
+        if has_npm:
+            subprocess.run(["npm", "pack", str(package), "--pack-destination", str(installer.cache_dir / "npm")],
+                           check=True, capture_output=True)
+        else:
+            (installer.cache_dir / "npm" / "demo-cli-1.2.3.tgz").write_bytes(b"not a real tarball")
+        built_on = {"python_version": platform.python_version(), "system": platform.system(),
+                    "machine": platform.machine()}
+        lock = installer.write_cache_lock(dict(built_on, npm={"name": "demo-cli", "version": "1.2.3",
+                                                              "file": "demo-cli-1.2.3.tgz"}))
+        wheel = lock["python"][0]
+        check((wheel["name"], wheel["version"]) == ("ccdk_demo", "1.0") and len(wheel["sha256"]) == 64,
+              f"Wheel pinned: {wheel['file']}")
+        check(len(lock["npm"]["sha256"]) == 64, "npm tarball pinned")
+        check(installer.load_cache_lock() == lock, "Lockfile reads back")
+
+        print("\n[TEST] Offline pip Install")
+        print("-" * 40)
+        target = tmp / "site-packages"
+        os.environ["PIP_TARGET"] = str(target)  # keep the test out of this interpreter's site-packages
+        os.environ["PIP_INDEX_URL"] = "http://127.0.0.1:9/unreachable"
+        installer.pip_install(["ccdk-demo"])
+        check((target / "ccdk_demo.py").exists() and (target / "ccdk_dep.py").exists(),
+              "Requested wheel and its dependency installed with --no-index")
+        check(not (target / "ccdk_other.py").exists(), "Locked wheels that were not requested are left out")
+
+        wheel_path = installer.cache_dir / "wheels" / wheel["file"]
+        original = wheel_path.read_bytes()
+        wheel_path.write_bytes(original + b"tampered")
+        try:
+            shutil.rmtree(target)
+            installer.pip_install(["ccdk-demo"])
+            check(False, "A wheel that no longer matches its hash is refused")
+        except subprocess.CalledProcessError as e:
+            check(b"hash" in e.stderr.lower(), "A wheel that no longer matches its hash is refused")
+        wheel_path.write_bytes(original)
+
+        lock_path = installer.cache_dir / module.CACHE_LOCK
+        saved_lock = lock_path.read_text()
+        lock_path.write_text(json.dumps(dict(lock, python_version="2.7.18", machine="sparc")))
+        try:
+            installer.pip_install(["ccdk-demo"])
+            check(False, "A cache built for another Python or platform is refused")
+        except ValueError as e:
+            check("Python 2.7 on" in str(e) and "--build-cache" in str(e),
+                  f"A cache built for another Python or platform is refused: {e}")
+        lock_path.write_text(saved_lock)
+
+        print("\n[TEST] Offline npm Install")
+        print("-" * 40)
+        if has_npm:
+            os.environ["npm_config_prefix"] = str(tmp / "npm-global")
+            check(installer.install_templates_cli() and (tmp / "npm-global" / "bin" / "demo-cli").exists(),
+                  "Templates CLI installed from the locked tarball")
+        else:
+            print("[SKIP] npm not installed")
+        tarball = installer.cache_dir / "npm" / "demo-cli-1.2.3.tgz"
+        tarball.write_bytes(tarball.read_bytes() + b"x")
+        check(not installer.install_templates_cli() and "does not match" in installer.errors[-1],
+              "A tampered tarball is refused")
+
+        print("\n[TEST] Offline ThinkChain")
+        print("-" * 40)
+        repo = installer.cache_dir / "thinkchain"
+        (repo / "tools").mkdir(parents=True)
+        (repo / "tools" / "echo.py").write_text("print('echo')\n")
+        (repo / "mcp_config.json").write_text("{}")
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        subprocess.run(["git", "-C", str(repo), "add", "."], check=True)
+        subprocess.run(["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t",
+                        "commit", "-qm", "tools"], check=True)
+        (installer.claude_dir / "thinkchain" / "tools").mkdir(parents=True)
+        check(installer.install_thinkchain_tools()
+              and (installer.claude_dir / "thinkchain" / "tools" / "echo.py").exists(),
+              "ThinkChain copied from the vendored clone")
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Installer Pipeline Test
+Concurrent installation steps, resumable after a failure, with per-step timing
+"""
+
+import io
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import subprocess
+import importlib.util
+import contextlib
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_installer():
+    spec = importlib.util.spec_from_file_location("installer", ROOT / "install-ccdk-i124q.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    check = Checks("INSTALLER PIPELINE TEST")
+
+    module = load_installer()
+    home = Path(tempfile.mkdtemp(prefix="ccdk-install-"))
+    calls = []
+    failing = {"thinkchain"}
+    pip = {"active": 0, "most": 0}
+    pip_lock = threading.Lock()
+    real_run = subprocess.run
+
+    def fake_run(command, *args, **kwargs):
+        """pip runs take a while and record how many overlap; everything else runs for real"""
+        if command[1:3] != ["-m", "pip"]:
+            return real_run(command, *args, **kwargs)
+        with pip_lock:
+            pip["active"] += 1
+            pip["most"] = max(pip["most"], pip["active"])
+        time.sleep(0.5)
+        with pip_lock:
+            pip["active"] -= 1
+        return subprocess.CompletedProcess(command, 0)
+
+    module.subprocess.run = fake_run
+
+    def installer():
+        """An installer whose slow steps are stand-ins that sleep instead of downloading"""
+        instance = module.CCDKi124qInstaller()
+        instance.home_dir = home
+        instance.claude_dir = home / ".claude"
+
+        def step(key, seconds=0.0, packages=None):
+            def run():
+                calls.append((key, time.monotonic()))
+                print(f"{key} started")
+                if packages:
+                    instance.pip_install(packages)
+                time.sleep(seconds)
+                return key not in failing
+            return run
+
+        instance.check_prerequisites = step("prerequisites")
+        instance.install_python_dependencies = step("python", 0.5, module.PYTHON_PACKAGES)
+        instance.install_templates_cli = step("templates", 1.0)
+        instance.install_thinkchain_tools = step("thinkchain", 1.0)
+        instance.install_superclaude_framework = step("superclaude", 0.0, [module.SUPERCLAUDE_PACKAGE])
+        instance.run_post_install_checks = step("post-checks")
+        instance.print_banner = lambda: None
+        instance.display_completion_summary = lambda success: None
+        return instance
+
+    try:
+        print("\n[TEST] Concurrent Steps")
+        print("-" * 40)
+        first = installer()
+        printed = io.StringIO()
+        started = time.monotonic()
+        with contextlib.redirect_stdout(printed):
+            ok = first.run_installation()
+        elapsed = time.monotonic() - started
+        check(not ok, "A failed step fails the installation")
+        check(elapsed < 2.0, f"pip, npm and git steps overlapped ({elapsed:.1f}s for three 1s steps)")
+        starts = dict(calls)
+        check(abs(starts["superclaude"] - starts["python"]) < 0.3, "Both pip steps start together")
+        check(pip["most"] == 1, "pip_install runs one pip at a time")
+        lines = printed.getvalue().splitlines()
+        check("[python] python started" in lines and "[thinkchain] thinkchain started" in lines
+              and "[superclaude]    Installing SuperClaude..." in lines, "Step output is prefixed with the step")
+        check((home / ".claude" / "CLAUDE.md").exists() and (home / ".claude" / "settings.json").exists(),
+              "Real configuration step ran")
+
+        print("\n[TEST] Resume After Failure")
+        print("-" * 40)
+        state = first.load_install_state()["completed"]
+        check(set(state) == {"prerequisites", "directories", "python", "templates", "superclaude",
+                             "configuration", "dashboards"}, f"Completed steps recorded: {sorted(state)}")
+        check(first.timings["ThinkChain components"][1] == "failed"
+              and first.timings["Python dependencies"][0] >= 1.0, "Per-step timing and outcome recorded")
+
+        other = installer()
+        other.offline = True
+        check(other.load_install_state()["completed"] == {}, "Progress saved without --offline is not resumed with it")
+
+        calls.clear()
+        failing.clear()
+        second = installer()
+        check(second.run_installation(), "Re-run completes the installation")
+        check([key for key, _ in calls] == ["thinkchain", "post-checks"],
+              f"Only the failed step was redone: {[key for key, _ in calls]}")
+        check(second.timings["Python dependencies"][1] == "resumed", "Earlier steps reported as resumed")
+        check(not (home / ".claude" / module.INSTALL_STATE).exists(), "Saved progress cleared after success")
+
+        print("\n[TEST] Skipped Dependents")
+        print("-" * 40)
+        calls.clear()
+        failing.add("prerequisites")
+        third = installer()
+        third.force = True
+        third.run_installation()
+        check([key for key, _ in calls] == ["prerequisites", "post-checks"]
+              and third.timings["SuperClaude Framework"][1] == "skipped",
+              "Steps depending on a failed step are skipped")
+        check(any("SuperClaude Framework skipped" in error for error in third.errors), "Skipped steps are reported")
+    finally:
+        module.subprocess.run = real_run
+        shutil.rmtree(home, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Launcher Log Pump Test
+Chatty services never stall on full pipes; output is rotated on disk and bounded in memory
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+
+from checks import Checks
+from launcher_fixtures import load_launcher, free_port
+
+# Far more than a 64KB pipe buffer on both streams before signalling readiness
+CHATTY = '''
+import sys, time
+for i in range(20000):
+    print(f"stdout line {i} " + "x" * 100)
+    print(f"stderr line {i} " + "y" * 100, file=sys.stderr)
+sys.stdout.flush()
+time.sleep(0.5)  # let both pumps catch up so "up" is the latest line
+print("up", flush=True)
+time.sleep(3600)
+'''
+
+
+def main():
+    check = Checks("LAUNCHER LOG PUMP TEST")
+
+    module = load_launcher()
+    module.LOG_MAX_BYTES = 256 * 1024
+    module.LOG_RING_LINES = 100
+
+    launcher = module.CCDKi124qLauncher()
+    launcher.app_dir = Path(tempfile.mkdtemp(prefix="ccdk-launcher-"))
+    module.LOG_DIR = launcher.app_dir / "logs"
+    script = launcher.app_dir / "service-chatty.py"
+    script.write_text(CHATTY)
+    service = {"name": "Chatty Service", "script": script, "port": free_port(), "description": "chatty",
+               "probe": {"ready_line": "^up$"}, "ready_timeout": 20.0}
+
+    try:
+        print("\n[TEST] Draining")
+        print("-" * 40)
+        start = time.monotonic()
+        check(launcher.start_service(service), f"Ready after ~4MB of output in {time.monotonic() - start:.1f}s")
+
+        print("\n[TEST] Ring Buffer")
+        print("-" * 40)
+        log = launcher.logs["Chatty Service"]
+        check(len(log.lines) == 100, f"Memory tail bounded at {len(log.lines)} lines")
+        tail = log.tail(3)
+        check(tail[-1][1:] == ("stdout", "up"), f"Latest line: {tail[-1][1:]}")
+
+        print("\n[TEST] Rotating Files")
+        print("-" * 40)
+        files = sorted(p.name for p in module.LOG_DIR.iterdir())
+        check(files == ["chatty-service.log", "chatty-service.log.1", "chatty-service.log.2",
+                        "chatty-service.log.3"], f"Rotated files: {files}")
+        sizes_ok = all(p.stat().st_size <= module.LOG_MAX_BYTES + 1024 for p in module.LOG_DIR.iterdir())
+        check(sizes_ok, "No log file grows past its size limit")
+
+        print("\n[TEST] Tail View")
+        print("-" * 40)
+        port = free_port()
+        launcher.start_status_server(port)
+        url = f"http://127.0.0.1:{port}/logs/Chatty%20Service?lines=2"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            text = response.read().decode("utf-8").splitlines()
+        check(len(text) == 2 and text[-1].endswith("[stdout] up"), f"GET /logs/<service>: {text}")
+    finally:
+        launcher.cleanup_services()
+        shutil.rmtree(launcher.app_dir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
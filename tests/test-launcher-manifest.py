@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Launcher Manifest Test
+Services declared in a manifest, started in dependency waves
+"""
+
+import sys
+import json
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+from checks import Checks
+from launcher_fixtures import load_launcher, free_port, wait_for
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Ready after a second; records when, so the test can check the start order
+SERVICE = '''
+import os, sys, time
+time.sleep(1.0)
+with open(os.environ["STARTED_LOG"], "a") as log:
+    log.write(f"{sys.argv[0]} {time.time()}\\n")
+print("up", os.environ.get("GREETING", ""), flush=True)
+time.sleep(3600)
+'''
+
+
+def main():
+    check = Checks("LAUNCHER MANIFEST TEST")
+
+    module = load_launcher()
+    tmp = Path(tempfile.mkdtemp(prefix="ccdk-manifest-"))
+
+    def manifest(services, name="services.json"):
+        path = tmp / name
+        path.write_text(json.dumps({"services": services}))
+        return path
+
+    def rejected(services):
+        try:
+            module.service_waves(module.load_manifest(manifest(services), tmp))
+        except ValueError as e:
+            return str(e)
+        return None
+
+    print("\n[TEST] Default Manifest")
+    print("-" * 40)
+    services = module.load_manifest(ROOT / "services.json", Path("/app"))
+    by_name = {service["name"]: service for service in services}
+    check(sorted(service["port"] for service in services) == [3000, 3333, 5005, 7000],
+          f"{len(services)} services on the usual ports")
+    check(by_name["Unified Dashboard"]["script"] == Path("/app/unified-dashboard.py"),
+          "Scripts resolve against the app directory")
+    check(by_name["Templates Analytics"].get("optional") is True, "Templates CLI is optional by declaration")
+    waves = [[service["name"] for service in wave] for wave in module.service_waves(services)]
+    check(len(waves) == 1, f"Independent default services start in one wave: {waves}")
+
+    print("\n[TEST] Validation")
+    print("-" * 40)
+    error = rejected({"a": {"command": ["x"], "port": 1, "depends_on": ["b"]},
+                      "b": {"command": ["x"], "port": 2, "depends_on": ["a"]}})
+    check(error and "cycle" in error, f"Cycle rejected: {error}")
+    error = rejected({"a": {"command": ["x"], "port": 1, "depends_on": ["ghost"]}})
+    check(error and "ghost" in error, f"Unknown dependency rejected: {error}")
+    error = rejected({"a": {"command": ["x"], "port": 1, "restart": "sometimes"}})
+    check(error and "sometimes" in error, f"Unknown restart policy rejected: {error}")
+    error = rejected({"a": {"port": 1}})
+    check(error and "script or a command" in error, f"Service without a script or command rejected: {error}")
+    command = module.load_manifest(manifest({"a": {"command": ["{python}", "--port", "{port}"], "port": 81}}))
+    check(command[0]["command"] == [sys.executable, "--port", "81"], "{python} and {port} filled into commands")
+    if sys.version_info >= (3, 11):
+        toml = tmp / "services.toml"
+        toml.write_text('[services.web]\ncommand = ["x"]\nport = 80\n')
+        check(module.load_manifest(toml)[0]["name"] == "web", "TOML manifests load too")
+    else:
+        print("[SKIP] TOML manifests need Python 3.11+")
+
+    print("\n[TEST] Dependency Waves")
+    print("-" * 40)
+    module.RESTART_INITIAL_DELAY = 0.05
+    module.LOG_DIR = tmp / "logs"
+    started_log = tmp / "started.log"
+    for name in ("db", "cache", "api"):
+        (tmp / f"service-{name}.py").write_text(SERVICE)
+    (tmp / "service-broken.py").write_text("raise SystemExit(1)")
+    (tmp / "service-once.py").write_text("print('up', flush=True)")
+
+    def spec(name, **extra):
+        env = dict(extra.pop("env", {}), STARTED_LOG=str(started_log))
+        return dict({"script": f"service-{name}.py", "port": free_port(), "env": env,
+                     "probe": {"ready_line": "up"}, "ready_timeout": 10}, **extra)
+
+    launcher = module.CCDKi124qLauncher()
+    launcher.app_dir = tmp
+    launcher.manifest = manifest({
+        "db": spec("db", env={"GREETING": "hello"}),
+        "cache": spec("cache"),
+        "api": spec("api", depends_on=["db", "cache"]),
+        "broken": spec("broken", optional=True),
+        "reports": spec("api", depends_on=["broken"]),
+        "once": spec("once", restart="never"),
+    })
+    try:
+        started = time.monotonic()
+        started_services, failed_services = launcher.start_all_services()
+        elapsed = time.monotonic() - started
+        names = sorted(service["name"] for service in started_services)
+        check(names == ["api", "cache", "db", "once"], f"Started: {names}")
+        check([service["name"] for service in failed_services] == ["reports"],
+              "A service whose dependency failed is skipped and reported")
+        times = dict(line.split() for line in started_log.read_text().splitlines())
+        check(float(times[str(tmp / "service-api.py")]) >
+              max(float(times[str(tmp / "service-db.py")]), float(times[str(tmp / "service-cache.py")])),
+              "api started after db and cache were ready")
+        check(elapsed < 2.9, f"Independent services started together ({elapsed:.1f}s for two 1s waves)")
+        check(any("up hello" in line for _, _, line in launcher.logs["db"].tail(5)),
+              "Manifest env reaches the service")
+        check(wait_for(lambda: launcher.processes["once"]["state"] == "stopped", 5)
+              and launcher.processes["once"]["restarts"] == 0, "restart: never leaves an exited service stopped")
+    finally:
+        launcher.cleanup_services()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
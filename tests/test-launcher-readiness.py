@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Launcher Readiness Test
+Concurrent service start-up gated on readiness probes
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+from checks import Checks
+from launcher_fixtures import load_launcher, free_port
+
+# Serves on the socket the launcher hands over in CCDK_LISTEN_FD
+SERVICE = '''
+import os, sys, time, socket, http.server
+time.sleep({delay})
+server = http.server.HTTPServer(("127.0.0.1", {port}), http.server.SimpleHTTPRequestHandler,
+                                bind_and_activate=False)
+server.socket = socket.socket(fileno=int(os.environ["CCDK_LISTEN_FD"]))
+print("serving", flush=True)
+server.serve_forever()
+'''
+
+
+def main():
+    check = Checks("LAUNCHER READINESS TEST")
+
+    launcher_module = load_launcher()
+    launcher = launcher_module.CCDKi124qLauncher()
+    launcher.app_dir = Path(tempfile.mkdtemp(prefix="ccdk-launcher-"))
+    launcher_module.LOG_DIR = launcher.app_dir / "logs"
+
+    def service(name, delay, probe=None, timeout=10.0, body=None):
+        port = free_port()
+        script = launcher.app_dir / f"service-{name}.py"
+        script.write_text(body or SERVICE.format(delay=delay, port=port))
+        spec = {"name": name, "script": script, "port": port, "description": name, "ready_timeout": timeout}
+        if probe:
+            spec["probe"] = probe
+        return spec
+
+    try:
+        print("\n[TEST] Readiness Probes")
+        print("-" * 40)
+        check(launcher.start_service(service("web", 0.5)), "HTTP probe passes once the port serves")
+        check(launcher.start_service(service("ready-line", 0.5, {"ready_line": "serving"})),
+              "Ready-line probe passes on matching output")
+        check(not launcher.start_service(service("crash", 0, body="import sys; sys.exit(3)")),
+              "A service that exits during start-up is not reported as started")
+        check(not launcher.start_service(service("slow", 5, timeout=1.0)),
+              "A service that misses its deadline is not reported as started")
+        check("slow" not in launcher.processes, "A service that is not ready is stopped")
+
+        print("\n[TEST] Concurrent Start-up")
+        print("-" * 40)
+        services = [service(f"svc{i}", 1.0) for i in range(4)]
+        start = time.monotonic()
+        started, failed_services = launcher.start_services(services)
+        elapsed = time.monotonic() - start
+        check(len(started) == 4 and not failed_services, "All services ready")
+        check(elapsed < 3.0, f"Four 1s services ready in {elapsed:.1f}s, not the sum of their start-ups")
+    finally:
+        launcher.cleanup_services()
+        shutil.rmtree(launcher.app_dir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
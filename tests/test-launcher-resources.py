@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Launcher Resource Accounting Test
+/proc sampling per service, the metrics API and limit-triggered restarts
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+
+from checks import Checks
+from launcher_fixtures import load_launcher, free_port, wait_for
+
+STEADY = '''
+import time
+print("up", flush=True)
+time.sleep(3600)
+'''
+
+# Grows by ~20MB every 100ms until it is restarted
+LEAKING = '''
+import time
+print("up", flush=True)
+leak = []
+while True:
+    leak.append(bytearray(20 * 2**20))
+    time.sleep(0.1)
+'''
+
+
+def main():
+    check = Checks("LAUNCHER RESOURCE ACCOUNTING TEST")
+
+    if not Path("/proc/self/stat").exists():
+        print("[SKIP] Needs /proc")
+        return True
+
+    module = load_launcher()
+    module.SAMPLE_INTERVAL = 0.1
+    module.RESTART_INITIAL_DELAY = 0.05
+
+    print("\n[TEST] /proc Sampling")
+    print("-" * 40)
+    usage = module.read_proc_usage(os.getpid())
+    check(usage["rss_bytes"] > 0 and usage["threads"] >= 1 and usage["fds"] >= 3, f"Own usage: {usage}")
+    check(module.read_proc_usage(2**22 + 1) is None, "A missing process reads as None")
+
+    series = module.ResourceSeries(size=3)
+    for i in range(5):
+        series.add(1, {"cpu_seconds": i * 0.5, "rss_bytes": 2**20 * i, "fds": 4, "threads": 1}, now=100.0 + i)
+    latest = series.latest()
+    check(len(series.samples) == 3 and latest["rss_mb"] == 4.0, "Ring buffer keeps the newest samples")
+    check(latest["cpu_percent"] == 50.0, f"CPU averaged between samples: {latest['cpu_percent']}%")
+
+    launcher = module.CCDKi124qLauncher()
+    launcher.app_dir = Path(tempfile.mkdtemp(prefix="ccdk-resources-"))
+    module.LOG_DIR = launcher.app_dir / "logs"
+
+    def service(name, body, **extra):
+        script = launcher.app_dir / f"service-{name}.py"
+        script.write_text(body)
+        return dict({"name": name, "script": script, "port": free_port(), "description": name,
+                     "probe": {"ready_line": "up"}, "ready_timeout": 10.0}, **extra)
+
+    try:
+        print("\n[TEST] Per-service Samples")
+        print("-" * 40)
+        launcher.start_service(service("steady", STEADY))
+        launcher.start_resource_monitor()
+        check(wait_for(lambda: "steady" in launcher.resources and len(launcher.resources["steady"].samples) >= 3, 5),
+              "Running services are sampled periodically")
+        port = free_port()
+        launcher.start_status_server(port)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/status", timeout=5) as response:
+            status = json.load(response)["services"]["steady"]
+        check(status["resources"] and status["resources"]["rss_mb"] > 0, f"Status API: {status['resources']}")
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics/steady?points=2", timeout=5) as response:
+            history = json.load(response)
+        check(history["fields"][:3] == ["time", "cpu_percent", "rss_mb"] and len(history["samples"]) == 2,
+              "Metrics API returns the time series")
+
+        print("\n[TEST] Limit-triggered Restart")
+        print("-" * 40)
+        launcher.start_service(service("leaking", LEAKING, limits={"rss_mb": 150}))
+        info = launcher.processes["leaking"]
+        first = info["process"]
+        check(wait_for(lambda: info["limit_restarts"] >= 1, 15), f"Leaking service recycled: {info['last_limit']}")
+        check(wait_for(lambda: info["process"] is not first and info["state"] == "running", 5),
+              "Leaking service running again after the restart")
+        check(launcher.processes["steady"]["limit_restarts"] == 0, "Services within their limits are left alone")
+    finally:
+        launcher.cleanup_services()
+        shutil.rmtree(launcher.app_dir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Launcher Socket Handoff Test
+Listening sockets owned by the launcher survive service restarts
+"""
+
+import os
+import sys
+import shutil
+import socket
+import tempfile
+import threading
+import urllib.request
+from pathlib import Path
+
+from checks import Checks
+from launcher_fixtures import load_launcher, free_port, wait_for
+
+# Takes a moment to start, so a restart leaves the port without a server
+SERVICE = '''
+import os, time, socket, http.server
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = str(os.getpid()).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+time.sleep(0.5)
+server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler, bind_and_activate=False)
+server.socket = socket.socket(fileno=int(os.environ["CCDK_LISTEN_FD"]))
+print("up", flush=True)
+server.serve_forever()
+'''
+
+# Comes up, then exits shortly after
+FLAKY = '''
+import time
+print("up", flush=True)
+time.sleep(0.3)
+raise SystemExit(1)
+'''
+
+APP = '''
+import os
+
+def app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [str(os.getpid()).encode()]
+'''
+
+
+def get(port, timeout=10):
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=timeout) as response:
+        return response.read().decode()
+
+
+def main():
+    check = Checks("LAUNCHER SOCKET HANDOFF TEST")
+
+    module = load_launcher()
+    module.RESTART_INITIAL_DELAY = 0.05
+    launcher = module.CCDKi124qLauncher()
+    launcher.app_dir = Path(tempfile.mkdtemp(prefix="ccdk-handoff-"))
+    module.LOG_DIR = launcher.app_dir / "logs"
+
+    try:
+        print("\n[TEST] Inherited Socket")
+        print("-" * 40)
+        script = launcher.app_dir / "service-web.py"
+        script.write_text(SERVICE)
+        port = free_port()
+        check(launcher.start_service({"name": "web", "script": script, "port": port, "description": "web"}),
+              "Service started on the launcher's socket")
+        sock = launcher.sockets.get("web")
+        check(sock is not None and sock.getsockname()[1] == port, f"Launcher owns port {port}")
+        first = get(port)
+        check(first == str(launcher.processes["web"]["process"].pid), "Requests reach the service")
+
+        print("\n[TEST] Restart Without Refused Connections")
+        print("-" * 40)
+        launcher.processes["web"]["process"].kill()
+        results, errors = [], []
+
+        def client():
+            try:
+                results.append(get(port))
+            except OSError as e:
+                errors.append(e)
+
+        clients = [threading.Thread(target=client) for _ in range(20)]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        check(not errors, f"{len(results)} requests during the restart, {len(errors)} errors {errors[:1]}")
+        check(results and all(pid != first for pid in results), "Queued requests were served by the new process")
+        check(launcher.sockets["web"] is sock, "The same socket is reused across restarts")
+
+        print("\n[TEST] Pre-forked Service")
+        print("-" * 40)
+        if hasattr(os, "fork"):
+            app = launcher.app_dir / "app.py"
+            app.write_text(APP)
+            launcher.workers = {"*": 2}
+            port = free_port()
+            check(launcher.start_service({"name": "dash", "script": app, "port": port, "description": "dash"}),
+                  "Pre-forked service started")
+            command = launcher.processes["dash"]["command"]
+            check("--fd" in command and "--port" not in command, "Workers are handed the socket, not the port")
+            check(get(port).isdigit(), "Workers serve on the inherited socket")
+        else:
+            print("[SKIP] Needs fork() for workers")
+
+        print("\n[TEST] Released Ports")
+        print("-" * 40)
+
+        def port_free(port):
+            with socket.socket() as probe:
+                try:
+                    probe.bind(("127.0.0.1", port))
+                    return True
+                except OSError:
+                    return False
+
+        launcher.workers = {}
+        broken = launcher.app_dir / "service-broken.py"
+        broken.write_text("raise SystemExit(2)\n")
+        port = free_port()
+        check(not launcher.start_service({"name": "broken", "script": broken, "port": port, "description": "broken"})
+              and "broken" not in launcher.sockets and port_free(port), "A failed start releases its port")
+
+        port = free_port()
+        once = {"name": "once", "script": script, "port": port, "description": "once", "restart": "never"}
+        launcher.start_service(once)
+        launcher.processes["once"]["process"].kill()
+        check(wait_for(lambda: launcher.processes["once"]["state"] == "stopped", 10)
+              and "once" not in launcher.sockets and port_free(port), "A service that is not restarted releases its port")
+        check(launcher.start_service(once) and launcher.sockets["once"].fileno() != -1 and get(port).isdigit(),
+              "Starting it again binds a new socket")
+
+        module.CRASH_LOOP_MAX_EXITS = 2
+        module.CRASH_LOOP_COOLDOWN = 1.0
+        flaky = launcher.app_dir / "service-flaky.py"
+        flaky.write_text(FLAKY)
+        port = free_port()
+        check(launcher.start_service({"name": "flaky", "script": flaky, "port": port, "description": "flaky",
+                                      "probe": {"ready_line": "up"}}), "Flaky service started")
+        check(wait_for(lambda: launcher.processes["flaky"]["state"] == "crash-loop", 15)
+              and "flaky" not in launcher.sockets and port_free(port), "A crash-loop hold releases the port")
+        check(wait_for(lambda: "flaky" in launcher.sockets and launcher.processes["flaky"]["restarts"] >= 2, 10),
+              "The port is bound again when the hold ends")
+
+        print("\n[TEST] Cleanup")
+        print("-" * 40)
+        launcher.cleanup_services()
+        check(not launcher.sockets and sock.fileno() == -1, "Sockets are closed on shutdown")
+    finally:
+        launcher.cleanup_services()
+        shutil.rmtree(launcher.app_dir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
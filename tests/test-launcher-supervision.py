@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Launcher Supervision Test
+Immediate restarts, exponential backoff, crash-loop breaker and the status API
+"""
+
+import sys
+import json
+import time
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+
+from checks import Checks
+from launcher_fixtures import load_launcher, free_port, wait_for
+
+STEADY = '''
+import time
+print("up", flush=True)
+time.sleep(3600)
+'''
+
+CRASHING = '''
+import time
+print("up", flush=True)
+time.sleep(0.2)
+raise SystemExit(1)
+'''
+
+# Ready the first time only: later starts stay up without printing the ready line
+READY_ONCE = '''
+import time
+from pathlib import Path
+marker = Path(__file__).with_suffix(".started")
+if not marker.exists():
+    marker.write_text("")
+    print("up", flush=True)
+time.sleep(3600)
+'''
+
+
+def main():
+    check = Checks("LAUNCHER SUPERVISION TEST")
+
+    module = load_launcher()
+    module.RESTART_INITIAL_DELAY = 0.05
+    module.CRASH_LOOP_MAX_EXITS = 4
+    module.CRASH_LOOP_COOLDOWN = 60.0
+
+    launcher = module.CCDKi124qLauncher()
+    launcher.app_dir = Path(tempfile.mkdtemp(prefix="ccdk-launcher-"))
+    module.LOG_DIR = launcher.app_dir / "logs"
+
+    def service(name, body):
+        script = launcher.app_dir / f"service-{name}.py"
+        script.write_text(body)
+        return {"name": name, "script": script, "port": free_port(), "description": name,
+                "probe": {"ready_line": "up"}, "ready_timeout": 10.0}
+
+    try:
+        print("\n[TEST] Immediate Restart")
+        print("-" * 40)
+        launcher.start_service(service("steady", STEADY))
+        info = launcher.processes["steady"]
+        first = info["process"]
+        killed = time.monotonic()
+        first.kill()
+        restarted = wait_for(lambda: info["process"] is not first and info["state"] == "running", 5)
+        elapsed = time.monotonic() - killed
+        check(restarted and elapsed < 1.5, f"Killed service running again after {elapsed:.2f}s")
+        check(info["restarts"] == 1 and info["last_exit_code"] == -9, "Restart counter and exit code recorded")
+
+        print("\n[TEST] Requested Restart")
+        print("-" * 40)
+        module.RESTART_INITIAL_DELAY = 5.0  # a crash restart would wait this long
+        launcher.start_service(dict(service("manual", STEADY), restart="never"))
+        module.RESTART_INITIAL_DELAY = 0.05
+        manual = launcher.processes["manual"]
+        first = manual["process"]
+        requested = time.monotonic()
+        check(launcher.restart_service("manual") == {"success": True, "mode": "restart"}, "Restart requested")
+        restarted = wait_for(lambda: manual["process"] is not first and manual["state"] == "running", 5)
+        elapsed = time.monotonic() - requested
+        check(restarted and elapsed < 1.5, f"Restarted at once despite restart: never ({elapsed:.2f}s)")
+        check(manual["exits"] == [] and manual["restarts"] == 1, "A requested restart is not counted as a crash")
+
+        print("\n[TEST] Not Ready After Restart")
+        print("-" * 40)
+        stalling = dict(service("stalling", READY_ONCE), ready_timeout=0.5)
+        launcher.start_service(stalling)
+        info = launcher.processes["stalling"]
+        first = info["process"]
+        first.kill()
+        check(wait_for(lambda: info["state"] == "failed", 5) and info["process"] is not first
+              and info["process"].poll() is None, "A restart that never gets ready is marked failed")
+
+        print("\n[TEST] Crash-loop Breaker")
+        print("-" * 40)
+        launcher.start_service(service("crashing", CRASHING))
+        crashing = launcher.processes["crashing"]
+        check(wait_for(lambda: crashing["state"] == "crash-loop", 15), "Repeated crashes open the circuit breaker")
+        restarts = crashing["restarts"]
+        check(restarts == module.CRASH_LOOP_MAX_EXITS - 1, f"{restarts} restarts before the breaker opened")
+        time.sleep(0.5)
+        check(crashing["restarts"] == restarts, "No restarts while the breaker is open")
+
+        print("\n[TEST] Status API")
+        print("-" * 40)
+        port = free_port()
+        check(launcher.start_status_server(port), f"Status API listening on port {port}")
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/status", timeout=5) as response:
+            status = json.load(response)["services"]
+        check(status["steady"]["state"] == "running" and status["steady"]["restarts"] == 1
+              and status["steady"]["uptime_seconds"] >= 0, f"steady: {status['steady']}")
+        check(status["crashing"]["state"] == "crash-loop" and status["crashing"]["pid"] is None,
+              f"crashing: {status['crashing']}")
+    finally:
+        launcher.cleanup_services()
+        shutil.rmtree(launcher.app_dir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Lazy Tool Test
+Manifest proxies defer the tool import until a tool is actually called
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import importlib.util
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Add integrations directory to path
+sys.path.insert(0, str(ROOT / "integrations"))
+
+from thinkchain_manifest import ToolManifest, LazyTool  # noqa: E402
+from thinkchain_schema import SchemaValidationError  # noqa: E402
+
+BASE_TOOL = '''
+class BaseTool:
+    pass
+'''
+
+# Appends to IMPORT_LOG every time the file is executed
+TOOL = '''
+import os
+from tools.base import BaseTool
+
+with open(os.environ["IMPORT_LOG"], "a") as log:
+    log.write(__name__ + "\\n")
+
+class {cls}(BaseTool):
+    """{doc}"""
+    name = "{name}"
+    input_schema = {{"type": "object", "required": ["text"], "properties": {{"text": {{"type": "string"}}}}}}
+
+    def execute(self, text):
+        return text.upper()
+'''
+
+
+def load_bridge():
+    spec = importlib.util.spec_from_file_location("thinkchain_bridge", ROOT / "integrations" / "thinkchain-bridge.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    check = Checks("THINKCHAIN LAZY TOOL TEST")
+
+    workdir = Path(tempfile.mkdtemp(prefix="thinkchain-lazy-"))
+    tools_dir = workdir / "tools"
+    tools_dir.mkdir()
+    (tools_dir / "__init__.py").write_text("")
+    (tools_dir / "base.py").write_text(BASE_TOOL)
+    (tools_dir / "upper.py").write_text(TOOL.format(cls="UpperTool", name="upper", doc="Upper-case text"))
+    (tools_dir / "shout.py").write_text(TOOL.format(cls="ShoutTool", name="shout", doc="Shout text"))
+    import_log = workdir / "imports.log"
+    os.environ.update(IMPORT_LOG=str(import_log), THINKCHAIN_DIR=str(workdir),
+                      THINKCHAIN_BRIDGE_CACHE=str(workdir / "cache"))
+    sys.path.insert(0, str(workdir))
+    manifest_path = workdir / "cache" / "manifest.json"
+
+    def imports():
+        lines = import_log.read_text().splitlines() if import_log.exists() else []
+        import_log.write_text("")
+        return sorted(lines)
+
+    try:
+        # Build the manifest in this process, then forget the imported modules
+        ToolManifest(tools_dir, manifest_path).refresh()
+        for name in ("tools.upper", "tools.shout"):
+            sys.modules.pop(name, None)
+        imports()
+
+        print("\n[TEST] Proxy Metadata")
+        print("-" * 40)
+        manifest = ToolManifest(tools_dir, manifest_path)
+        manifest.load()
+        proxy = LazyTool(manifest, manifest.tools()["upper"])
+        check(proxy.name == "upper" and proxy.description == "Upper-case text"
+              and proxy.input_schema["required"] == ["text"], "Name, description and schema come from the manifest")
+        check(not proxy.loaded and "tools.upper" not in sys.modules, "Building a proxy imports nothing")
+        try:
+            proxy.validate({})
+            check(False, "Arguments are validated without the import")
+        except SchemaValidationError:
+            check(not proxy.loaded and imports() == [], "Arguments are validated without the import")
+        check("lazy" in repr(proxy), f"repr shows the state: {proxy!r}")
+
+        print("\n[TEST] First Call")
+        print("-" * 40)
+        tool = proxy()
+        check(proxy.loaded and tool.execute(text="hi") == "HI", "Calling the proxy instantiates the real class")
+        check(imports() == ["tools.upper"], "The module is imported on first use")
+        proxy()
+        check(imports() == [], "Later calls reuse the imported class")
+
+        missing = LazyTool(manifest, dict(manifest.tools()["shout"], **{"class": "GoneTool"}))
+        try:
+            missing.load()
+            check(False, "A class missing from its module raises ImportError")
+        except ImportError as e:
+            check("GoneTool" in str(e), f"A class missing from its module raises ImportError: {e}")
+        sys.modules.pop("tools.shout", None)
+        imports()
+
+        print("\n[TEST] Bridge Cold Start")
+        print("-" * 40)
+        bridge_module = load_bridge()
+        bridge = bridge_module.ThinkChainBridge()
+        try:
+            bridge.initialize(scan=False)
+            listed = sorted(tool["name"] for tool in bridge.list_available_tools())
+            check(listed == ["shout", "upper"] and imports() == [], "Listing tools imports no tool module")
+            result = bridge.execute_local_tool("shout", text="hey")
+            check(result == {"success": True, "result": "HEY"}, f"execute -> {result}")
+            check(imports() == ["tools.shout"], "Executing one tool imports only its file")
+            bridge.registry.swap({"gone": missing})
+            events = list(bridge.stream_local_tool("gone", text="hey"))
+            check([e["event"] for e in events] == ["start", "end"] and events[-1]["success"] is False
+                  and "GoneTool" in events[-1]["error"], "A tool that fails to import ends its stream with an error")
+        finally:
+            bridge.shutdown()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
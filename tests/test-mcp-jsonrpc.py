@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+MCP JSON-RPC Client Test
+Correctness and throughput of the pipelined MCP stdio client against a fake server
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+from checks import Checks
+
+# Add integrations directory to path
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "integrations"))
+
+from mcp_jsonrpc import McpStdioClient, JsonRpcError
+
+FAKE_SERVER = str(Path(__file__).resolve().parent / "fake-mcp-server.py")
+CONCURRENCY_LEVELS = [1, 8, 32, 128]
+BENCH_REQUESTS = 2000
+
+
+def new_client(**kwargs):
+    return McpStdioClient(sys.executable, [FAKE_SERVER], **kwargs)
+
+
+async def check_correctness(check):
+    """Out-of-order responses, errors, timeouts, cancellation and server exit"""
+    print("\n[TEST] Pipelining and Error Handling")
+    print("-" * 40)
+    client = new_client()
+    await client.start()
+    info = await client.initialize()
+    check(info["serverInfo"]["name"] == "fake-mcp", "initialize handshake")
+
+    # A slow request must not hold up the fast ones sent after it
+    start = time.perf_counter()
+    slow = asyncio.ensure_future(client.request("echo", {"value": "slow", "delay": 0.5}))
+    fast = await asyncio.gather(*(client.request("echo", {"value": i}) for i in range(50)))
+    fast_elapsed = time.perf_counter() - start
+    check([r["value"] for r in fast] == list(range(50)), "responses matched to requests by id")
+    check(fast_elapsed < 0.5, f"fast requests not blocked by slow one ({fast_elapsed * 1000:.0f}ms)")
+    check((await slow)["value"] == "slow", "slow request completes")
+
+    try:
+        await client.request("no/such/method")
+        check(False, "error response raises JsonRpcError")
+    except JsonRpcError as e:
+        check(e.code == -32601, "error response raises JsonRpcError")
+
+    try:
+        await client.request("echo", {"value": 1, "delay": 5}, timeout=0.2)
+        check(False, "per-request timeout")
+    except asyncio.TimeoutError:
+        check(not client.pending, "per-request timeout")
+
+    task = asyncio.ensure_future(client.request("echo", {"value": 1, "delay": 5}))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    stats = await client.request("stats")
+    check(len(stats["cancelled"]) == 2, "timed-out and cancelled requests announced to server")
+
+    result = await client.request("junk", {"value": "after junk"}, timeout=5)
+    check(result["value"] == "after junk" and not any(t.done() for t in client.tasks),
+          "non-object messages are skipped without stopping the reader")
+
+    pending = asyncio.ensure_future(client.request("echo", {"value": 1, "delay": 5}))
+    await asyncio.sleep(0.1)
+    try:
+        await client.request("crash", timeout=5)
+    except (ConnectionError, asyncio.TimeoutError):
+        pass
+    try:
+        await pending
+        check(False, "in-flight requests fail when the server exits")
+    except ConnectionError:
+        check(True, "in-flight requests fail when the server exits")
+    await client.close()
+
+    # A reader that dies fails the requests waiting on it instead of leaving them to time out
+    client = new_client()
+    await client.start()
+    await client.request("ping")
+
+    async def broken_readline():
+        raise RuntimeError("reader broke")
+
+    client.process.stdout.readline = broken_readline
+    pending = asyncio.ensure_future(client.request("echo", {"value": 1, "delay": 0.2}, timeout=30))
+    await client.request("ping", timeout=5)  # its response is the last line the reader sees
+    start = time.perf_counter()
+    try:
+        await pending
+        check(False, "pending requests fail when the reader dies")
+    except ConnectionError as e:
+        check(time.perf_counter() - start < 5 and "reader failed" in str(e),
+              "pending requests fail when the reader dies")
+    await client.close()
+
+    # Backpressure: a tiny in-flight cap still completes every request
+    client = new_client(max_in_flight=4, queue_size=2)
+    await client.start()
+    results = await asyncio.gather(*(client.request("echo", {"value": i, "delay": 0.01}) for i in range(40)))
+    check([r["value"] for r in results] == list(range(40)), "bounded in-flight window")
+    await client.close()
+
+
+async def run_benchmark(concurrency):
+    """Requests/sec with ``concurrency`` requests kept in flight on one connection"""
+    client = new_client()
+    await client.start()
+    await client.initialize()
+    counter = iter(range(BENCH_REQUESTS))
+
+    async def worker():
+        for i in counter:
+            await client.request("echo", {"value": i})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return BENCH_REQUESTS / elapsed
+
+
+async def check_throughput(check):
+    print("\n[TEST] Throughput (requests/sec on one server connection)")
+    print("-" * 40)
+    rates = {}
+    for concurrency in CONCURRENCY_LEVELS:
+        rates[concurrency] = await run_benchmark(concurrency)
+        print(f"  concurrency {concurrency:>4}: {rates[concurrency]:>8.0f} req/s")
+    best = max(rates[c] for c in CONCURRENCY_LEVELS[1:])
+    check(best > rates[1], f"Pipelining speedup: {best / rates[1]:.1f}x over one request at a time")
+
+
+async def main():
+    check = Checks("MCP JSON-RPC CLIENT TEST")
+    await check_correctness(check)
+    await check_throughput(check)
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+MCP Supervisor Test
+Lazy activation, LRU eviction, idle stop, crash restart with backoff, against a stub stdio server
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Add integrations directory to path
+sys.path.insert(0, str(ROOT / "integrations"))
+
+import mcp_supervisor  # noqa: E402
+from mcp_supervisor import MCPSupervisor, SupervisorClient  # noqa: E402
+
+FAKE_SERVER = str(Path(__file__).resolve().parent / "fake-mcp-server.py")
+
+
+def stub(**extra):
+    return dict({"command": sys.executable, "args": [FAKE_SERVER], "enabled": True}, **extra)
+
+
+def wait_for(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def start_supervisor(config_path, socket_path):
+    """Run a supervisor on its own event loop thread; returns (thread, client)"""
+    supervisor = MCPSupervisor(config_path, socket_path)
+    thread = threading.Thread(target=asyncio.run, args=(supervisor.serve(),), daemon=True)
+    thread.start()
+    client = SupervisorClient(socket_path)
+    wait_for(client.probe, 10)
+    return thread, client
+
+
+def main():
+    check = Checks("MCP SUPERVISOR TEST")
+
+    if not hasattr(os, "fork"):
+        print("[SKIP] Unix sockets are not available on this platform")
+        return True
+
+    mcp_supervisor.REAP_INTERVAL = 0.1
+    mcp_supervisor.INITIAL_BACKOFF = 0.2
+    workdir = Path(tempfile.mkdtemp(prefix="mcp-supervisor-"))
+    config_path = workdir / "mcp_config.json"
+    config_path.write_text(json.dumps({"maxRunningServers": 2, "mcpServers": {
+        "eager": stub(activation="eager"),
+        "a": stub(idle_ttl=0),
+        "b": stub(idle_ttl=0),
+        "stubborn": stub(idle_ttl=0, env={"FAKE_MCP_IGNORE_TERM": "1"}),
+        "idler": stub(idle_ttl=0.5),
+        "disabled": stub(enabled=False),
+    }}))
+    socket_path = workdir / "supervisor.sock"
+    thread, client = start_supervisor(config_path, socket_path)
+
+    def servers():
+        return client.status()["servers"]
+
+    def echo(server, value="x", target=None):
+        response = (target or client).call(server, "echo", {"value": value}, timeout=15)
+        return response.get("result", {}).get("value")
+
+    try:
+        print("\n[TEST] Activation")
+        print("-" * 40)
+        status = servers()
+        check(sorted(status) == ["a", "b", "eager", "idler", "stubborn"], "Enabled servers are supervised")
+        check(wait_for(lambda: servers()["eager"]["ready"], 10), "Eager server started with the supervisor")
+        check(not status["a"]["active"], "Lazy server not started before its first request")
+        check(echo("a", "first") == "first" and servers()["a"]["activations"] == 1, "First request starts it")
+        check(echo("a", "again") == "again" and servers()["a"]["activations"] == 1, "Later requests reuse it")
+        response = client.call("a", "initialize", {"protocolVersion": "2024-11-05"})
+        check(response["result"]["serverInfo"]["name"] == "fake-mcp", "initialize answered from the cached handshake")
+
+        print("\n[TEST] LRU Eviction")
+        print("-" * 40)
+        echo("b")
+        echo("a")
+        echo("stubborn")
+        status = servers()
+        check(not status["b"]["active"] and status["b"]["deactivations"]["evicted"] == 1,
+              "Least recently used idle server evicted at the cap")
+        check(status["a"]["active"] and status["stubborn"]["active"], "More recent servers kept")
+
+        echo("a")
+        evicting = threading.Thread(target=echo, args=("b", "x", SupervisorClient(socket_path)))
+        evicting.start()  # evicts 'stubborn', which ignores SIGTERM and takes ~5s to stop
+        time.sleep(0.3)
+        started = time.monotonic()
+        answered = echo("a", "during eviction")
+        elapsed = time.monotonic() - started
+        check(answered == "during eviction" and elapsed < 1.0,
+              f"Running servers answer while an evicted one is stopping ({elapsed * 1000:.0f}ms)")
+        evicting.join(15)
+        check(servers()["stubborn"]["deactivations"]["evicted"] == 1 and servers()["b"]["active"],
+              "Eviction completed and the new server started")
+
+        print("\n[TEST] Idle Stop")
+        print("-" * 40)
+        echo("idler")
+        check(wait_for(lambda: servers()["idler"]["deactivations"]["idle"] == 1, 5)
+              and not servers()["idler"]["active"], "Server stopped after its idle_ttl")
+        check(echo("idler", "back") == "back" and servers()["idler"]["activations"] == 2,
+              "The next request starts it again")
+
+        print("\n[TEST] Crash Restart")
+        print("-" * 40)
+        pid = servers()["eager"]["pid"]
+        response = client.call("eager", "crash", timeout=5)
+        check("error" in response, "A request whose server dies gets an error response")
+        check(wait_for(lambda: servers()["eager"]["ready"] and servers()["eager"]["pid"] != pid, 10),
+              "Crashed server restarted")
+        status = servers()["eager"]
+        check(status["restarts"] == 1 and status["next_backoff"] == 0.4 and status["last_exit"] == "exit code 3",
+              f"Restart counted and backoff doubled ({status['next_backoff']}s)")
+        check(echo("eager", "alive") == "alive", "Restarted server serves requests")
+
+        print("\n[TEST] Socket Ownership")
+        print("-" * 40)
+        try:
+            asyncio.run(MCPSupervisor(config_path, socket_path).serve())
+            check(False, "A second supervisor on a live socket is refused")
+        except OSError as e:
+            check("already listening" in str(e), f"A second supervisor on a live socket is refused: {e}")
+        check(echo("a", "still") == "still", "The first supervisor keeps its socket")
+        try:
+            asyncio.run(MCPSupervisor(config_path, workdir / "other.sock", max_running=-1).serve())
+            check(False, "A negative maxRunningServers is rejected")
+        except ValueError:
+            check(True, "A negative maxRunningServers is rejected")
+
+        print("\n[TEST] No Cap")
+        print("-" * 40)
+        uncapped_config = workdir / "uncapped.json"
+        uncapped_config.write_text(json.dumps({"maxRunningServers": 0, "mcpServers": {
+            name: stub(idle_ttl=0) for name in ("x", "y", "z")}}))
+        uncapped_thread, uncapped = start_supervisor(uncapped_config, workdir / "uncapped.sock")
+        answers = [echo(name, name, uncapped) for name in ("x", "y", "z")]
+        running = uncapped.status()["running"]
+        check(answers == ["x", "y", "z"] and running == 3, f"maxRunningServers 0 runs every server ({running})")
+        uncapped.shutdown()
+        uncapped.close()
+        uncapped_thread.join(15)
+    finally:
+        try:
+            client.shutdown()
+        except (OSError, ValueError):
+            pass
+        client.close()
+        thread.join(15)
+        shutil.rmtree(workdir, ignore_errors=True)
+    check(not thread.is_alive() and not socket_path.exists(), "Supervisor shut down and removed its socket")
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Pre-forked Dashboard Test
+Multi-worker dashboards under the launcher: shared socket, worker replacement, rolling restarts
+"""
+
+import os
+import sys
+import time
+import shutil
+import signal
+import tempfile
+import threading
+import urllib.request
+from pathlib import Path
+
+from checks import Checks
+from launcher_fixtures import load_launcher, free_port
+
+APP = '''
+import os, time
+from pathlib import Path
+VERSION = (Path(__file__).parent / "version.txt").read_text().strip()
+
+def app(environ, start_response):
+    if environ["PATH_INFO"] == "/slow":
+        time.sleep(1.5)
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [f"{VERSION} {os.getpid()}".encode()]
+
+if __name__ == "__main__":
+    raise SystemExit("the pre-forking server must not run the script's main block")
+'''
+
+
+def children(pid):
+    tasks = Path(f"/proc/{pid}/task")
+    found = set()
+    for task in tasks.iterdir() if tasks.exists() else []:
+        found.update(int(p) for p in (task / "children").read_text().split())
+    return found
+
+
+def main():
+    check = Checks("PRE-FORKED DASHBOARD TEST")
+
+    if not hasattr(os, "fork") or not Path("/proc/self/task").exists():
+        print("[SKIP] Needs fork() and /proc to inspect workers")
+        return True
+
+    module = load_launcher()
+    launcher = module.CCDKi124qLauncher()
+    launcher.app_dir = Path(tempfile.mkdtemp(prefix="ccdk-prefork-"))
+    module.LOG_DIR = launcher.app_dir / "logs"
+    (launcher.app_dir / "version.txt").write_text("v1")
+    script = launcher.app_dir / "service-app.py"
+    script.write_text(APP)
+    port = free_port()
+    launcher.workers = {"*": 3}
+    service = {"name": "Dashboard", "script": script, "port": port, "description": "dashboard",
+               "ready_timeout": 15.0}
+
+    def get(path="/"):
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=10) as response:
+            return response.read().decode().split()
+
+    try:
+        print("\n[TEST] Workers")
+        print("-" * 40)
+        check(launcher.start_service(service), "Dashboard ready under the pre-forking server")
+        master = launcher.processes["Dashboard"]["process"]
+        workers = children(master.pid)
+        served = {get()[1] for _ in range(60)}
+        check(len(workers) == 3, f"Master {master.pid} runs 3 workers")
+        check(served <= {str(pid) for pid in workers} and len(served) > 1,
+              f"Requests spread over {len(served)} workers")
+
+        victim = min(workers)
+        os.kill(victim, signal.SIGKILL)
+        deadline = time.monotonic() + 5
+        replaced = children(master.pid)
+        while (len(replaced) != 3 or victim in replaced) and time.monotonic() < deadline:
+            time.sleep(0.05)
+            replaced = children(master.pid)
+        check(len(replaced) == 3 and victim not in replaced, "A killed worker is replaced")
+
+        print("\n[TEST] Rolling Restart")
+        print("-" * 40)
+        slow = []
+        thread = threading.Thread(target=lambda: slow.append(get("/slow")))
+        thread.start()
+        time.sleep(0.2)
+        (launcher.app_dir / "version.txt").write_text("v2")
+        result = launcher.restart_service("Dashboard")
+        check(result == {"success": True, "mode": "rolling"}, f"restart_service -> {result}")
+
+        errors = 0
+        versions = set()
+        stop = time.monotonic() + 3
+        while time.monotonic() < stop:
+            try:
+                versions.add(get()[0])
+            except OSError:
+                errors += 1
+        thread.join()
+        check(errors == 0, f"No failed requests during the rolling restart ({errors} errors)")
+        check(slow and slow[0][0] == "v1", "The in-flight request finished on its old worker")
+        check(get()[0] == "v2" and launcher.processes["Dashboard"]["process"] is master,
+              "New code served without restarting the master")
+
+        print("\n[TEST] Orphaned Workers")
+        print("-" * 40)
+        workers = children(master.pid)
+        launcher.running = False  # keep supervise() from restarting the master
+        master.kill()
+        master.wait()
+        time.sleep(1.0)
+        alive = [pid for pid in workers if Path(f"/proc/{pid}").exists()
+                 and "Z" not in Path(f"/proc/{pid}/stat").read_text().split()[2]]
+        check(not alive, "Workers exit when their master is killed")
+    finally:
+        launcher.cleanup_services()
+        shutil.rmtree(launcher.app_dir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
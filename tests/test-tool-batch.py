@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Batch Execution Test
+execute_many / execute-batch: call order, concurrency and per-call error isolation
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+import importlib.util
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+BRIDGE = ROOT / "integrations" / "thinkchain-bridge.py"
+
+BASE_TOOL = '''
+class BaseTool:
+    pass
+'''
+
+TOOLS = '''
+import time
+import asyncio
+from tools.base import BaseTool
+
+class SleepTool(BaseTool):
+    name = "sleep"
+    input_schema = {"type": "object", "required": ["seconds"], "properties": {"seconds": {"type": "number"}}}
+
+    def execute(self, seconds):
+        time.sleep(seconds)
+        return seconds
+
+class AsyncSleepTool(BaseTool):
+    name = "async_sleep"
+
+    async def execute(self, seconds):
+        await asyncio.sleep(seconds)
+        return seconds
+
+class FailTool(BaseTool):
+    name = "fail"
+
+    def execute(self):
+        raise RuntimeError("tool exploded")
+'''
+
+
+def load_bridge():
+    spec = importlib.util.spec_from_file_location("thinkchain_bridge", BRIDGE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    check = Checks("THINKCHAIN BATCH EXECUTION TEST")
+
+    workdir = Path(tempfile.mkdtemp(prefix="thinkchain-batch-"))
+    (workdir / "tools").mkdir()
+    (workdir / "tools" / "__init__.py").write_text("")
+    (workdir / "tools" / "base.py").write_text(BASE_TOOL)
+    (workdir / "tools" / "batchtools.py").write_text(TOOLS)
+    env = dict(os.environ, THINKCHAIN_DIR=str(workdir), THINKCHAIN_BRIDGE_CACHE=str(workdir / "cache"),
+               THINKCHAIN_BRIDGE_SOCKET=str(workdir / "bridge.sock"))
+    os.environ.update(env)
+
+    bridge = load_bridge().ThinkChainBridge()
+    try:
+        print("\n[TEST] Concurrency and Order")
+        print("-" * 40)
+        calls = [{"tool": "sleep", "args": {"seconds": 0.5}} for _ in range(4)]
+        calls += [{"tool": "async_sleep", "args": {"seconds": 0.5}} for _ in range(4)]
+        started = time.monotonic()
+        results = bridge.execute_many(calls, max_concurrency=8)
+        elapsed = time.monotonic() - started
+        check(all(r["success"] for r in results), "All calls succeeded")
+        check(elapsed < 1.5, f"Eight 0.5s calls overlapped ({elapsed:.2f}s)")
+        check([r["tool"] for r in results] == [c["tool"] for c in calls] and all("elapsed_ms" in r for r in results),
+              "Results come back in call order with their timing")
+
+        started = time.monotonic()
+        bridge.execute_many([{"tool": "sleep", "args": {"seconds": 0.3}} for _ in range(4)], max_concurrency=2)
+        elapsed = time.monotonic() - started
+        check(elapsed >= 0.55, f"max_concurrency bounds the calls in flight ({elapsed:.2f}s for 2 x 2 x 0.3s)")
+
+        print("\n[TEST] Error Isolation")
+        print("-" * 40)
+        results = bridge.execute_many([
+            {"tool": "sleep", "args": {"seconds": 0}},
+            {"tool": "fail", "args": {}},
+            {"tool": "missing", "args": {}},
+            {"tool": "sleep", "args": {}},
+            {"tool": "sleep", "args": {"seconds": 2}},
+            {"tool": "async_sleep", "args": {"seconds": 2}},
+            {"tool": "sleep", "args": {"seconds": 0.1}},
+        ], timeout=0.5)
+        check(results[0]["success"] and results[-1]["success"], "Calls around the failures succeed")
+        check(results[1]["error"] == "tool exploded", "A raising tool is reported as that call's error")
+        check("not found" in results[2]["error"], "An unknown tool is reported")
+        check(results[3].get("invalid_arguments") is True, "Invalid arguments are reported")
+        check(all("timed out" in r["error"] for r in results[4:6]), "Slow blocking and async calls time out")
+
+        print("\n[TEST] execute-batch CLI")
+        print("-" * 40)
+        batch = workdir / "calls.jsonl"
+        batch.write_text('{"tool": "sleep", "args": {"seconds": 0}}\n\n{"tool": "fail", "args": {}}\n')
+        cli = subprocess.run([sys.executable, str(BRIDGE), "execute-batch", "--no-daemon", "--file", str(batch)],
+                             env=env, capture_output=True, text=True, timeout=60)
+        lines = [json.loads(line) for line in cli.stdout.splitlines() if line.startswith("{")]
+        check(cli.returncode == 0 and [line["success"] for line in lines] == [True, False],
+              f"One JSON result line per call: {[line.get('success') for line in lines]}")
+    finally:
+        bridge.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
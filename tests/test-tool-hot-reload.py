@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Hot Reload Test
+Copy-on-write registry: each reload swaps only the changed tools and bumps the generation
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import importlib.util
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Add integrations directory to path
+sys.path.insert(0, str(ROOT / "integrations"))
+
+from thinkchain_registry import ToolRegistry  # noqa: E402
+
+BASE_TOOL = '''
+class BaseTool:
+    pass
+'''
+
+TOOL = '''
+from tools.base import BaseTool
+
+class {cls}(BaseTool):
+    """{doc}"""
+    name = "{name}"
+
+    def execute(self, text):
+        return {expression}
+'''
+
+
+class Entry:
+    generation = 0
+
+
+def load_bridge():
+    spec = importlib.util.spec_from_file_location("thinkchain_bridge", ROOT / "integrations" / "thinkchain-bridge.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    check = Checks("THINKCHAIN TOOL HOT RELOAD TEST")
+
+    print("\n[TEST] Registry Swaps")
+    print("-" * 40)
+    registry = ToolRegistry()
+    first, second = Entry(), Entry()
+    check(registry.swap({"a": first, "b": second}) == 1 and first.generation == 1, "A swap bumps the generation")
+    before = registry.entries
+    replacement = Entry()
+    check(registry.swap({"a": replacement}) == 2 and replacement.generation == 2 and second.generation == 1,
+          "Only replaced entries take the new generation")
+    check(before["a"] is first and registry.entries["a"] is replacement and registry.entries["b"] is second,
+          "Earlier snapshots keep the entries they had")
+    check(registry.swap({}) == 2, "An empty change set publishes nothing")
+    check(registry.swap({"b": None}) == 3 and "b" not in registry.entries and "b" in before,
+          "Removing a tool is a swap of its own")
+    try:
+        before["c"] = Entry()
+        check(False, "Snapshots are read-only")
+    except TypeError:
+        check(True, "Snapshots are read-only")
+
+    print("\n[TEST] Bridge Reloads")
+    print("-" * 40)
+    workdir = Path(tempfile.mkdtemp(prefix="thinkchain-reload-"))
+    tools_dir = workdir / "tools"
+    tools_dir.mkdir()
+    (tools_dir / "__init__.py").write_text("")
+    (tools_dir / "base.py").write_text(BASE_TOOL)
+    upper_file = tools_dir / "upper.py"
+    upper_file.write_text(TOOL.format(cls="UpperTool", name="upper", doc="Upper-case text", expression="text.upper()"))
+    (tools_dir / "shout.py").write_text(TOOL.format(cls="ShoutTool", name="shout", doc="Shout text",
+                                                    expression="text + '!'"))
+    os.environ.update(THINKCHAIN_DIR=str(workdir), THINKCHAIN_BRIDGE_CACHE=str(workdir / "cache"))
+    sys.path.insert(0, str(workdir))
+
+    bridge = load_bridge().ThinkChainBridge()
+    try:
+        bridge.initialize()
+        start = bridge.registry.generation
+        generations = {t["name"]: t["generation"] for t in bridge.list_available_tools()}
+        check(start >= 1 and generations == {"shout": start, "upper": start},
+              f"Discovery publishes generation {start}")
+        old_snapshot = bridge.tools_cache
+        old_upper_class = old_snapshot["upper"].load()
+        shout_proxy = old_snapshot["shout"]
+
+        upper_file.write_text(TOOL.format(cls="UpperTool", name="upper", doc="Lower-case text now",
+                                          expression="text.lower()"))
+        result = bridge.reload_tool_file(upper_file)
+        check(result == {"changed": ["upper"], "generation": start + 1}, f"Changed file reloaded: {result}")
+        check(bridge.tools_cache["upper"].generation == start + 1 and bridge.tools_cache["shout"] is shout_proxy
+              and shout_proxy.generation == start, "Unchanged tools keep their proxy and generation")
+        check(bridge.execute_local_tool("upper", text="MiXeD") == {"success": True, "result": "mixed"},
+              "New calls run the new version")
+        check(old_upper_class().execute(text="MiXeD") == "MIXED" and old_snapshot["upper"].description == "Upper-case text",
+              "Calls holding the old snapshot keep the old version")
+
+        result = bridge.reload_tool_file(upper_file)
+        check(result == {"changed": [], "generation": start + 1}, "Reloading an unchanged file bumps nothing")
+
+        (tools_dir / "echo.py").write_text(TOOL.format(cls="EchoTool", name="echo", doc="Echo", expression="text"))
+        result = bridge.reload_tool_file(tools_dir / "echo.py")
+        check(result == {"changed": ["echo"], "generation": start + 2}, "A new file adds its tool")
+
+        (tools_dir / "shout.py").unlink()
+        result = bridge.reload_tool_file(tools_dir / "shout.py")
+        check(result == {"changed": ["shout"], "generation": start + 3} and "shout" not in bridge.tools_cache,
+              "A deleted file removes its tool")
+        check(bridge.execute_local_tool("shout", text="x").get("success") is False,
+              "Calls to a removed tool fail")
+    finally:
+        bridge.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Manifest Test
+Discovery cache: unchanged files are not imported, changed and deleted ones are picked up
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Add integrations directory to path
+sys.path.insert(0, str(ROOT / "integrations"))
+
+from thinkchain_manifest import ToolManifest, MANIFEST_VERSION  # noqa: E402
+
+BASE_TOOL = '''
+class BaseTool:
+    pass
+'''
+
+# Appends to IMPORT_LOG every time the file is executed
+TOOL = '''
+import os
+from tools.base import BaseTool
+
+with open(os.environ["IMPORT_LOG"], "a") as log:
+    log.write(__name__ + "\\n")
+
+class {cls}(BaseTool):
+    """{doc}"""
+    name = "{name}"
+    input_schema = {{"type": "object", "properties": {{"text": {{"type": "string"}}}}}}
+
+    def execute(self, text=""):
+        return text
+'''
+
+
+def main():
+    check = Checks("THINKCHAIN TOOL MANIFEST TEST")
+
+    workdir = Path(tempfile.mkdtemp(prefix="thinkchain-manifest-"))
+    tools_dir = workdir / "tools"
+    tools_dir.mkdir()
+    (tools_dir / "__init__.py").write_text("")
+    (tools_dir / "base.py").write_text(BASE_TOOL)
+    (tools_dir / "echotool.py").write_text(TOOL.format(cls="EchoTool", name="echo", doc="Echo text"))
+    (tools_dir / "upper.py").write_text(TOOL.format(cls="UpperTool", name="upper", doc="Upper-case text"))
+    import_log = workdir / "imports.log"
+    os.environ["IMPORT_LOG"] = str(import_log)
+    sys.path.insert(0, str(workdir))
+    manifest_path = workdir / "cache" / "manifest.json"
+
+    def imports():
+        lines = import_log.read_text().splitlines() if import_log.exists() else []
+        import_log.write_text("")
+        return sorted(lines)
+
+    try:
+        print("\n[TEST] First Scan")
+        print("-" * 40)
+        manifest = ToolManifest(tools_dir, manifest_path)
+        check(not manifest.load(), "No manifest on disk yet")
+        loaded = manifest.refresh()
+        check(sorted(loaded) == ["echo", "upper"], f"Both tools imported: {sorted(loaded)}")
+        check(imports() == ["tools.echotool", "tools.upper"], "Each file executed once")
+        tools = manifest.tools()
+        check(tools["echo"]["description"] == "Echo text" and tools["echo"]["class"] == "EchoTool",
+              "Name, class and description recorded")
+        check(tools["echo"]["validator"] is not None, "Input schema compiled into the manifest")
+        check(manifest_path.exists(), "Manifest saved")
+
+        print("\n[TEST] Warm Start")
+        print("-" * 40)
+        warm = ToolManifest(tools_dir, manifest_path)
+        check(warm.load(), "Manifest loads from disk")
+        check(warm.refresh() == {} and imports() == [], "Unchanged files are not imported")
+        check(sorted(warm.tools()) == ["echo", "upper"], "Tools served from the manifest")
+
+        print("\n[TEST] Invalidation")
+        print("-" * 40)
+        echo_file = tools_dir / "echotool.py"
+        stat = echo_file.stat()
+        os.utime(echo_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+        check(warm.refresh() == {} and imports() == [], "A touched file with the same hash is not imported")
+        check(warm.files["echotool.py"]["mtime_ns"] == echo_file.stat().st_mtime_ns, "New mtime recorded")
+
+        (tools_dir / "upper.py").write_text(TOOL.format(cls="UpperTool", name="upper", doc="Shout text"))
+        loaded = warm.refresh()
+        check(list(loaded) == ["upper"] and imports() == ["tools.upper"], "Only the edited file is imported")
+        check(warm.tools()["upper"]["description"] == "Shout text", "Edited description recorded")
+
+        (tools_dir / "upper.py").unlink()
+        warm.refresh()
+        check(sorted(warm.tools()) == ["echo"], "Deleted file's tools dropped")
+        check(sorted(json.loads(manifest_path.read_text())["files"]) == ["echotool.py"],
+              "Manifest on disk follows the directory")
+
+        print("\n[TEST] Stale Manifest")
+        print("-" * 40)
+        data = json.loads(manifest_path.read_text())
+        data["version"] = MANIFEST_VERSION - 1
+        manifest_path.write_text(json.dumps(data))
+        check(not ToolManifest(tools_dir, manifest_path).load(), "An older manifest version is ignored")
+        check(not ToolManifest(workdir / "elsewhere", manifest_path).load(),
+              "A manifest for another tools directory is ignored")
+
+        print("\n[TEST] Broken Tool File")
+        print("-" * 40)
+        (tools_dir / "broken.py").write_text("raise RuntimeError('boom')\n")
+        fresh = ToolManifest(tools_dir, manifest_path)
+        loaded = fresh.refresh()
+        check(sorted(loaded) == ["echo"] and fresh.files["broken.py"]["tools"] == [],
+              "A file that fails to import defines no tools and does not stop the scan")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
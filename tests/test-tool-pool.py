@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Instance Pool Test
+Reuse of per-caller instances and a shared thread-safe instance under concurrent leases
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+from checks import Checks
+
+# Add integrations directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "integrations"))
+
+from thinkchain_pool import ToolInstancePool  # noqa: E402
+
+
+class ReusableTool:
+    reusable = True
+    pool_size = 2
+
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+
+    def reset(self):
+        return self.healthy
+
+    def close(self):
+        self.closed = True
+
+
+class SharedTool:
+    thread_safe = True
+    created = 0
+
+    def __init__(self):
+        SharedTool.created += 1
+        self.closed = False
+        self.used_after_close = False
+
+    def execute(self, fail=False, seconds=0.0):
+        time.sleep(seconds)
+        if self.closed:
+            self.used_after_close = True
+        if fail:
+            raise ValueError("bad input")
+        return "ok"
+
+    def close(self):
+        self.closed = True
+
+
+def main():
+    check = Checks("THINKCHAIN TOOL POOL TEST")
+
+    print("\n[TEST] Per-caller Instances")
+    print("-" * 40)
+    pool = ToolInstancePool()
+    first = pool.acquire("reusable", ReusableTool)
+    pool.release("reusable", first)
+    check(pool.acquire("reusable", ReusableTool) is first, "A released instance is reused")
+    first.healthy = False
+    pool.release("reusable", first)
+    check(first.closed and pool.acquire("reusable", ReusableTool) is not first,
+          "An instance failing reset() is closed and replaced")
+    try:
+        with pool.lease("reusable", ReusableTool) as instance:
+            raise RuntimeError("tool failed")
+    except RuntimeError:
+        pass
+    check(instance.closed, "An exception discards a per-caller instance")
+    stats = pool.get_stats()["tools"]["reusable"]
+    check(stats["hits"] == 1 and stats["discarded"] == 2, f"Counters: {stats}")
+
+    print("\n[TEST] Concurrent Leases of a Shared Instance")
+    print("-" * 40)
+    pool = ToolInstancePool()
+    results = []
+
+    def call(fail):
+        try:
+            with pool.lease("shared", SharedTool) as tool:
+                results.append((tool, tool.execute(fail=fail, seconds=0.2)))
+        except ValueError:
+            results.append((tool, "error"))
+
+    threads = [threading.Thread(target=call, args=(n % 4 == 0,)) for n in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    instances = {id(tool) for tool, _ in results}
+    shared = results[0][0]
+    check(len(instances) == 1, f"All 16 callers shared one instance ({SharedTool.created} created)")
+    check(sorted(outcome for _, outcome in results).count("error") == 4, "Failing calls raised to their callers")
+    check(not shared.closed and not shared.used_after_close, "A failing caller did not close the shared instance")
+    check(pool.acquire("shared", SharedTool) is shared, "The shared instance stays in the pool")
+    pool.release("shared", shared)
+
+    print("\n[TEST] Retiring a Shared Instance in Use")
+    print("-" * 40)
+    holder = pool.acquire("shared", SharedTool)
+    other = pool.acquire("shared", SharedTool)
+    pool.release("shared", other, healthy=False)
+    check(not holder.closed, "Retired instance stays open while another caller holds it")
+    replacement = pool.acquire("shared", SharedTool)
+    check(replacement is not holder, "New callers get a fresh instance")
+    pool.release("shared", holder)
+    check(holder.closed, "Retired instance closed by its last caller")
+    pool.release("shared", replacement)
+    check(not replacement.closed, "The replacement stays shared after release")
+
+    print("\n[TEST] Reload While Leased")
+    print("-" * 40)
+    reloaded = type("SharedTool", (SharedTool,), {})
+    old = pool.acquire("shared", SharedTool)
+    new = pool.acquire("shared", reloaded)
+    check(isinstance(new, reloaded) and not old.closed, "Old shared instance kept open across a class reload")
+    pool.release("shared", old)
+    check(old.closed, "Old shared instance closed when released")
+    pool.clear()
+    check(not new.closed, "clear() leaves a leased shared instance to its caller")
+    pool.release("shared", new)
+    check(new.closed, "...which closes it on release")
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Result Cache Test
+Memoized tool results: exact round trips, TTLs, size budget and dashboard stats
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import shutil
+import tempfile
+import importlib.util
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Point the bridge's cache location at a scratch directory before importing
+WORKDIR = Path(tempfile.mkdtemp(prefix="thinkchain-cache-"))
+os.environ["THINKCHAIN_BRIDGE_CACHE"] = str(WORKDIR / "cache")
+
+# Add integrations directory to path
+sys.path.insert(0, str(ROOT / "integrations"))
+
+from thinkchain_cache import (ToolResultCache, make_cache_key, read_cache_stats,  # noqa: E402
+                              RESULT_CACHE_DB, MISS)
+
+
+def load_dashboard():
+    spec = importlib.util.spec_from_file_location("analytics_dashboard", ROOT / "dashboard" / "app-enhanced.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    check = Checks("THINKCHAIN RESULT CACHE TEST")
+
+    cache = ToolResultCache(RESULT_CACHE_DB)
+    try:
+        print("\n[TEST] Keys")
+        print("-" * 40)
+        check(make_cache_key("t", "h", {"a": 1, "b": 2}) == make_cache_key("t", "h", {"b": 2, "a": 1}),
+              "Argument order does not change the key")
+        check(make_cache_key("t", "h", {"a": 1}) != make_cache_key("t", "h2", {"a": 1}),
+              "Editing the tool file changes the key")
+        check(make_cache_key("t", "h", {"a": object()}) is None, "Arguments JSON cannot encode are not cacheable")
+
+        print("\n[TEST] Exact Round Trips")
+        print("-" * 40)
+        cache.put("list", "t", {"items": [1, 2.5, "x", None]})
+        check(cache.get("list") == {"items": [1, 2.5, "x", None]}, "JSON-native results come back equal")
+        cache.put("tuple", "t", (1, 2))
+        cache.put("int-keys", "t", {1: "one"})
+        check(cache.get("tuple") is MISS and cache.get("int-keys") is MISS,
+              "Results JSON would change (tuples, int keys) are not cached")
+
+        print("\n[TEST] TTL")
+        print("-" * 40)
+        cache.put("no-ttl", "t", 1, ttl=0)
+        check(cache.get("no-ttl") is MISS, "ttl=0 is not turned into the default")
+        cache.put("short", "t", 1, ttl=0.2)
+        check(cache.get("short") == 1, "Entry served within its TTL")
+        time.sleep(0.3)
+        check(cache.get("short") is MISS, "Entry expires after its TTL")
+
+        print("\n[TEST] Shared Disk Tier")
+        print("-" * 40)
+        other = ToolResultCache(RESULT_CACHE_DB)
+        check(other.get("list") == {"items": [1, 2.5, "x", None]}, "Another bridge process hits the SQLite tier")
+        check(other.get_stats()["disk_hits"] == 1, "Counted as a disk hit")
+        other.close()
+
+        print("\n[TEST] Size Budget")
+        print("-" * 40)
+        small = ToolResultCache(WORKDIR / "small.sqlite", disk_max_bytes=1000)
+        for n in range(20):
+            small.put(f"k{n}", "t", "x" * 98)  # 100 bytes once JSON-encoded
+        conn = sqlite3.connect(str(WORKDIR / "small.sqlite"))
+        total = conn.execute("SELECT SUM(size) FROM results").fetchone()[0]
+        conn.close()
+        check(total <= 1000 and small.disk_bytes == total, f"Disk tier kept under budget ({total} bytes, tracked {small.disk_bytes})")
+        small.put("k19", "t", "y" * 98)
+        check(small.disk_bytes == total, "Replacing an entry does not grow the running total")
+        check(small.get_stats()["evictions"] >= 10, "Least recently used rows evicted")
+        small.close()
+
+        print("\n[TEST] Dashboard Stats")
+        print("-" * 40)
+        cache.flush_stats()
+        stats = read_cache_stats()
+        check(stats["stores"] == 2 and stats["entries"] >= 1, f"read_cache_stats reads the bridge's file: {stats}")
+        try:
+            dashboard = load_dashboard()
+        except ImportError:
+            print("[SKIP] Flask is not installed")
+        else:
+            card = dashboard.EnhancedAnalytics().get_tool_cache_analytics()
+            check(card.get("status") == "active" and card["stores"] == stats["stores"],
+                  "Analytics dashboard shows the same cache")
+    finally:
+        cache.close()
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Tool Schema Validation Test
+Compiled input-schema validators: correctness and per-call cost
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add integrations directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "integrations"))
+
+from thinkchain_schema import compile_schema, load_validator, SchemaValidationError
+from thinkchain_manifest import describe_tool_class
+
+SCHEMA = {
+    "type": "object",
+    "required": ["query"],
+    "additionalProperties": False,
+    "properties": {
+        "query": {"type": "string", "minLength": 1},
+        "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+        "tags": {"type": "array", "items": {"type": "string", "enum": ["a", "b"]}},
+        "mode": {"anyOf": [{"const": "fast"}, {"type": "null"}]},
+    },
+}
+
+CASES = [
+    ({"query": "x"}, None),
+    ({"query": "x", "limit": 5, "tags": ["a"], "mode": None}, None),
+    ({}, "args.query: is a required argument"),
+    ({"query": ""}, "args.query: must be at least 1 characters"),
+    ({"query": "x", "limit": True}, "args.limit: must be integer"),
+    ({"query": "x", "limit": 500}, "args.limit: must be <= 100"),
+    ({"query": "x", "tags": ["a", "c"]}, "args.tags[1]: must be one of ['a', 'b']"),
+    ({"query": "x", "mode": "slow"}, "args.mode: must match at least one schema"),
+    ({"query": "x", "extra": 1}, "args.extra: is not an accepted argument"),
+]
+
+# Draft-4 exclusive bounds are booleans that modify minimum/maximum
+DRAFT4_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ratio": {"type": "number", "minimum": 0, "exclusiveMinimum": True, "maximum": 1, "exclusiveMaximum": False},
+        "count": {"type": "integer", "exclusiveMaximum": 10},
+    },
+}
+
+DRAFT4_CASES = [
+    ({"ratio": 0.5, "count": 9}, None),
+    ({"ratio": 1}, None),
+    ({"ratio": 0}, "args.ratio: must be > 0"),
+    ({"ratio": 1.5}, "args.ratio: must be <= 1"),
+    ({"count": 10}, "args.count: must be < 10"),
+]
+
+# Schemas that must be refused when the manifest is built, not when a call arrives
+BAD_SCHEMAS = [
+    ("multipleOf 0", {"type": "number", "multipleOf": 0}, ValueError),
+    ("negative multipleOf", {"type": "number", "multipleOf": -2}, ValueError),
+    ("bad pattern", {"type": "string", "pattern": "(unclosed"}, re.error),
+    ("empty anyOf", {"anyOf": []}, ValueError),
+    ("empty oneOf", {"type": "object", "properties": {"mode": {"oneOf": []}}}, ValueError),
+]
+
+# A rejected call must cost no more than this at the boundary
+MAX_REJECT_US = 50
+
+
+def main():
+    print("=" * 60)
+    print("TOOL SCHEMA VALIDATION TEST")
+    print("=" * 60)
+    passed = failed = 0
+
+    validate = load_validator(compile_schema(SCHEMA))
+
+    print("\n[TEST] Validation Results")
+    print("-" * 40)
+    for args, expected in CASES:
+        try:
+            validate(args)
+            error = None
+        except SchemaValidationError as e:
+            error = str(e)
+        if error == expected:
+            print(f"[OK] {args} -> {error or 'valid'}")
+            passed += 1
+        else:
+            print(f"[FAIL] {args} -> {error!r}, expected {expected!r}")
+            failed += 1
+
+    print("\n[TEST] Draft-4 Exclusive Bounds")
+    print("-" * 40)
+    validate_draft4 = load_validator(compile_schema(DRAFT4_SCHEMA))
+    for args, expected in DRAFT4_CASES:
+        try:
+            validate_draft4(args)
+            error = None
+        except SchemaValidationError as e:
+            error = str(e)
+        if error == expected:
+            print(f"[OK] {args} -> {error or 'valid'}")
+            passed += 1
+        else:
+            print(f"[FAIL] {args} -> {error!r}, expected {expected!r}")
+            failed += 1
+
+    print("\n[TEST] Invalid Schemas")
+    print("-" * 40)
+    for label, schema, error_type in BAD_SCHEMAS:
+        try:
+            compile_schema(schema)
+            error = None
+        except Exception as e:
+            error = e
+        if isinstance(error, error_type):
+            print(f"[OK] {label} refused at compile time: {error}")
+            passed += 1
+        else:
+            print(f"[FAIL] {label} -> {error!r}, expected {error_type.__name__}")
+            failed += 1
+
+    class PatternTool:
+        input_schema = {"type": "object", "properties": {"name": {"type": "string", "pattern": "[a-"}}}
+
+        def execute(self, name):
+            return name
+
+    info = describe_tool_class(PatternTool)
+    if info["validator"] is None:
+        print("[OK] Manifest leaves a tool with a bad pattern unvalidated")
+        passed += 1
+    else:
+        print("[FAIL] Manifest compiled a validator for a bad pattern")
+        failed += 1
+
+    print("\n[TEST] Rejection Cost")
+    print("-" * 40)
+    iterations = 100000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            validate({"query": "x", "limit": 500})
+        except SchemaValidationError:
+            pass
+    per_call_us = (time.perf_counter() - start) / iterations * 1e6
+    if per_call_us < MAX_REJECT_US:
+        print(f"[OK] Rejecting a bad call: {per_call_us:.2f}us < {MAX_REJECT_US}us")
+        passed += 1
+    else:
+        print(f"[FAIL] Rejecting a bad call: {per_call_us:.2f}us > {MAX_REJECT_US}us")
+        failed += 1
+
+    print("\n" + "-" * 60)
+    print(f"[OK] Passed: {passed}")
+    print(f"[FAIL] Failed: {failed}")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+ThinkChain Process Pool Test
+Warm worker processes: results, crashes, timeouts, CPU/memory budgets and recycling
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATIONS = ROOT / "integrations"
+
+# Add integrations directory to path
+sys.path.insert(0, str(INTEGRATIONS))
+
+from thinkchain_workers import ToolProcessPool, OOB_THRESHOLD  # noqa: E402
+
+TOOLS = '''
+import os
+import time
+
+class PidTool:
+    def execute(self):
+        return os.getpid()
+
+class BlobTool:
+    def execute(self, data):
+        return data[::-1]
+
+class CrashTool:
+    def execute(self):
+        os._exit(3)
+
+class SleepTool:
+    def execute(self, seconds):
+        time.sleep(seconds)
+        return seconds
+
+class SpinTool:
+    def execute(self):
+        while True:
+            pass
+
+class HogTool:
+    def execute(self, mb):
+        return len(bytearray(mb * 1024 * 1024))
+
+class UnpicklableTool:
+    def execute(self):
+        return lambda: None
+'''
+
+
+def main():
+    check = Checks("THINKCHAIN PROCESS POOL TEST")
+
+    workdir = Path(tempfile.mkdtemp(prefix="thinkchain-workers-"))
+    (workdir / "tools").mkdir()
+    (workdir / "tools" / "__init__.py").write_text("")
+    (workdir / "tools" / "worktools.py").write_text(TOOLS)
+    pool = ToolProcessPool(sys_paths=[str(workdir), str(INTEGRATIONS)], preload=["tools.worktools"],
+                           size=2, max_calls_per_worker=3)
+
+    def run(class_name, timeout=30, **kwargs):
+        budget = {key: kwargs.pop(key) for key in ("cpu_seconds", "memory_mb") if key in kwargs}
+        return pool.execute(class_name.lower(), "worktools.py", class_name, "v1", kwargs, timeout=timeout, **budget)
+
+    try:
+        print("\n[TEST] Warm Workers")
+        print("-" * 40)
+        pool.start()
+        check(pool.get_stats()["idle"] == 2, "Workers started up front")
+        pid = run("PidTool")["result"]
+        check(pid != os.getpid(), f"Tool ran in worker {pid}, not in the bridge")
+        blob = bytes(range(256)) * (OOB_THRESHOLD // 128)
+        check(run("BlobTool", data=blob)["result"] == blob[::-1], "Large bytes round-trip out of band")
+
+        print("\n[TEST] Failures Become Error Results")
+        print("-" * 40)
+        result = run("CrashTool")
+        check(not result["success"] and "crashed (exit code 3)" in result["error"], f"Crash: {result.get('error')}")
+        result = run("SleepTool", timeout=0.5, seconds=10)
+        check(not result["success"] and "timed out" in result["error"], f"Timeout: {result.get('error')}")
+        result = run("UnpicklableTool")
+        check(not result["success"] and "not picklable" in result["error"], f"Unpicklable result: {result.get('error')}")
+        if hasattr(os, "fork"):
+            result = run("SpinTool", cpu_seconds=1)
+            check(not result["success"] and "CPU budget" in result["error"], f"CPU budget: {result.get('error')}")
+            result = run("HogTool", memory_mb=256, mb=512)
+            check(not result["success"] and "memory budget" in result["error"], f"Memory budget: {result.get('error')}")
+            check(run("HogTool", mb=64)["result"] == 64 * 1024 * 1024, "Budgets do not outlive their call")
+        else:
+            print("[SKIP] rlimit budgets need a Unix platform")
+        stats = pool.get_stats()
+        check(stats["crashed"] >= 1 and stats["timeouts"] == 1, f"Crashes and timeouts counted: {stats}")
+        check(run("PidTool")["success"], "The pool keeps serving after failures")
+
+        print("\n[TEST] Recycling")
+        print("-" * 40)
+        pool.shutdown()
+        pool = ToolProcessPool(sys_paths=[str(workdir), str(INTEGRATIONS)], size=1, max_calls_per_worker=3)
+        pids = [run("PidTool")["result"] for _ in range(6)]
+        check(len(set(pids[:3])) == 1 and len(set(pids)) == 2, f"Worker replaced after 3 calls: {pids}")
+        check(pool.get_stats()["recycled"] == 2, "Recycled workers counted")
+    finally:
+        pool.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+WebUI Bulk Install Test
+POST /install/bulk with valid and invalid items, and concurrent bundles
+"""
+
+import io
+import sys
+import json
+import shutil
+import tarfile
+import tempfile
+import threading
+import urllib.request
+import importlib.util
+from pathlib import Path
+
+from checks import Checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_webui():
+    spec = importlib.util.spec_from_file_location("webui_app", ROOT / "webui" / "app.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def tar_bundle(files):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+
+def post_raw(url, data, content_type):
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": content_type})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def main():
+    check = Checks("WEBUI BULK INSTALL TEST")
+
+    try:
+        module = load_webui()
+    except ImportError:
+        print("[SKIP] Flask is not installed")
+        return True
+    tmp = Path(tempfile.mkdtemp(prefix="ccdk-webui-"))
+    module.BASE = tmp / ".claude"
+    module.INDEX = module.BASE / "index.json"
+    client = module.app.test_client()
+
+    def index():
+        return json.loads(module.INDEX.read_text())
+
+    try:
+        print("\n[TEST] Mixed Valid and Invalid Items")
+        print("-" * 40)
+        response = client.post("/install/bulk", json={
+            "agents": {"reviewer": "---\ndescription: Reviews code\n---\nbody", "broken": 5, "../escape": "x"},
+            "commands": {"deploy": "run it", "empty": None},
+        })
+        result = response.get_json()
+        check(response.status_code == 207, f"Partial success answers 207 (got {response.status_code})")
+        check(sorted(result["written"]) == ["agent/reviewer", "command/deploy"], f"Valid items written: {result['written']}")
+        check(sorted(error["name"] for error in result["errors"]) == ["../escape", "broken", "empty"],
+              f"Invalid items reported: {[error['name'] for error in result['errors']]}")
+        check((module.BASE / "agents" / "reviewer.md").exists() and not (module.BASE / "agents" / "broken.md").exists(),
+              "Only valid items reach the disk")
+        check(index()["agents"]["reviewer"]["description"] == "Reviews code", "Index records what was written")
+
+        response = client.post("/install/bulk", json=[{"kind": "agent", "name": "reviewer",
+                                                       "content": "---\ndescription: Reviews code\n---\nbody"}])
+        check(response.status_code == 200 and response.get_json()["unchanged"] == ["agent/reviewer"],
+              "Unchanged content is skipped")
+        check(client.post("/install/bulk", data=b"not a tar").status_code == 400, "A malformed bundle answers 400")
+
+        print("\n[TEST] Failure Mid-batch")
+        print("-" * 40)
+        write = module.atomic_write
+
+        def failing_write(target, data):
+            if target.name == "second.md":
+                raise RuntimeError("disk gone")
+            write(target, data)
+
+        module.atomic_write = failing_write
+        try:
+            module.install_items([("agent", "first", "one"), ("agent", "second", "two")])
+            check(False, "The failure propagates")
+        except RuntimeError:
+            check(True, "The failure propagates")
+        finally:
+            module.atomic_write = write
+        check("first" in index()["agents"], "Index still records the file written before the failure")
+
+        print("\n[TEST] Concurrent Bundles")
+        print("-" * 40)
+        responses = []
+
+        def install(n):
+            bundle = tar_bundle({f"commands/cmd-{n}-{i}.md": f"command {n} {i}" for i in range(5)})
+            responses.append(client.post("/install/bulk", data={"bundle": (bundle, "bundle.tar")}).status_code)
+
+        threads = [threading.Thread(target=install, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        commands = index()["commands"]
+        check(responses == [200] * 8, f"All bundles accepted: {responses}")
+        check(all(f"cmd-{n}-{i}" in commands for n in range(8) for i in range(5)),
+              f"No index entries lost ({len(commands) - 1} of 40 recorded)")
+
+        print("\n[TEST] Raw Bodies on a Live Server")
+        print("-" * 40)
+        from werkzeug.serving import make_server, WSGIRequestHandler
+
+        class QuietHandler(WSGIRequestHandler):
+            def log_request(self, *args):
+                pass
+
+        server = make_server("127.0.0.1", 0, module.app, threaded=True, request_handler=QuietHandler)
+        url = f"http://127.0.0.1:{server.server_port}/install/bulk"
+        serving = threading.Thread(target=server.serve_forever, daemon=True)
+        serving.start()
+        try:
+            for content_type in ("application/x-tar", "application/octet-stream"):
+                bundle = tar_bundle({"agents/raw.md": f"raw {content_type}"}).getvalue()
+                status, result = post_raw(url, bundle, content_type)
+                check(status == 200 and result["written"] == ["agent/raw"],
+                      f"A plain tar body sent as {content_type} installs ({status})")
+            gzipped = io.BytesIO()
+            with tarfile.open(fileobj=gzipped, mode="w:gz") as tar:
+                data = b"gzipped"
+                info = tarfile.TarInfo("commands/packed.md")
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+            status, result = post_raw(url, gzipped.getvalue(), "application/gzip")
+            check(status == 200 and result["written"] == ["command/packed"], f"A gzip tar body installs ({status})")
+            status, result = post_raw(url, b"not a tar", "application/x-tar")
+            check(status == 400 and "invalid bundle" in result["error"], "A malformed raw body answers 400")
+        finally:
+            server.shutdown()
+            server.server_close()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    return check.report()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -4,14 +4,20 @@ CCDK i124q - Unified Dashboard
 Combines CCDK, SuperClaude, ThinkChain, and Templates dashboards into one interface
 """
 
+import os
+import sys
+
+if __name__ == '__main__' and '--profile-startup' in sys.argv:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'integrations'))
+    from startup_profile import run_profiled
+    sys.exit(run_profiled(__file__))
+
 from flask import Flask, render_template_string, jsonify, request
 import sqlite3
 import pathlib
 import subprocess
 import json
-import os
 from datetime import datetime
-import requests
 
 app = Flask(__name__)
 
@@ -424,4 +430,6 @@ if __name__ == '__main__':
     print("🚀 Starting CCDK i124q Unified Dashboard...")
     print("📊 Dashboard will be available at: http://localhost:3000")
     print("🔗 Integrating: CCDK + SuperClaude + ThinkChain + Templates")
+    if os.environ.get('CCDK_PROFILE_STARTUP'):
+        print('startup-profile: ready', file=sys.stderr, flush=True)  # --profile-startup reports here
     app.run(host='0.0.0.0', port=3000, debug=True)
\ No newline at end of file
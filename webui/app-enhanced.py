@@ -4,16 +4,25 @@ CCDK i124q Enhanced WebUI
 Professional interface showing all integrated components with real-time updates
 """
 
-from flask import Flask, render_template_string, jsonify, request
+import os
+import sys
+
+if __name__ == '__main__' and '--profile-startup' in sys.argv:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'integrations'))
+    from startup_profile import run_profiled
+    sys.exit(run_profiled(__file__))
+
+from flask import Flask, render_template_string, jsonify, request, Response, stream_with_context
 import pathlib
 import json
 import sqlite3
 import subprocess
-import os
 from datetime import datetime
 
 app = Flask(__name__)
 
+BRIDGE_SCRIPT = pathlib.Path(__file__).resolve().parent.parent / 'integrations' / 'thinkchain-bridge.py'
+
 class CCDKiEnhancedUI:
     def __init__(self):
         self.app_dir = pathlib.Path('/app')
@@ -334,7 +343,7 @@ ENHANCED_TEMPLATE = """
         </div>
 
         <div class="controls">
-            <a href="http://localhost:4000" class="btn" target="_blank">🌐 Unified Dashboard</a>
+            <a href="http://localhost:3000" class="btn" target="_blank">🌐 Unified Dashboard</a>
             <a href="http://localhost:5005" class="btn success" target="_blank">📈 Analytics</a>
             <a href="http://localhost:3333" class="btn purple" target="_blank">📊 Templates</a>
             <button class="btn" onclick="refreshData()">🔄 Refresh</button>
@@ -469,8 +478,37 @@ def command_details(system, command_name):
     """Get detailed information about a command"""
     return jsonify(ui_manager.get_command_details(system, command_name))
 
+@app.route('/api/thinkchain/stream/<tool_name>', methods=['GET', 'POST'])
+def thinkchain_stream(tool_name):
+    """Run a ThinkChain tool and relay its output events as Server-Sent Events"""
+    try:
+        tool_args = request.get_json(silent=True) or json.loads(request.args.get('args', '{}'))
+    except ValueError:
+        return jsonify({'error': 'args must be JSON'}), 400
+
+    process = subprocess.Popen(
+        [sys.executable, str(BRIDGE_SCRIPT), 'stream', '--tool', tool_name,
+         '--args', json.dumps(tool_args), '--format', 'sse'],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+
+    def relay():
+        # Forward each event as soon as the bridge flushes it
+        try:
+            for line in process.stdout:
+                yield line
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+    return Response(stream_with_context(relay()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 if __name__ == '__main__':
     print("🚀 Starting CCDK i124q Enhanced WebUI...")
     print("🌐 Available at: http://localhost:7000")
     print("📊 Showing all integrated systems: CCDK + SuperClaude + ThinkChain")
+    if os.environ.get('CCDK_PROFILE_STARTUP'):
+        print('startup-profile: ready', file=sys.stderr, flush=True)  # --profile-startup reports here
     app.run(host='0.0.0.0', port=7000, debug=True)
\ No newline at end of file
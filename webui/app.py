@@ -1,13 +1,123 @@
 from flask import Flask, render_template_string, jsonify, request
-import pathlib, json, sqlite3, subprocess, os
+import pathlib, json, sqlite3, subprocess, os, hashlib, tarfile, tempfile, re, threading
 
 app = Flask(__name__)
 
 BASE = pathlib.Path('.claude')
+INDEX = BASE/'index.json'
+KINDS = {'agent': 'agents', 'command': 'commands'}
+NAME_RE = re.compile(r'^[A-Za-z0-9_.:-]+$')
+INDEX_LOCK = threading.Lock()  # serializes the read-modify-write of index.json
 
 def list_items(folder):
     return sorted([p.stem for p in (BASE/folder).glob('*.md')])
 
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def atomic_write(target, data):
+    """Write bytes to target via a temp file in the same dir + rename"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+    try:
+        os.chmod(tmp, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+def front_matter(text):
+    """Parse the simple `key: value` front matter of an agent/command file"""
+    meta = {}
+    if text.startswith('---'):
+        end = text.find('\n---', 3)
+        for line in text[3:end if end != -1 else 0].splitlines():
+            if ':' in line:
+                k, v = line.split(':', 1)
+                meta[k.strip()] = v.strip()
+    return meta
+
+def load_index():
+    try:
+        return json.loads(INDEX.read_text())
+    except (OSError, ValueError):
+        return {folder: {} for folder in KINDS.values()}
+
+def install_items(items):
+    """Apply (kind, name, content) items, skipping unchanged files by hash.
+
+    The metadata index is rewritten once at the end, not per item, and
+    always reflects the files written so far, even if an item fails.
+    """
+    result = {'written': [], 'unchanged': [], 'errors': []}
+    with INDEX_LOCK:
+        index = load_index()
+        dirty = False
+        try:
+            for kind, name, content in items:
+                folder = KINDS.get(kind)
+                if folder is None or not isinstance(name, str) or not NAME_RE.match(name):
+                    result['errors'].append({'kind': kind, 'name': name, 'error': 'invalid kind or name'})
+                    continue
+                if not isinstance(content, (str, bytes)):
+                    result['errors'].append({'kind': kind, 'name': name, 'error': 'content must be a string'})
+                    continue
+                data = content.encode('utf-8') if isinstance(content, str) else content
+                digest = sha256(data)
+                target = BASE/folder/f'{name}.md'
+                entries = index.setdefault(folder, {})
+                if target.exists() and sha256(target.read_bytes()) == digest:
+                    result['unchanged'].append(f'{kind}/{name}')
+                    if entries.get(name, {}).get('sha256') == digest:
+                        continue
+                else:
+                    try:
+                        atomic_write(target, data)
+                    except OSError as e:
+                        result['errors'].append({'kind': kind, 'name': name, 'error': str(e)})
+                        continue
+                    result['written'].append(f'{kind}/{name}')
+                meta = front_matter(data.decode('utf-8', errors='replace'))
+                entries[name] = {'sha256': digest, 'size': len(data), 'description': meta.get('description', '')}
+                dirty = True
+        finally:
+            if dirty:
+                atomic_write(INDEX, json.dumps(index, indent=2, sort_keys=True).encode('utf-8'))
+    return result
+
+def items_from_json(bundle):
+    """Accept {"agents": {name: content}, "commands": {...}} or [{"kind", "name", "content"}]"""
+    if isinstance(bundle, list):
+        return [(i.get('kind'), i.get('name'), i.get('content', '')) for i in bundle]
+    items = []
+    for kind, folder in KINDS.items():
+        for name, content in (bundle.get(folder) or {}).items():
+            items.append((kind, name, content))
+    return items
+
+def items_from_tar(fileobj):
+    """Read agents/<name>.md and commands/<name>.md members from a tar stream
+
+    Stream mode reads the members in order without seeking, so a request body
+    that cannot seek (a live werkzeug server's) works whatever its compression.
+    """
+    items = []
+    with tarfile.open(fileobj=fileobj, mode='r|*') as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            parts = pathlib.PurePosixPath(member.name).parts
+            if len(parts) < 2 or parts[-2] not in KINDS.values() or not parts[-1].endswith('.md'):
+                continue
+            kind = 'agent' if parts[-2] == 'agents' else 'command'
+            items.append((kind, parts[-1][:-3], tar.extractfile(member).read()))
+    return items
+
 @app.route('/')
 def index():
     agents = list_items('agents')
@@ -16,10 +126,25 @@ def index():
 
 @app.route('/install/<kind>/<name>', methods=['POST'])
 def install(kind,name):
-    target = BASE/('agents' if kind=='agent' else 'commands')/f'{name}.md'
-    target.write_text(request.form['content'])
+    result = install_items([(kind, name, request.form['content'])])
+    if result['errors']:
+        return jsonify(result), 400
     return 'OK'
 
+@app.route('/install/bulk', methods=['POST'])
+def install_bulk():
+    try:
+        if 'bundle' in request.files:
+            items = items_from_tar(request.files['bundle'].stream)
+        elif request.is_json:
+            items = items_from_json(request.get_json())
+        else:
+            items = items_from_tar(request.stream)
+    except (tarfile.TarError, ValueError, AttributeError) as e:
+        return jsonify({'error': f'invalid bundle: {e}'}), 400
+    result = install_items(items)
+    return jsonify(result), (207 if result['errors'] else 200)
+
 @app.route('/analytics')
 def analytics():
     log = pathlib.Path('.ccd_analytics.log')